@@ -6,19 +6,34 @@ Provides modular commands for project management.
 
 __version__ = "2.1.0"
 
-from .models import Initiative, Status, Task
-from .core import validate_initiative, get_all_initiatives, categorize_initiatives
-from .utils import Colors, create_progress_bar, extract_tasks
-
-__all__ = [
-    'Initiative',
-    'Status',
-    'Task',
-    'validate_initiative',
-    'get_all_initiatives',
-    'categorize_initiatives',
-    'Colors',
-    'create_progress_bar',
-    'extract_tasks',
-]
+import importlib
 
+# Public name -> submodule defining it (imported on first access to keep
+# CLI startup cheap)
+_EXPORTS = {
+    'Initiative': 'models',
+    'Status': 'models',
+    'Task': 'models',
+    'Project': 'project',
+    'validate_initiative': 'core',
+    'get_all_initiatives': 'core',
+    'categorize_initiatives': 'core',
+    'Colors': 'utils',
+    'create_progress_bar': 'utils',
+    'extract_tasks': 'utils',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
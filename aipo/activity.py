@@ -0,0 +1,431 @@
+"""Claude Swarm session log discovery and agent activity parsing."""
+
+import json
+import math
+import re
+from bisect import insort
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .utils import COMPRESSED_SUFFIXES, find_compressed_variant, open_text
+
+
+# Instances that are not worker agents
+NON_AGENT_INSTANCES = ('coordinator', 'user', '')
+
+# "/aipo-start-task 0003-backend-models TASK-004" inside a dispatch request
+_TASK_REF = re.compile(r'(\d{4}-[a-z0-9][a-z0-9-]*)\s+(TASK-\d+)')
+
+
+@dataclass
+class WorkPeriod:
+    """A single request→result cycle of one agent."""
+    agent: str
+    start: datetime
+    end: datetime
+    initiative: Optional[str] = None  # Initiative directory name, if the request named one
+    task_id: Optional[str] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        """Length of the work period in seconds."""
+        return (self.end - self.start).total_seconds()
+
+    @property
+    def task_key(self) -> Optional[str]:
+        """Task reference as ``NNNN-name/TASK-XXX`` or None."""
+        if self.initiative and self.task_id:
+            return f"{self.initiative}/{self.task_id}"
+        return None
+
+
+@dataclass
+class IdleGap:
+    """Idle time of one agent between two work periods, split by cause."""
+    agent: str
+    start: datetime
+    end: datetime
+    next_task: Optional[str] = None  # Task key the agent worked on next
+    dependency_minutes: float = 0.0  # Waiting for an unfinished dependency
+    dispatch_minutes: float = 0.0  # Task was ready; waiting for the coordinator
+    no_work_minutes: float = 0.0  # Nothing left for this agent
+    unattributed_minutes: float = 0.0  # Next task could not be identified
+    blocking_dependency: Optional[str] = None  # Dependency that became ready last
+    dispatched: bool = False  # Gap ended with a coordinator dispatch
+
+    @property
+    def minutes(self) -> float:
+        """Total gap length in minutes."""
+        return (self.end - self.start).total_seconds() / 60
+
+
+def find_latest_session() -> Path | None:
+    """Find the most recent Claude Swarm session for the current project.
+
+    Returns:
+        Path to the session directory or None
+    """
+    # Claude Swarm stores sessions in ~/.claude-swarm/sessions/
+    home = Path.home()
+    sessions_base = home / ".claude-swarm" / "sessions"
+
+    if not sessions_base.exists():
+        return None
+
+    # Find sessions for current project
+    cwd = Path.cwd()
+    # Session directory format: path+with+plus+signs/session-uuid
+    # Strip leading slash before replacing
+    cwd_encoded = str(cwd).lstrip("/").replace("/", "+")
+
+    project_sessions = sessions_base / cwd_encoded
+
+    if not project_sessions.exists():
+        return None
+
+    # Get all session directories sorted by creation time
+    sessions = [d for d in project_sessions.iterdir() if d.is_dir()]
+
+    if not sessions:
+        return None
+
+    # Return most recent session
+    sessions.sort(key=lambda d: d.stat().st_mtime, reverse=True)
+    return sessions[0]
+
+
+def find_session_log(session_path: Path) -> Path | None:
+    """Find the session log, accepting compressed archives (.gz/.xz/.zst).
+
+    Args:
+        session_path: Session directory
+
+    Returns:
+        Path to the log file or None
+    """
+    return find_compressed_variant(session_path / "session.log.json")
+
+
+def _parse_line(line: str):
+    """Decode one log line into an agent request/result event.
+
+    Returns:
+        Tuple of (instance, timestamp, event_type, task_ref match) or None
+        for lines that are not agent request/result events
+    """
+    # Only request/result events matter; skip the rest before decoding JSON
+    if '"request"' not in line and '"result"' not in line:
+        return None
+    try:
+        entry = json.loads(line)
+        instance = entry.get('instance', '')
+        event = entry.get('event', {})
+        event_type = event.get('type', '')
+
+        # Filter to agent instances only (exclude coordinator, user)
+        if instance in NON_AGENT_INSTANCES:
+            return None
+
+        # Agent receives task from coordinator (start work) or sends result (end work)
+        if event_type == 'request' and event.get('from_instance', '') == 'coordinator':
+            ref = _TASK_REF.search(line)
+        elif event_type == 'result':
+            ref = None
+        else:
+            return None
+
+        dt = datetime.fromisoformat(entry.get('timestamp', '').replace('Z', '+00:00'))
+        return instance, dt, event_type, ref
+    except (json.JSONDecodeError, ValueError, KeyError, AttributeError):
+        return None
+
+
+class _PeriodBuilder:
+    """Pairs request and result events into work periods."""
+
+    def __init__(self):
+        self.open_work = {}  # agent -> (start_time, initiative, task_id)
+        self._last_result = {}  # agent -> last result time (avoid duplicates)
+
+    def feed(self, line: str) -> Optional[WorkPeriod]:
+        """Consume one log line; return a work period if it closed one."""
+        parsed = _parse_line(line)
+        if parsed is None:
+            return None
+        instance, dt, event_type, ref = parsed
+
+        if event_type == 'request':
+            self.open_work[instance] = (dt, ref.group(1), ref.group(2)) if ref else (dt, None, None)
+            return None
+
+        # Avoid duplicate results at same timestamp
+        if instance in self.open_work and self._last_result.get(instance) != dt:
+            self._last_result[instance] = dt
+            start, initiative, task_id = self.open_work.pop(instance)
+            return WorkPeriod(instance, start, dt, initiative, task_id)
+        return None
+
+
+def iter_work_periods(log_file: Path) -> Iterator[WorkPeriod]:
+    """Stream agent work periods from a session log.
+
+    A period starts when the coordinator sends a request to an agent and
+    ends at the agent's next result. Only the open period per agent is
+    kept in memory, so arbitrarily large (or compressed) logs can be
+    processed.
+
+    Args:
+        log_file: Path to session.log.json (plain or compressed)
+
+    Yields:
+        WorkPeriod objects in log order of their end events
+    """
+    builder = _PeriodBuilder()
+    with open_text(log_file) as f:
+        for line in f:
+            period = builder.feed(line)
+            if period is not None:
+                yield period
+
+
+def agent_role(agent: str) -> str:
+    """Agent type used for duration statistics (``backend_2`` -> ``backend``)."""
+    return re.sub(r'_\d+$', '', agent)
+
+
+class ActivityTracker:
+    """Incrementally follows a session log.
+
+    Each poll() reads only the bytes appended since the previous call, so
+    it can run every few seconds on a long, busy session. Completed
+    durations are kept sorted per agent role for percentile queries.
+    """
+
+    def __init__(self, log_file: Path):
+        self.log_file = log_file
+        self._compressed = log_file.suffix.lower() in COMPRESSED_SUFFIXES
+        self._reset()
+
+    def _reset(self) -> None:
+        self.durations: Dict[str, List[float]] = defaultdict(list)  # role -> sorted minutes
+        self._builder = _PeriodBuilder()
+        self._offset = 0  # Bytes read (plain logs) or lines consumed (compressed logs)
+        self._partial = b''
+        self._stat: Optional[Tuple[int, int]] = None
+
+    @property
+    def open_work(self) -> Dict[str, Tuple[datetime, Optional[str], Optional[str]]]:
+        """Agent -> (start, initiative, task_id) of work periods still open."""
+        return self._builder.open_work
+
+    def poll(self) -> List[WorkPeriod]:
+        """Read new log lines.
+
+        Returns:
+            Work periods completed since the previous poll
+        """
+        completed = []
+        for line in self._new_lines():
+            period = self._builder.feed(line)
+            if period is not None:
+                insort(self.durations[agent_role(period.agent)], period.duration_seconds / 60)
+                completed.append(period)
+        return completed
+
+    def _new_lines(self) -> Iterator[str]:
+        if self._compressed:
+            return self._new_compressed_lines()
+
+        try:
+            size = self.log_file.stat().st_size
+        except OSError:
+            return iter(())
+        if size < self._offset:
+            # Log was truncated or replaced: start over
+            self._reset()
+        if size == self._offset:
+            return iter(())
+
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._offset)
+            data = self._partial + f.read()
+        self._offset = size
+
+        # Keep an incomplete trailing line for the next poll
+        cut = data.rfind(b'\n') + 1
+        self._partial = data[cut:]
+        return iter(data[:cut].decode('utf-8', errors='replace').splitlines())
+
+    def _new_compressed_lines(self) -> Iterator[str]:
+        """Stream a compressed log, skipping the lines consumed by earlier polls.
+
+        Compressed streams cannot be seeked by uncompressed offset, so the
+        file is only re-read when its (mtime_ns, size) changed, and then
+        decompressed line by line without holding it in memory.
+        """
+        try:
+            st = self.log_file.stat()
+        except OSError:
+            return
+        stat = (st.st_mtime_ns, st.st_size)
+        if stat == self._stat:
+            return
+        self._stat = stat
+        consumed = 0
+        with open_text(self.log_file) as f:
+            for line in f:
+                consumed += 1
+                if consumed > self._offset:
+                    self._offset = consumed
+                    yield line
+
+
+def parse_agent_activity(log_file: Path) -> Dict[str, List[Tuple[datetime, datetime]]]:
+    """Parse a session log into per-agent work periods.
+
+    Args:
+        log_file: Path to session.log.json (plain or compressed)
+
+    Returns:
+        Dict mapping agent name to list of (start_time, end_time) tuples
+    """
+    agent_work = defaultdict(list)
+    for period in iter_work_periods(log_file):
+        agent_work[period.agent].append((period.start, period.end))
+    return dict(agent_work)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Values in ascending order (non-empty)
+        q: Percentile in the range 0-100
+
+    Returns:
+        The percentile value
+    """
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def classify_idle_gaps(
+    periods: List[WorkPeriod],
+    task_deps: Dict[str, List[str]],
+    done_before: Set[str],
+    agent_tasks: Dict[str, List[str]],
+    initiative_tasks: Dict[str, List[str]],
+) -> List[IdleGap]:
+    """Classify every idle gap of every agent by its root cause.
+
+    The task an agent worked on after a gap determines the cause: the gap
+    is a dependency wait until the last of that task's dependencies
+    finished, and coordinator dispatch latency after that. A trailing gap
+    with no assigned work left is "no work"; otherwise it is classified
+    against the agent's earliest-ready unfinished task.
+
+    Dependency labels are task keys (``NNNN-name/TASK-XXX``) or initiative
+    directory names for initiative-level dependencies, which finish with
+    the last of the initiative's tasks.
+
+    Args:
+        periods: Work periods of the session
+        task_deps: Task key -> dependency labels
+        done_before: Task keys already complete before the session
+        agent_tasks: Agent name -> task keys assigned to it in tasks.prd
+        initiative_tasks: Initiative directory name -> its task keys
+
+    Returns:
+        IdleGap objects, one per non-empty gap
+    """
+    if not periods:
+        return []
+
+    session_start = min(p.start for p in periods)
+    session_end = max(p.end for p in periods)
+    never = datetime.max.replace(tzinfo=session_start.tzinfo)
+
+    # Completion time of every task worked on in the session
+    completed_at: Dict[str, datetime] = {}
+    for p in periods:
+        key = p.task_key
+        if key and (key not in completed_at or p.end > completed_at[key]):
+            completed_at[key] = p.end
+
+    def task_finished_at(key: str) -> Optional[datetime]:
+        """Time a task finished; None if done before the session."""
+        if key in completed_at:
+            return completed_at[key]
+        return None if key in done_before else never
+
+    def finished_at(label: str) -> Optional[datetime]:
+        """Time a dependency finished; None if done before the session."""
+        if '/' in label:
+            return task_finished_at(label)
+        if label not in initiative_tasks:
+            return never
+        finished = None
+        for key in initiative_tasks[label]:
+            at = task_finished_at(key)
+            if at is not None and (finished is None or at > finished):
+                finished = at
+        return finished
+
+    def ready_at(task_key: str) -> Tuple[Optional[datetime], Optional[str]]:
+        """Time a task became ready and the dependency that finished last."""
+        ready, blocker = None, None
+        for label in task_deps.get(task_key, []):
+            finished = finished_at(label)
+            if finished is not None and (ready is None or finished > ready):
+                ready, blocker = finished, label
+        return ready, blocker
+
+    def split(gap: IdleGap, task_key: str) -> None:
+        ready, blocker = ready_at(task_key)
+        if ready is not None and ready > gap.start:
+            wait_end = min(ready, gap.end)
+            gap.dependency_minutes = (wait_end - gap.start).total_seconds() / 60
+            gap.blocking_dependency = blocker
+            gap.dispatch_minutes = max(0.0, (gap.end - wait_end).total_seconds() / 60)
+        else:
+            gap.dispatch_minutes = gap.minutes
+
+    by_agent: Dict[str, List[WorkPeriod]] = defaultdict(list)
+    for p in periods:
+        by_agent[p.agent].append(p)
+
+    gaps = []
+    for agent, agent_periods in sorted(by_agent.items()):
+        agent_periods.sort(key=lambda p: p.start)
+
+        # Gaps that end with a dispatch
+        idle_since = session_start
+        for p in agent_periods:
+            if p.start > idle_since:
+                gap = IdleGap(agent, idle_since, p.start, next_task=p.task_key, dispatched=True)
+                if p.task_key:
+                    split(gap, p.task_key)
+                else:
+                    gap.unattributed_minutes = gap.minutes
+                gaps.append(gap)
+            idle_since = max(idle_since, p.end)
+
+        # Trailing gap until the session ended
+        if session_end > idle_since:
+            gap = IdleGap(agent, idle_since, session_end)
+            remaining = [
+                key for key in agent_tasks.get(agent, [])
+                if key not in completed_at and key not in done_before
+            ]
+            if not remaining:
+                gap.no_work_minutes = gap.minutes
+            else:
+                # The earliest-ready remaining task decides the cause
+                gap.next_task = min(remaining, key=lambda k: ready_at(k)[0] or session_start)
+                split(gap, gap.next_task)
+            gaps.append(gap)
+
+    return gaps
@@ -0,0 +1,214 @@
+"""Cold storage for finished initiatives.
+
+Completed and cancelled initiatives are packed into
+``ai-project/archive/initiatives.zip`` (one ``NNNN-name/...`` member per
+file) and summarized in ``ai-project/archive/index.json``. Scans read the
+index instead of parsing the cold directories, so their cost follows the
+active work rather than the project's history. Modules only needed to write
+the archive are imported inside the functions that do so.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .cache import stat_key
+from .models import Initiative
+
+
+ARCHIVE_DIR = Path("ai-project") / "archive"
+PACK_NAME = "initiatives.zip"
+INDEX_NAME = "index.json"
+
+_INDEX_VERSION = 1
+
+# Parsed index per file, keyed by its stat key
+_index_memo: Dict[str, Tuple[Optional[List[int]], List[Initiative]]] = {}
+
+
+def load_archived_initiatives(base_path: Path = Path(".")) -> List[Initiative]:
+    """Initiatives recorded in the archive index (empty if there is none).
+
+    Args:
+        base_path: Project base path
+
+    Returns:
+        Initiatives with ``archived=True``, as they were when packed
+    """
+    index_file = base_path / ARCHIVE_DIR / INDEX_NAME
+    key = stat_key(index_file)
+    if key is None:
+        return []
+    memo = _index_memo.get(str(index_file))
+    if memo and memo[0] == key:
+        return memo[1]
+
+    entries = _read_index(index_file)
+    initiatives = [Initiative.from_dict(entry['initiative']) for entry in entries]
+    legacy = [init for init, entry in zip(initiatives, entries) if 'agent_completed' not in entry['initiative']]
+    if legacy:
+        _count_packed_agents(index_file.with_name(PACK_NAME), legacy)
+    _index_memo[str(index_file)] = (key, initiatives)
+    return initiatives
+
+
+def find_archived_initiative(ref: str, base_path: Path = Path(".")) -> Optional[Initiative]:
+    """Archived initiative named by a directory name ("0003-backend") or ID ("0003")."""
+    name = Path(ref).name
+    initiatives = load_archived_initiatives(base_path)
+    return (next((init for init in initiatives if init.name == name), None)
+            or next((init for init in initiatives if init.id == name.split('-')[0]), None))
+
+
+def archived_message(initiative: Initiative) -> str:
+    """Error for a command that needs the directory of an archived initiative."""
+    return f"Initiative is archived: {initiative.name} (aipo archive-initiatives --restore {initiative.id})"
+
+
+def not_found_message(ref: str, base_path: Path = Path(".")) -> str:
+    """Error for an initiative reference without a directory, pointing at the archive if it is there."""
+    archived = find_archived_initiative(ref, base_path)
+    return archived_message(archived) if archived else f"Initiative not found: {ref}"
+
+
+def archive_candidates(initiatives: Sequence[Initiative]) -> Tuple[List[Initiative], List[Initiative]]:
+    """Split hot initiatives into archivable ones and finished ones still bound to a swarm.
+
+    Returns:
+        Tuple of (archivable, skipped)
+    """
+    archivable, skipped = [], []
+    for init in initiatives:
+        if init.archived or not (init.is_completed or init.is_cancelled):
+            continue
+        (skipped if init.swarm else archivable).append(init)
+    return archivable, skipped
+
+
+def archive_initiatives(initiatives: Sequence[Initiative], base_path: Path = Path(".")) -> None:
+    """Pack initiative directories into the archive and remove them.
+
+    The pack is rewritten to a temp file and renamed into place, then the
+    index is replaced atomically, then the directories are removed. A crash
+    at any point leaves each initiative either hot or fully archived
+    (scans prefer a hot directory over an index entry with the same name).
+
+    Args:
+        initiatives: Hot initiatives to archive
+        base_path: Project base path
+    """
+    if not initiatives:
+        return
+    from datetime import datetime
+
+    archive_dir = base_path / ARCHIVE_DIR
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    names = {init.name for init in initiatives}
+
+    _rewrite_pack(archive_dir / PACK_NAME, drop=names, add=[init.directory for init in initiatives])
+
+    index_file = archive_dir / INDEX_NAME
+    entries = [e for e in _read_index(index_file) if e['initiative']['name'] not in names]
+    archived_at = datetime.now().isoformat(timespec='seconds')
+    for init in initiatives:
+        data = init.to_dict()
+        data['archived'] = True
+        entries.append({'archived_at': archived_at, 'initiative': data})
+    _write_index(index_file, entries)
+
+    import shutil
+    for init in initiatives:
+        shutil.rmtree(init.directory)
+
+
+def restore_initiative(name_or_id: str, base_path: Path = Path(".")) -> Optional[str]:
+    """Unpack an archived initiative back into ai-project/initiatives/.
+
+    Args:
+        name_or_id: Directory name ("0003-backend") or ID ("0003")
+        base_path: Project base path
+
+    Returns:
+        Restored directory name, or None if it is not archived
+
+    Raises:
+        FileExistsError: If a hot directory with that name already exists
+    """
+    archive_dir = base_path / ARCHIVE_DIR
+    index_file = archive_dir / INDEX_NAME
+    entries = _read_index(index_file)
+    match = next((e for e in entries if name_or_id in (e['initiative']['name'], e['initiative']['id'])), None)
+    if match is None:
+        return None
+
+    name = match['initiative']['name']
+    target = base_path / "ai-project" / "initiatives" / name
+    if target.exists():
+        raise FileExistsError(f"{target} already exists")
+
+    import zipfile
+    prefix = f"{name}/"
+    with zipfile.ZipFile(archive_dir / PACK_NAME) as pack:
+        members = [m for m in pack.namelist() if m.startswith(prefix)]
+        pack.extractall(base_path / "ai-project" / "initiatives", members)
+
+    _write_index(index_file, [e for e in entries if e is not match])
+    _rewrite_pack(archive_dir / PACK_NAME, drop={name}, add=[])
+    return name
+
+
+def _count_packed_agents(pack_path: Path, initiatives: List[Initiative]) -> None:
+    """Fill in agent_completed of entries archived before it was recorded."""
+    import zipfile
+    from .utils import parse_tasks
+    try:
+        with zipfile.ZipFile(pack_path) as pack:
+            for init in initiatives:
+                try:
+                    content = pack.read(f"{init.name}/tasks.prd").decode('utf-8')
+                except KeyError:
+                    continue
+                for task in parse_tasks(content):
+                    if task['agent'] and task['status'] == 'completed':
+                        init.agent_completed[task['agent']] = init.agent_completed.get(task['agent'], 0) + 1
+    except (OSError, zipfile.BadZipFile):
+        pass
+
+
+def _rewrite_pack(pack_path: Path, drop: set, add: List[Path]) -> None:
+    """Rewrite the pack without the ``drop`` initiatives and with ``add`` directories."""
+    import zipfile
+    tmp = pack_path.with_name(f".{pack_path.name}.{os.getpid()}.tmp")
+    try:
+        with zipfile.ZipFile(tmp, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as out:
+            if pack_path.exists():
+                with zipfile.ZipFile(pack_path) as pack:
+                    for info in pack.infolist():
+                        if info.filename.split('/', 1)[0] not in drop:
+                            out.writestr(info, pack.read(info))
+            for directory in add:
+                for path in sorted(directory.rglob('*')):
+                    if path.is_file():
+                        out.write(path, f"{directory.name}/{path.relative_to(directory).as_posix()}")
+        with open(tmp, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, pack_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _read_index(index_file: Path) -> List[dict]:
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return []
+    return data.get('initiatives', [])
+
+
+def _write_index(index_file: Path, entries: List[dict]) -> None:
+    from .prd import atomic_write  # write path only; scans just read the index
+    entries = sorted(entries, key=lambda e: e['initiative']['name'])
+    atomic_write(index_file, json.dumps({'version': _INDEX_VERSION, 'initiatives': entries}, indent=1))
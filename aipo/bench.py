@@ -0,0 +1,405 @@
+"""Synthetic projects and timing for the benchmark suite.
+
+``generate_project`` writes a reproducible project in the regular
+tasks.prd format: N initiatives of M tasks with task and initiative
+dependencies, agent assignments, a swarm file and a Claude Swarm
+``session.log.json``. ``run_benchmarks`` times the CLI commands against
+generated projects of several sizes in fresh interpreter processes, so
+startup and imports are part of every measurement.
+"""
+
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Benchmarked commands: name -> aipo arguments ({swarm} is the swarm file)
+BENCH_COMMANDS = {
+    'status': ['status'],
+    'list': ['list'],
+    'next --agent': ['next', '--agent', 'backend_1'],
+    'validate': ['validate', '{swarm}'],
+    'unblock': ['unblock'],
+    'monitor --show-tasks': ['monitor', '--show-tasks'],
+    'swarm --activity': ['swarm', '{swarm}', '--activity'],
+}
+
+DEFAULT_SIZES = ((10, 20), (100, 50))
+
+SWARM_FILE = "0001-bench-swarm.yml"
+
+# Slowest acceptable import of the CLI plus the hot ``next`` command
+IMPORT_BUDGET_MS = 100.0
+
+# Median slowdown over the baseline reported as a regression
+DEFAULT_TOLERANCE = 0.25
+
+_ROLES = ('backend', 'frontend', 'database', 'testing')
+_WORDS = ('auth', 'billing', 'search', 'api', 'reports', 'sync', 'audit', 'notify',
+          'export', 'admin', 'cache', 'upload', 'profile', 'metrics', 'gateway')
+
+# Share of initiatives that are completed / in progress; the rest are not started
+_COMPLETED_SHARE = 0.3
+_ACTIVE_SHARE = 0.4
+
+_TASKS_PER_GROUP = 10
+_SESSION_START = datetime(2025, 1, 6, 9, 0)
+
+_IMPORT_LINE = re.compile(r'^import time:\s+\d+\s+\|\s+(\d+)\s+\|( *)(\S+)')
+
+
+@dataclass
+class BenchProject:
+    """A generated benchmark project."""
+    root: Path
+    home: Path  # HOME holding the Claude Swarm session
+    swarm_file: Path
+    initiatives: int
+    tasks_per_initiative: int
+    agents: List[str] = field(default_factory=list)
+
+    @property
+    def size(self) -> str:
+        """Size label such as ``100x50``."""
+        return f"{self.initiatives}x{self.tasks_per_initiative}"
+
+
+@dataclass
+class Timing:
+    """Wall-clock timings of one command on one project size (milliseconds)."""
+    size: str
+    command: str
+    median_ms: float
+    min_ms: float
+    max_ms: float
+    first_ms: float  # Run on a cold .aipo cache
+    runs: int
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    """Parse ``NxM`` (initiatives x tasks per initiative).
+
+    Raises:
+        ValueError: If the value is not two positive integers
+    """
+    match = re.fullmatch(r'\s*(\d+)\s*[xX]\s*(\d+)\s*', value)
+    if not match or not int(match.group(1)) or not int(match.group(2)):
+        raise ValueError(f"Invalid size '{value}' (expected NxM, e.g. 100x50)")
+    return int(match.group(1)), int(match.group(2))
+
+
+def agent_names(count: int) -> List[str]:
+    """Agent instance names, cycling through roles (``backend_1``, ``frontend_1``, ...)."""
+    return [f"{_ROLES[i % len(_ROLES)]}_{i // len(_ROLES) + 1}" for i in range(count)]
+
+
+def generate_project(root: Path, initiatives: int, tasks: int, density: float = 0.3,
+                     agents: int = 4, seed: int = 0, home: Optional[Path] = None) -> BenchProject:
+    """Write a synthetic project under ``root``.
+
+    Initiatives are numbered in dependency order: the first 30% are
+    completed, the next 40% in progress and the rest not started. Each task
+    depends on earlier tasks of its initiative and each initiative on
+    earlier initiatives with probability ``density``. The session log
+    replays the completed tasks per agent and leaves each agent working.
+
+    Args:
+        root: Project directory (created if missing)
+        initiatives: Number of initiatives
+        tasks: Tasks per initiative
+        density: Dependency probability (0-1)
+        agents: Number of agent instances
+        seed: Random seed; the same arguments always produce the same project
+        home: Directory used as HOME for the session (defaults to ``root/.home``)
+
+    Returns:
+        BenchProject describing the generated files
+    """
+    rng = random.Random(seed)
+    root = Path(root).resolve()
+    home = Path(home) if home else root / ".home"
+    names = agent_names(agents)
+
+    n_completed = int(initiatives * _COMPLETED_SHARE)
+    n_active = max(1, int(initiatives * _ACTIVE_SHARE)) if initiatives > n_completed else 0
+
+    dirs = [f"{i + 1:04d}-{_WORDS[i % len(_WORDS)]}-{i // len(_WORDS) + 1}" for i in range(initiatives)]
+    initiatives_dir = root / "ai-project" / "initiatives"
+
+    done: List[Tuple[str, str, str, float]] = []  # (initiative, task, agent, hours) in completion order
+    pending: List[Tuple[str, str]] = []  # Task each active initiative is working on
+    for index, name in enumerate(dirs):
+        if index < n_completed:
+            state, completed = 'completed', tasks
+        elif index < n_completed + n_active:
+            state, completed = 'active', rng.randint(0, tasks - 1)
+        else:
+            state, completed = 'not_started', 0
+
+        directory = initiatives_dir / name
+        directory.mkdir(parents=True, exist_ok=True)
+        content, finished = _tasks_prd(rng, dirs, index, tasks, completed, state, density, names)
+        (directory / "tasks.prd").write_text(content)
+        (directory / "description.prd").write_text(_description_prd(name))
+        done.extend((name, task_id, agent, hours) for task_id, agent, hours in finished)
+        if state == 'active':
+            pending.append((name, f"TASK-{completed + 1:03d}"))
+
+    swarm_file = root / SWARM_FILE
+    active_dirs = dirs[n_completed:n_completed + n_active]
+    swarm_file.write_text(_swarm_yaml(active_dirs, names))
+
+    session_dir = home / ".claude-swarm" / "sessions" / str(root).lstrip("/").replace("/", "+") / f"bench-{seed}"
+    session_dir.mkdir(parents=True, exist_ok=True)
+    _write_session_log(session_dir / "session.log.json", rng, done, pending, names)
+
+    return BenchProject(root=root, home=home, swarm_file=swarm_file, initiatives=initiatives,
+                        tasks_per_initiative=tasks, agents=names)
+
+
+def _tasks_prd(rng: random.Random, dirs: List[str], index: int, tasks: int, completed: int,
+               state: str, density: float, agents: List[str]) -> Tuple[str, List[Tuple[str, str, float]]]:
+    """Render one tasks.prd; also return the completed (task, agent, hours)."""
+    name = dirs[index]
+    init_deps = [dirs[i][:4] for i in range(max(0, index - 5), index) if rng.random() < density]
+    hours = [rng.choice((0.5, 1, 1.5, 2, 3, 4)) for _ in range(tasks)]
+    started = _SESSION_START - timedelta(days=len(dirs) - index)
+
+    lines = [
+        f"# Tasks: {name}",
+        "",
+        f"**Initiative ID**: {name[:4]}",
+        f"**Name**: {name[5:]}",
+        f"**Dependencies**: {', '.join(init_deps) or 'None'}",
+        f"**Target Date**: {(started + timedelta(days=14)).date()}",
+        f"**Estimated Hours**: {sum(hours):g}h",
+    ]
+    if state == 'active':
+        lines.append(f"**Swarm**: {SWARM_FILE}")
+    lines += ["", "---", ""]
+    lines.append(f"[START: {started:%Y-%m-%d %H:%M}]" if state != 'not_started' else "[START: ]")
+
+    finished = []
+    for t in range(tasks):
+        if t % _TASKS_PER_GROUP == 0:
+            group = t // _TASKS_PER_GROUP
+            lines += ["", f"## Task Group {group}: Phase {group + 1}", ""]
+        task_id = f"TASK-{t + 1:03d}"
+        agent = agents[rng.randrange(len(agents))]
+        deps = [f"TASK-{d + 1:03d}" for d in range(max(0, t - 5), t) if rng.random() < density]
+        mark = "x" if t < completed else " "
+        suffix = " (in progress)" if state == 'active' and t == completed else ""
+        lines.append(f"- [{mark}] {task_id}: Implement {name[5:]} step {t + 1}{suffix}")
+        lines.append(f"  - Dependencies: {', '.join(deps) or 'None'}")
+        if index and rng.random() < density / 10:
+            other = dirs[rng.randrange(index)]
+            lines.append(f"  - Cross-initiative: `initiatives/{other}/TASK-{rng.randint(1, tasks):03d}`")
+        lines.append(f"  - Agent: {agent}")
+        lines.append(f"  - Estimated: {hours[t]:g}h")
+        lines.append("")
+        if t < completed:
+            finished.append((task_id, agent, hours[t]))
+
+    if state == 'completed':
+        lines.append(f"[END: {started + timedelta(days=7):%Y-%m-%d %H:%M}]")
+    else:
+        lines.append("[END: ]")
+    status = {'completed': 'Completed', 'active': 'In progress', 'not_started': 'Not started'}[state]
+    pct = completed * 100 // tasks
+    lines += ["", "## Summary", "", f"**Status**: {status}",
+              f"**Progress**: {completed}/{tasks} tasks ({pct}%)", ""]
+    return "\n".join(lines), finished
+
+
+def _description_prd(name: str) -> str:
+    title = name[5:].replace('-', ' ').title()
+    return (f"# PRD: {title}\n\n**Initiative**: {name}\n**Status**: Generated\n\n"
+            f"## Overview\n\nSynthetic initiative generated for benchmarking.\n\n"
+            f"## Goals\n\n1. Exercise aipo on a project of realistic shape\n")
+
+
+def _swarm_yaml(initiative_dirs: List[str], agents: List[str]) -> str:
+    lines = [
+        "version: 1",
+        "swarm:",
+        '  name: "Benchmark swarm"',
+        "  main: coordinator",
+        "  initiatives:",
+    ]
+    lines += [f"    - {name}" for name in initiative_dirs]
+    lines += [
+        "  instances:",
+        "    coordinator:",
+        '      description: "Swarm coordinator"',
+        f"      connections: [{', '.join(agents)}]",
+    ]
+    for agent in agents:
+        lines += [f"    {agent}:", f'      description: "{agent.split("_")[0].title()} developer"']
+    return "\n".join(lines) + "\n"
+
+
+def _write_session_log(log_file: Path, rng: random.Random, done: Sequence[Tuple[str, str, str, float]],
+                       pending: Sequence[Tuple[str, str]], agents: List[str]) -> None:
+    """Replay completed tasks as coordinator requests and agent results."""
+    clock = {agent: _SESSION_START for agent in agents}
+    events = []
+
+    def request(agent: str, when: datetime, initiative: str, task_id: str) -> None:
+        events.append((when, agent, {"type": "request", "from_instance": "coordinator",
+                                     "prompt": f"Execute /aipo-start-task {initiative} {task_id}"}))
+
+    for initiative, task_id, agent, hours in done:
+        start = clock[agent] + timedelta(minutes=rng.randint(0, 20))
+        end = start + timedelta(minutes=hours * 60 * rng.uniform(0.5, 1.5))
+        request(agent, start, initiative, task_id)
+        events.append((end, agent, {"type": "result"}))
+        clock[agent] = end
+
+    for (initiative, task_id), agent in zip(pending, agents):
+        request(agent, clock[agent] + timedelta(minutes=rng.randint(0, 20)), initiative, task_id)
+
+    events.sort(key=lambda e: e[0])
+    with open(log_file, 'w', encoding='utf-8') as f:
+        for when, instance, event in events:
+            f.write(json.dumps({"timestamp": when.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                                "instance": instance, "event": event}) + "\n")
+
+
+def _aipo_argv(args: Sequence[str]) -> List[str]:
+    """Command line running the aipo CLI of this package in a fresh interpreter."""
+    return [sys.executable, "-c", "import sys; from aipo.cli import main; sys.exit(main())", *args]
+
+
+def _aipo_env(home: Path) -> Dict[str, str]:
+    env = dict(os.environ, HOME=str(home))
+    package_root = str(Path(__file__).resolve().parent.parent)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+    return env
+
+
+def time_command(project: BenchProject, args: Sequence[str], repeat: int = 5) -> Tuple[float, List[float]]:
+    """Time one aipo invocation on a project.
+
+    Args:
+        project: Generated project (used as cwd and HOME)
+        args: aipo arguments
+        repeat: Timed runs after the first (cold cache) run
+
+    Returns:
+        Tuple of (first run, later runs) in milliseconds
+
+    Raises:
+        RuntimeError: If the command crashes
+    """
+    env = _aipo_env(project.home)
+    argv = _aipo_argv(args)
+    times = []
+    for _ in range(repeat + 1):
+        start = time.perf_counter()
+        result = subprocess.run(argv, cwd=project.root, env=env, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
+        times.append((time.perf_counter() - start) * 1000)
+        if "Traceback" in result.stderr:
+            raise RuntimeError(f"aipo {' '.join(args)} crashed:\n{result.stderr.strip()}")
+    return times[0], times[1:]
+
+
+def import_time_ms(modules: Sequence[str] = ('aipo.cli', 'aipo.commands.next')) -> float:
+    """Import time of ``modules`` in a fresh interpreter, from ``-X importtime``.
+
+    Returns:
+        Sum of the cumulative times of the top-level aipo imports, in milliseconds
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+                            env=_aipo_env(Path.home()), capture_output=True, text=True)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        raise RuntimeError(f"import {', '.join(modules)} failed:\n" + "\n".join(errors).strip())
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match and len(match.group(2)) == 1 and match.group(3).startswith('aipo'):
+            total_us += int(match.group(1))
+    return total_us / 1000
+
+
+def run_benchmarks(sizes: Sequence[Tuple[int, int]] = DEFAULT_SIZES, commands: Optional[Sequence[str]] = None,
+                   repeat: int = 5, density: float = 0.3, agents: int = 4, seed: int = 0,
+                   progress=None) -> List[Timing]:
+    """Generate a project per size and time each command on it.
+
+    Args:
+        sizes: (initiatives, tasks per initiative) pairs
+        commands: Names from BENCH_COMMANDS (defaults to all)
+        repeat: Timed runs per command after the cold run
+        density: Dependency density of the generated projects
+        agents: Agents in the generated projects
+        seed: Random seed of the generated projects
+        progress: Optional callback receiving each Timing as it completes
+
+    Returns:
+        Timings in size, then command order
+    """
+    results = []
+    for initiatives, tasks in sizes:
+        with tempfile.TemporaryDirectory(prefix="aipo-bench-") as tmp:
+            project = generate_project(Path(tmp) / "project", initiatives, tasks, density=density,
+                                       agents=agents, seed=seed, home=Path(tmp) / "home")
+            for name in commands or BENCH_COMMANDS:
+                args = [a.format(swarm=project.swarm_file.name) for a in BENCH_COMMANDS[name]]
+                first, runs = time_command(project, args, repeat)
+                timing = Timing(size=project.size, command=name, median_ms=statistics.median(runs),
+                                min_ms=min(runs), max_ms=max(runs), first_ms=first, runs=len(runs))
+                results.append(timing)
+                if progress:
+                    progress(timing)
+    return results
+
+
+def results_payload(timings: Sequence[Timing], import_ms: float, seed: int, density: float, agents: int) -> dict:
+    """JSON-serializable benchmark results."""
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'seed': seed,
+        'density': density,
+        'agents': agents,
+        'import_ms': round(import_ms, 2),
+        'results': [{k: round(v, 2) if isinstance(v, float) else v for k, v in asdict(t).items()}
+                    for t in timings],
+    }
+
+
+def compare_results(current: dict, baseline: dict,
+                    tolerance: float = DEFAULT_TOLERANCE) -> List[Tuple[str, str, float, float, bool]]:
+    """Compare median timings with a baseline results file.
+
+    Args:
+        current: Payload from results_payload
+        baseline: Earlier payload
+        tolerance: Allowed relative slowdown (0.25 = 25%)
+
+    Returns:
+        (size, command, baseline ms, current ms, regressed) for every
+        size/command present in both
+    """
+    before = {(r['size'], r['command']): r['median_ms'] for r in baseline.get('results', [])}
+    rows = []
+    for r in current['results']:
+        key = (r['size'], r['command'])
+        if key in before:
+            rows.append((*key, before[key], r['median_ms'], r['median_ms'] > before[key] * (1 + tolerance)))
+    return rows
@@ -0,0 +1,83 @@
+"""On-disk cache for parsed project files.
+
+Entries live under ``ai-project/.aipo/cache/`` as JSON documents tagged
+with a key, usually the (mtime_ns, size) of the source file. A stale key
+or an unreadable entry is treated as a miss, so the cache can always be
+deleted safely.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, List, Optional
+
+from .telemetry import counters
+
+
+CACHE_DIR = Path("ai-project") / ".aipo" / "cache"
+
+
+def cache_dir(base_path: Path = Path(".")) -> Path:
+    """Directory holding cache entries for a project."""
+    return base_path / CACHE_DIR
+
+
+def stat_key(path: Path) -> Optional[List[int]]:
+    """Cheap change-detection key for a file.
+
+    Args:
+        path: File to stat
+
+    Returns:
+        [mtime_ns, size] or None if the file does not exist
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_cached(base_path: Path, name: str, key: Any) -> Optional[Any]:
+    """Load a cache entry if its key matches.
+
+    Args:
+        base_path: Project base path
+        name: Entry name (file name inside the cache directory)
+        key: Expected key (JSON-compatible)
+
+    Returns:
+        Cached value or None on a miss
+    """
+    counters.cache_lookups += 1
+    try:
+        with open(cache_dir(base_path) / name, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get('key') != key:
+        return None
+    counters.cache_hits += 1
+    return entry.get('value')
+
+
+def store_cached(base_path: Path, name: str, key: Any, value: Any) -> None:
+    """Store a cache entry atomically. Failures are ignored.
+
+    Args:
+        base_path: Project base path
+        name: Entry name (file name inside the cache directory)
+        key: Key to validate the entry against on load (JSON-compatible)
+        value: Value to store (JSON-compatible)
+    """
+    directory = cache_dir(base_path)
+    if not (base_path / "ai-project").is_dir():
+        return
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / f".{name}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'value': value}, f, separators=(',', ':'))
+        os.replace(tmp, directory / name)
+    except OSError:
+        pass
@@ -1,30 +1,119 @@
 """Command-line interface for AIPO."""
 
-import argparse
+import importlib
 import sys
+import time
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional
 
+from . import profiling
 from .utils import Colors
-from .commands import (
-    init_commands,
-    monitor_swarm,
-    validate_swarm,
-    check_initiative,
-    list_initiatives,
-    status_command,
-    next_command,
-    unblock_command,
-    swarm_command,
-)
-from .commands.validate import print_summary
-
-
-def main() -> int:
+
+
+# Hot commands the coordinator runs once per task, parsed without building
+# the full argparse parser. Flag -> whether it takes a value; anything else
+# (help, positionals, --flag=value) falls back to argparse.
+_FAST_FLAGS = {
+    'next': {'--agent': True, '--swarm': True, '--all': False, '--no-color': False},
+    'status': {'--json': False, '--if-changed': True, '--no-record': False, '--no-color': False},
+}
+
+_FAST_DEFAULTS = {
+    'next': {'all': False, 'agent': None, 'initiatives': None, 'swarm': None, 'initiative_dir': None},
+    'status': {'json': False, 'changed_since': None, 'if_changed': None, 'no_record': False},
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse a plain ``next``/``status`` invocation without argparse.
+
+    Args:
+        argv: Command-line arguments (without the program name)
+
+    Returns:
+        Parsed arguments, or None if argparse has to handle them
+    """
+    if not argv or argv[0] not in _FAST_FLAGS:
+        return None
+    flags = _FAST_FLAGS[argv[0]]
+    options = dict(_FAST_DEFAULTS[argv[0]], command=argv[0], no_color=False)
+
+    args = iter(argv[1:])
+    for arg in args:
+        if arg not in flags:
+            return None
+        if flags[arg]:
+            value = next(args, None)
+            if value is None or value.startswith('-'):
+                return None
+            options[arg[2:].replace('-', '_')] = value
+        else:
+            options[arg[2:].replace('-', '_')] = True
+    return SimpleNamespace(**options)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI entry point.
     
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+        
     Returns:
         Exit code
     """
+    started = time.perf_counter()
+    argv = sys.argv[1:] if argv is None else argv
+    argv, profile = profiling.extract_option(argv)
+
+    exit_code = 1
+    try:
+        if profile is None:
+            exit_code = _main(argv)
+        else:
+            profiling.start(profile)
+            try:
+                with profiling.span("aipo"):
+                    exit_code = _main(argv)
+            finally:
+                profiling.stop()
+        return exit_code
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+        raise
+    finally:
+        from .telemetry import record_run
+        record_run(argv, (time.perf_counter() - started) * 1000, exit_code)
+
+
+def _main(argv: List[str]) -> int:
+    args = _fast_parse(argv)
+    if args is None:
+        with profiling.span("argparse"):
+            parser = _build_parser()
+            args = parser.parse_args(argv)
+        if args.command is None:
+            parser.print_help()
+            return 1
+
+    # Disable colors if requested or not a TTY
+    if hasattr(args, 'no_color') and args.no_color or not sys.stdout.isatty():
+        Colors.disable()
+
+    with profiling.span(args.command):
+        return _run(args)
+
+
+def _load(module: str, name: str):
+    """Import a command function from aipo.commands.<module> (the "import" phase)."""
+    with profiling.span("import"):
+        return getattr(importlib.import_module(f".commands.{module}", __package__), name)
+
+
+def _build_parser():
+    """Build the full argument parser (argparse is only imported here)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="AI Project Orchestrator (AIPO) - Validation and management CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -34,22 +123,56 @@ Examples:
   aipo init --run-swarm        # Install commands and run orchestrator
   aipo status                  # Quick project health check
   aipo status --json           # JSON output for CI/CD
+  aipo status --json --changed-since origin/main  # Incremental CI check
+  aipo status --json --if-changed 1f3a...  # Exit 3 if nothing changed since that fingerprint
   aipo next                    # Get next recommended task
   aipo next --all              # Show next task for each initiative
   aipo next --agent backend_1  # Get next task for agent (reads from tasks.prd)
   aipo unblock                 # Analyze dependencies and suggest unblocking actions
+  aipo graph                   # Show initiative execution waves
+  aipo graph --stats           # Depth, width and cycles of the dependency graphs
+  aipo history --burndown --since 7d  # Remaining tasks over the last week
+  aipo history --velocity      # Tasks/hour by initiative and agent
+  aipo forecast                # P50/P85/P95 completion dates (Monte Carlo)
+  aipo forecast --agents 4     # Forecast with 4 concurrent agents
+  aipo start 0003 TASK-004     # Mark a task in progress (sets [START: ] if first)
+  aipo complete 0003 TASK-004  # Check off a task (sets [END: ] and Summary if last)
+  aipo reopen 0003 TASK-004    # Uncheck a task
+  aipo apply changes.json      # Batch state/Agent/Swarm edits, all-or-nothing
+  aipo query 'status=pending agent=backend_2 group<=2 ready'  # Indexed task filter
+  aipo query state=active --initiatives --count  # Count active initiatives with tasks
+  aipo search "jwt refresh"     # Ranked search over tasks and description.prd sections
+  aipo context 0003 TASK-004 --budget 1500  # Task context pack for an agent
+  aipo tokens --sections        # Estimated tokens per file/section, module budget check
+  aipo sync-state --check       # Regenerate counts/milestones in project-state.prd
+  aipo archive-initiatives     # Pack completed/cancelled initiatives into the archive
+  aipo bench                   # Time commands on generated projects
+  aipo bench --sizes 200x50 --output base.json  # Record a baseline
+  aipo bench --baseline base.json  # Fail on regressions against it
+  aipo status --profile        # Per-phase timings on stderr
+  AIPO_PROFILE=trace.json aipo next --agent backend_1  # Chrome trace of one run
+  aipo perf report --since 24h # Latency percentiles per command, hour by hour
   aipo monitor                 # Monitor current swarm status
   aipo monitor --show-tasks    # Monitor with detailed task view
   aipo monitor --interactive   # Live monitoring with auto-refresh
+  aipo monitor --on-stall 'notify-send stalled'  # Run a hook when an agent stalls
   aipo swarm my-swarm.yml --cancel   # Cancel running swarm
   aipo swarm my-swarm.yml --archive  # Archive completed swarm
   aipo swarm my-swarm.yml --activity # Analyze agent activity and parallelism
+  aipo swarm my-swarm.yml --activity --export out/  # Export activity tables (CSV)
+  aipo swarm my-swarm.yml --activity --follow        # Live activity with stall detection
   aipo validate fullstack-feature-swarm.yml
+  aipo validate a.yml b.yml c.yml  # Validate several swarms in one pass
   aipo check ai-project/initiatives/0003-backend-models
   aipo list
         """
     )
 
+    # Handled by profiling.extract_option() before parsing; listed for --help
+    parser.add_argument('--profile', action='store_true',
+                        help='Print per-phase timings to stderr (anywhere on the line; --profile=trace.json '
+                             'writes a Chrome trace, --profile=out.prof a cProfile dump; also AIPO_PROFILE)')
+
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
     # Init command
@@ -60,6 +183,9 @@ Examples:
     # Status command
     status_parser = subparsers.add_parser('status', help='Quick project health check')
     status_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    status_parser.add_argument('--changed-since', type=str, metavar='REV', help='Re-validate only initiatives changed since git REV (cached results for the rest)')
+    status_parser.add_argument('--if-changed', type=str, metavar='FINGERPRINT', help='Exit with code 3 and skip the scan if the project still matches FINGERPRINT')
+    status_parser.add_argument('--no-record', action='store_true', help='Do not append a history snapshot (read-only run, e.g. in CI)')
     status_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
 
     # Next command
@@ -67,6 +193,7 @@ Examples:
     next_parser.add_argument('--all', action='store_true', help='Show next task for each active initiative')
     next_parser.add_argument('--agent', type=str, help='Agent name (reads assignments from tasks.prd)')
     next_parser.add_argument('--initiatives', type=str, help='(Deprecated) Comma-separated initiative dirs')
+    next_parser.add_argument('--swarm', type=str, metavar='FILE', help='With --agent, only consider initiatives of this swarm file')
     next_parser.add_argument('initiative_dir', nargs='?', help='Specific initiative directory')
     next_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
 
@@ -74,11 +201,17 @@ Examples:
     monitor_parser = subparsers.add_parser('monitor', help='Monitor current swarm status (no LLM)')
     monitor_parser.add_argument('--show-tasks', action='store_true', help='Show detailed task information')
     monitor_parser.add_argument('--interactive', action='store_true', help='Live monitoring with auto-refresh')
+    monitor_parser.add_argument('--stall-factor', type=float, default=2.0, help='Flag agents running this many times past their expected task duration (default: 2.0)')
+    monitor_parser.add_argument('--on-stall', type=str, metavar='CMD', help='Shell command to run when an agent stalls (AIPO_STALL_* env vars)')
+    monitor_parser.add_argument('--no-record', action='store_true', help='Do not append history snapshots (read-only run)')
     monitor_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
 
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate swarm configuration')
-    validate_parser.add_argument('swarm_file', type=Path, help='Path to swarm YAML file')
+    validate_parser.add_argument('swarm_files', type=Path, nargs='+', help='Path(s) to swarm YAML file(s)')
+    validate_parser.add_argument('--changed-since', type=str, metavar='REV', help='Re-validate only initiatives changed since git REV (cached results for the rest)')
+    validate_parser.add_argument('--context-limit', type=int, default=50000, metavar='TOKENS',
+                                 help="Warn when a swarm's PRDs exceed this many tokens (default: 50000, 0 disables)")
     validate_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
 
     # Check command
@@ -94,59 +227,282 @@ Examples:
     unblock_parser = subparsers.add_parser('unblock', help='Analyze dependencies and suggest unblocking actions')
     unblock_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
 
+    # Graph command
+    graph_parser = subparsers.add_parser('graph', help='Analyze initiative and task dependency graphs')
+    graph_parser.add_argument('--stats', action='store_true', help='Show nodes, edges, depth, width and cycles')
+    graph_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    graph_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # History command
+    history_parser = subparsers.add_parser('history', help='Burn-down and velocity from recorded snapshots')
+    history_parser.add_argument('--burndown', action='store_true', help='Show remaining tasks over time')
+    history_parser.add_argument('--velocity', action='store_true', help='Show tasks/hour by initiative and agent')
+    history_parser.add_argument('--since', type=str, metavar='WHEN', help='Start of range: 24h, 7d, 2w or an ISO date')
+    history_parser.add_argument('--initiative', type=str, metavar='NAME', help='Burn-down of one initiative (directory name)')
+    history_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    history_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Forecast command
+    forecast_parser = subparsers.add_parser('forecast', help='Monte Carlo completion forecast of remaining work')
+    forecast_parser.add_argument('--iterations', type=int, default=10000, help='Number of simulations (default: 10000)')
+    forecast_parser.add_argument('--agents', type=int, metavar='N', help='Concurrent agents bounding throughput (default: unbounded)')
+    forecast_parser.add_argument('--seed', type=int, help='Random seed for reproducible forecasts')
+    forecast_parser.add_argument('--hours-per-day', type=float, default=8, help='Working hours per calendar day (default: 8)')
+    forecast_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    forecast_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Task state commands
+    for name, help_text in (('complete', 'Mark a task completed in tasks.prd'),
+                            ('start', 'Mark a task in progress in tasks.prd'),
+                            ('reopen', 'Mark a task pending again in tasks.prd')):
+        task_parser = subparsers.add_parser(name, help=help_text)
+        task_parser.add_argument('initiative', type=str, help='Initiative directory, name or ID (e.g. 0003)')
+        task_parser.add_argument('task_id', type=str, help='Task ID (e.g. TASK-004)')
+        task_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Apply command
+    apply_parser = subparsers.add_parser('apply', help='Apply a JSON batch of tasks.prd edits all-or-nothing')
+    apply_parser.add_argument('changes_file', type=Path, help='JSON list of changes ("-" for stdin)')
+    apply_parser.add_argument('--dry-run', action='store_true', help='Validate and report without writing')
+    apply_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Query command
+    query_parser = subparsers.add_parser('query', help='Filter tasks by status, agent, group, initiative and readiness')
+    query_parser.add_argument('query', nargs='*', help="Terms such as status=pending agent=backend_2 'group<=2' ready")
+    query_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    query_parser.add_argument('--count', action='store_true', help='Only print the number of matches')
+    query_parser.add_argument('--initiatives', action='store_true', help='List initiatives with matching tasks instead of the tasks')
+    query_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Search command
+    search_parser = subparsers.add_parser('search', help='Full-text search over tasks and description.prd sections (BM25)')
+    search_parser.add_argument('query', nargs='+', help='Search terms')
+    search_parser.add_argument('--limit', type=int, default=10, help='Maximum number of results (default: 10)')
+    search_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    search_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Context command
+    context_parser = subparsers.add_parser('context', help='Token-budgeted context pack for one task')
+    context_parser.add_argument('initiative', type=str, help='Initiative directory, name or ID')
+    context_parser.add_argument('task_id', type=str, help='Task ID (e.g. TASK-004)')
+    context_parser.add_argument('--budget', type=int, default=1500, help='Token budget (default: 1500)')
+    context_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    context_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Tokens command
+    tokens_parser = subparsers.add_parser('tokens', help='Estimated tokens per PRD file, section and module')
+    tokens_parser.add_argument('--budget', type=int, default=500, help='Token budget per module (default: 500)')
+    tokens_parser.add_argument('--top', type=int, default=10, help='Number of files to list, largest first (default: 10, 0 for all)')
+    tokens_parser.add_argument('--sections', action='store_true', help='Break listed files down by section')
+    tokens_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    tokens_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Sync-state command
+    sync_state_parser = subparsers.add_parser('sync-state', help='Regenerate initiative/module counts and milestones in project-state.prd')
+    sync_state_parser.add_argument('--check', action='store_true', help='Report stale fields without writing (exit 1 if any)')
+    sync_state_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    sync_state_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Archive-initiatives command
+    archive_parser = subparsers.add_parser('archive-initiatives', help='Pack completed and cancelled initiatives into a compressed archive')
+    archive_parser.add_argument('--dry-run', action='store_true', help='List what would be archived')
+    archive_parser.add_argument('--restore', type=str, metavar='ID', help='Unpack an archived initiative (name or ID)')
+    archive_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Bench command
+    bench_parser = subparsers.add_parser('bench', help='Benchmark commands on generated synthetic projects')
+    bench_parser.add_argument('--sizes', type=str, default='10x20,100x50', help='Comma-separated INITIATIVESxTASKS sizes (default: 10x20,100x50)')
+    bench_parser.add_argument('--repeat', type=int, default=5, help='Timed runs per command after the cold run (default: 5)')
+    bench_parser.add_argument('--seed', type=int, default=0, help='Random seed of the generated projects (default: 0)')
+    bench_parser.add_argument('--density', type=float, default=0.3, help='Dependency density 0-1 (default: 0.3)')
+    bench_parser.add_argument('--agents', type=int, default=4, help='Agents in the generated projects (default: 4)')
+    bench_parser.add_argument('--output', type=Path, metavar='FILE', help='Write results as JSON')
+    bench_parser.add_argument('--baseline', type=Path, metavar='FILE', help='Compare against earlier results and fail on regressions')
+    bench_parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed median slowdown vs. baseline (default: 0.25)')
+    bench_parser.add_argument('--generate', type=Path, metavar='DIR', help='Only generate a project of the first size in DIR')
+    bench_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+    # Perf command
+    perf_parser = subparsers.add_parser('perf', help='Command latency recorded by every aipo run')
+    perf_subparsers = perf_parser.add_subparsers(dest='perf_command', required=True)
+    perf_report_parser = perf_subparsers.add_parser('report', help='Latency percentiles per command over time')
+    perf_report_parser.add_argument('--since', type=str, metavar='WHEN', help='Start of range: 1h, 24h, 7d or an ISO date')
+    perf_report_parser.add_argument('--bucket', type=str, default='1h', help='Time bucket for the trend table (default: 1h)')
+    perf_report_parser.add_argument('--json', action='store_true', help='Output JSON format')
+    perf_report_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
     # Swarm command
     swarm_parser = subparsers.add_parser('swarm', help='Manage swarm lifecycle')
     swarm_parser.add_argument('swarm_file', type=str, help='Path to swarm YAML file')
     swarm_parser.add_argument('--cancel', action='store_true', help='Cancel running swarm')
     swarm_parser.add_argument('--archive', action='store_true', help='Archive completed swarm')
     swarm_parser.add_argument('--activity', action='store_true', help='Analyze agent activity and parallelism')
+    swarm_parser.add_argument('--follow', action='store_true', help='With --activity, follow the live log and flag stalled agents')
+    swarm_parser.add_argument('--stall-factor', type=float, default=2.0, help='Flag agents running this many times past their expected task duration (default: 2.0)')
+    swarm_parser.add_argument('--on-stall', type=str, metavar='CMD', help='Shell command to run when an agent stalls (AIPO_STALL_* env vars)')
+    swarm_parser.add_argument('--export', type=str, metavar='DIR', help='With --activity, write work periods, concurrency and agent tables to DIR')
+    swarm_parser.add_argument('--export-format', choices=['csv', 'parquet', 'arrow'], default='csv', help='Export format (parquet/arrow need pyarrow)')
     swarm_parser.add_argument('--no-color', action='store_true', help='Disable colored output')
 
-    args = parser.parse_args()
+    return parser
 
-    # Disable colors if requested or not a TTY
-    if hasattr(args, 'no_color') and args.no_color or not sys.stdout.isatty():
-        Colors.disable()
 
-    # Execute command
+def _run(args) -> int:
+    """Import and run the selected command.
+
+    Command modules are imported here, after dispatch, so each invocation
+    only loads what its command needs.
+    """
     if args.command == 'init':
+        init_commands = _load('init', 'init_commands')
         return init_commands(run_swarm=args.run_swarm)
 
     elif args.command == 'status':
-        return status_command(output_json=args.json)
+        status_command = _load('status', 'status_command')
+        return status_command(output_json=args.json, changed_since=args.changed_since,
+                              if_changed=args.if_changed, record=not args.no_record)
 
     elif args.command == 'next':
+        next_command = _load('next', 'next_command')
         return next_command(
             show_all=args.all,
             initiative_dir=args.initiative_dir,
             agent=getattr(args, 'agent', None),
-            agent_initiatives=getattr(args, 'initiatives', None)
+            agent_initiatives=getattr(args, 'initiatives', None),
+            swarm_file=args.swarm
         )
 
     elif args.command == 'monitor':
-        return monitor_swarm(show_tasks=args.show_tasks, interactive=args.interactive)
+        monitor_swarm = _load('monitor', 'monitor_swarm')
+        return monitor_swarm(
+            show_tasks=args.show_tasks,
+            interactive=args.interactive,
+            stall_factor=args.stall_factor,
+            on_stall=args.on_stall,
+            record=not args.no_record
+        )
 
     elif args.command == 'validate':
-        if not args.swarm_file.exists():
-            print(f"{Colors.RED}❌ Error: Swarm file not found: {args.swarm_file}{Colors.NC}")
+        print_summary = _load('validate', 'print_summary')
+        validate_swarms = _load('validate', 'validate_swarms')
+        missing = [f for f in args.swarm_files if not f.exists()]
+        if missing:
+            for swarm_file in missing:
+                print(f"{Colors.RED}❌ Error: Swarm file not found: {swarm_file}{Colors.NC}")
             return 1
 
-        initiatives, blocking_errors, warnings = validate_swarm(args.swarm_file)
-        return print_summary(initiatives, blocking_errors, warnings, args.swarm_file)
+        initiatives, blocking_errors, warnings = validate_swarms(args.swarm_files, changed_since=args.changed_since,
+                                                               context_limit=args.context_limit)
+        return print_summary(initiatives, blocking_errors, warnings, args.swarm_files)
 
     elif args.command == 'check':
+        check_initiative = _load('check', 'check_initiative')
         return check_initiative(args.directory)
 
     elif args.command == 'list':
+        list_initiatives = _load('list', 'list_initiatives')
         return list_initiatives()
 
     elif args.command == 'unblock':
+        unblock_command = _load('unblock', 'unblock_command')
         return unblock_command()
 
+    elif args.command == 'graph':
+        graph_command = _load('graph', 'graph_command')
+        return graph_command(stats=args.stats, output_json=args.json)
+
+    elif args.command == 'history':
+        history_command = _load('history', 'history_command')
+        return history_command(
+            burndown=args.burndown,
+            velocity=args.velocity,
+            since=args.since,
+            initiative=args.initiative,
+            output_json=args.json
+        )
+
+    elif args.command == 'forecast':
+        forecast_command = _load('forecast', 'forecast_command')
+        return forecast_command(
+            iterations=args.iterations,
+            agents=args.agents,
+            seed=args.seed,
+            hours_per_day=args.hours_per_day,
+            output_json=args.json
+        )
+
+    elif args.command in ('complete', 'start', 'reopen'):
+        task_state_command = _load('task', 'task_state_command')
+        state = {'complete': 'completed', 'start': 'in_progress', 'reopen': 'pending'}[args.command]
+        return task_state_command(args.initiative, args.task_id, state)
+
+    elif args.command == 'apply':
+        apply_command = _load('apply', 'apply_command')
+        return apply_command(args.changes_file, dry_run=args.dry_run)
+
+    elif args.command == 'query':
+        query_command = _load('query', 'query_command')
+        return query_command(' '.join(args.query), output_json=args.json, count=args.count,
+                             initiatives=args.initiatives)
+
+    elif args.command == 'search':
+        search_command = _load('search', 'search_command')
+        return search_command(' '.join(args.query), limit=args.limit, output_json=args.json)
+
+    elif args.command == 'context':
+        context_command = _load('context', 'context_command')
+        return context_command(args.initiative, args.task_id, budget=args.budget, output_json=args.json)
+
+    elif args.command == 'tokens':
+        tokens_command = _load('tokens', 'tokens_command')
+        return tokens_command(module_budget=args.budget, top=args.top, sections=args.sections,
+                              output_json=args.json)
+
+    elif args.command == 'sync-state':
+        sync_state_command = _load('sync_state', 'sync_state_command')
+        return sync_state_command(check=args.check, output_json=args.json)
+
+    elif args.command == 'archive-initiatives':
+        archive_initiatives_command = _load('archive', 'archive_initiatives_command')
+        return archive_initiatives_command(dry_run=args.dry_run, restore=args.restore)
+
+    elif args.command == 'bench':
+        from .bench import parse_size
+        bench_command = _load('bench', 'bench_command')
+        try:
+            sizes = [parse_size(size) for size in args.sizes.split(',')]
+        except ValueError as e:
+            print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+            return 1
+        return bench_command(
+            sizes=sizes,
+            repeat=args.repeat,
+            seed=args.seed,
+            density=args.density,
+            agents=args.agents,
+            output=args.output,
+            baseline=args.baseline,
+            tolerance=args.tolerance,
+            generate=args.generate
+        )
+
+    elif args.command == 'perf':
+        perf_report_command = _load('perf', 'perf_report_command')
+        return perf_report_command(since=args.since, bucket=args.bucket, output_json=args.json)
+
     elif args.command == 'swarm':
-        return swarm_command(args.swarm_file, cancel=args.cancel, archive=args.archive, activity=args.activity)
+        swarm_command = _load('swarm', 'swarm_command')
+        return swarm_command(
+            args.swarm_file,
+            cancel=args.cancel,
+            archive=args.archive,
+            activity=args.activity,
+            export_dir=args.export,
+            export_format=args.export_format,
+            follow=args.follow,
+            stall_factor=args.stall_factor,
+            on_stall=args.on_stall
+        )
 
-    else:
-        parser.print_help()
-        return 1
+    return 1
 
@@ -1,24 +1,49 @@
-"""Command implementations for AIPO."""
-
-from .init import init_commands
-from .monitor import monitor_swarm
-from .validate import validate_swarm
-from .check import check_initiative
-from .list import list_initiatives
-from .status import status_command
-from .next import next_command
-from .unblock import unblock_command
-from .swarm import swarm_command
-
-__all__ = [
-    'init_commands',
-    'monitor_swarm',
-    'validate_swarm',
-    'check_initiative',
-    'list_initiatives',
-    'status_command',
-    'next_command',
-    'unblock_command',
-    'swarm_command',
-]
+"""Command implementations for AIPO.
 
+Command modules are imported on first use, so running one command does
+not pay for the imports of all the others.
+"""
+
+import importlib
+
+# Public name -> submodule defining it
+_COMMANDS = {
+    'init_commands': 'init',
+    'monitor_swarm': 'monitor',
+    'validate_swarm': 'validate',
+    'validate_swarms': 'validate',
+    'check_initiative': 'check',
+    'list_initiatives': 'list',
+    'status_command': 'status',
+    'next_command': 'next',
+    'unblock_command': 'unblock',
+    'swarm_command': 'swarm',
+    'graph_command': 'graph',
+    'history_command': 'history',
+    'forecast_command': 'forecast',
+    'task_state_command': 'task',
+    'apply_command': 'apply',
+    'archive_initiatives_command': 'archive',
+    'bench_command': 'bench',
+    'perf_report_command': 'perf',
+    'query_command': 'query',
+    'search_command': 'search',
+    'context_command': 'context',
+    'tokens_command': 'tokens',
+    'sync_state_command': 'sync_state',
+}
+
+__all__ = list(_COMMANDS)
+
+
+def __getattr__(name: str):
+    module = _COMMANDS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,65 @@
+"""Apply command - transactional batch edits of tasks.prd files."""
+
+import json
+import sys
+from pathlib import Path
+
+from ..prd import apply_changes
+from ..utils import Colors
+
+
+def apply_command(changes_file: Path, base_path: Path = Path("."), dry_run: bool = False) -> int:
+    """Apply a JSON batch of task state, Agent and Swarm edits all-or-nothing.
+
+    The file holds a list of changes (or ``{"changes": [...]}``), e.g.::
+
+        [{"initiative": "0003", "task": "TASK-004", "state": "completed"},
+         {"initiative": "0003", "task": "TASK-005", "agent": "backend_2"},
+         {"initiative": "0004", "swarm": "api-swarm.yml"}]
+
+    Args:
+        changes_file: Path to the JSON changes file ("-" for stdin)
+        base_path: Project base path
+        dry_run: Validate and report without writing
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    try:
+        if str(changes_file) == "-":
+            data = json.load(sys.stdin)
+        else:
+            with open(changes_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"{Colors.RED}❌ Error: Cannot read changes from {changes_file}: {e}{Colors.NC}")
+        return 1
+
+    changes = data.get('changes') if isinstance(data, dict) else data
+    if not isinstance(changes, list):
+        print(f"{Colors.RED}❌ Error: Expected a list of changes{Colors.NC}")
+        return 1
+
+    try:
+        counts = apply_changes(changes, base_path, dry_run=dry_run)
+    except ValueError as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        print(f"{Colors.YELLOW}No files were modified{Colors.NC}")
+        return 1
+    except OSError as e:
+        print(f"{Colors.RED}❌ Error writing changes: {e}{Colors.NC}")
+        print(f"{Colors.YELLOW}💡 Any committed batch is completed by the next aipo apply/complete{Colors.NC}")
+        return 1
+
+    verb = "Would update" if dry_run else "Updated"
+    for tasks_file, count in sorted(counts.items()):
+        print(f"{Colors.GREEN}✓{Colors.NC} {verb} {tasks_file.parent.name}/tasks.prd ({count} change(s))")
+
+    if not counts:
+        print(f"{Colors.DIM}Nothing to change - all {len(changes)} change(s) already applied{Colors.NC}")
+    elif dry_run:
+        print(f"{Colors.YELLOW}Dry run: {sum(counts.values())} change(s) in {len(counts)} file(s) validated, nothing written{Colors.NC}")
+    else:
+        print(f"{Colors.GREEN}✅ Applied {sum(counts.values())} change(s) to {len(counts)} file(s){Colors.NC}")
+
+    return 0
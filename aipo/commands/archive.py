@@ -0,0 +1,72 @@
+"""Archive-initiatives command - move finished initiatives to cold storage."""
+
+from pathlib import Path
+from typing import Optional
+
+from ..archive import ARCHIVE_DIR, PACK_NAME, archive_candidates, archive_initiatives, restore_initiative
+from ..core import get_all_initiatives
+from ..utils import Colors
+
+
+def archive_initiatives_command(base_path: Path = Path("."), dry_run: bool = False,
+                                restore: Optional[str] = None) -> int:
+    """Pack completed and cancelled initiatives into the archive.
+
+    Args:
+        base_path: Base path to search from
+        dry_run: Only list what would be archived
+        restore: Initiative name or ID to unpack instead
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    if restore:
+        try:
+            name = restore_initiative(restore, base_path)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.RED}❌ Error restoring {restore}: {e}{Colors.NC}")
+            return 1
+        if name is None:
+            print(f"{Colors.RED}❌ Error: {restore} is not archived{Colors.NC}")
+            return 1
+        print(f"{Colors.GREEN}✓{Colors.NC} Restored ai-project/initiatives/{name}")
+        return 0
+
+    initiatives_dir = base_path / "ai-project" / "initiatives"
+    if not initiatives_dir.exists():
+        print(f"{Colors.RED}❌ Error: ai-project/initiatives/ not found{Colors.NC}")
+        return 1
+
+    print(f"{Colors.BOLD}📦 Archiving Finished Initiatives{Colors.NC}")
+    print()
+
+    archivable, skipped = archive_candidates(get_all_initiatives(base_path))
+
+    for init in skipped:
+        print(f"{Colors.YELLOW}⚠️  Skipping {init.name}: still bound to swarm {init.swarm} "
+              f"(run: aipo swarm {init.swarm} --archive){Colors.NC}")
+    if skipped:
+        print()
+
+    if not archivable:
+        print(f"{Colors.GREEN}✅ Nothing to archive - no finished initiatives outside the archive{Colors.NC}")
+        return 0
+
+    for init in archivable:
+        state = "cancelled" if init.is_cancelled else f"completed {init.ended_at}"
+        print(f"  • {init.name} ({init.completed_count}/{init.task_count} tasks, {state})")
+    print()
+
+    if dry_run:
+        print(f"{Colors.YELLOW}Dry run: {len(archivable)} initiative(s) would be archived{Colors.NC}")
+        return 0
+
+    try:
+        archive_initiatives(archivable, base_path)
+    except (OSError, ValueError) as e:
+        print(f"{Colors.RED}❌ Error archiving initiatives: {e}{Colors.NC}")
+        return 1
+
+    print(f"{Colors.GREEN}✅ Archived {len(archivable)} initiative(s) to {ARCHIVE_DIR / PACK_NAME}{Colors.NC}")
+    print(f"{Colors.DIM}Restore one with: aipo archive-initiatives --restore <id>{Colors.NC}")
+    return 0
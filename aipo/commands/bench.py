@@ -0,0 +1,119 @@
+"""Bench command - time aipo on generated projects and catch regressions."""
+
+import json
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+from ..bench import (
+    DEFAULT_SIZES,
+    DEFAULT_TOLERANCE,
+    IMPORT_BUDGET_MS,
+    compare_results,
+    generate_project,
+    import_time_ms,
+    results_payload,
+    run_benchmarks,
+)
+from ..utils import Colors
+
+
+def bench_command(
+    sizes: Sequence[Tuple[int, int]] = DEFAULT_SIZES,
+    repeat: int = 5,
+    seed: int = 0,
+    density: float = 0.3,
+    agents: int = 4,
+    output: Optional[Path] = None,
+    baseline: Optional[Path] = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    generate: Optional[Path] = None
+) -> int:
+    """Run the benchmark suite, or only generate a synthetic project.
+
+    Args:
+        sizes: (initiatives, tasks per initiative) pairs to benchmark
+        repeat: Timed runs per command after the cold-cache run
+        seed: Random seed of the generated projects
+        density: Dependency density of the generated projects (0-1)
+        agents: Agents in the generated projects
+        output: Write the results as JSON to this file
+        baseline: Earlier results file to compare medians against
+        tolerance: Allowed relative slowdown before a regression is reported
+        generate: Only write a project of the first size to this directory
+
+    Returns:
+        Exit code (0 for success, 1 for regressions, import budget overruns or errors)
+    """
+    if generate:
+        initiatives, tasks = sizes[0]
+        project = generate_project(generate, initiatives, tasks, density=density, agents=agents, seed=seed)
+        print(f"{Colors.GREEN}✓{Colors.NC} Generated {initiatives} initiative(s) x {tasks} task(s) in {project.root}")
+        print(f"  Swarm file: {project.swarm_file.name}")
+        print(f"  Session log: HOME={project.home} (agents: {', '.join(project.agents)})")
+        return 0
+
+    baseline_data = None
+    if baseline:
+        try:
+            with open(baseline, 'r', encoding='utf-8') as f:
+                baseline_data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.RED}❌ Error: Cannot read baseline {baseline}: {e}{Colors.NC}")
+            return 1
+
+    print(f"{Colors.BOLD}⏱️  AIPO Benchmark{Colors.NC}")
+    print(f"{Colors.DIM}seed {seed}, density {density}, {agents} agents, {repeat} run(s) per command "
+          f"after a cold-cache run{Colors.NC}")
+    print()
+    print(f"{'Size':<10}{'Command':<24}{'Median':>10}{'Min':>10}{'Cold':>10}")
+
+    def report(timing):
+        print(f"{timing.size:<10}{timing.command:<24}{timing.median_ms:>8.1f}ms"
+              f"{timing.min_ms:>8.1f}ms{timing.first_ms:>8.1f}ms")
+
+    try:
+        timings = run_benchmarks(sizes, repeat=repeat, density=density, agents=agents, seed=seed,
+                                 progress=report)
+    except RuntimeError as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        return 1
+
+    failed = False
+    try:
+        import_ms = import_time_ms()
+    except RuntimeError as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        return 1
+    print()
+    if import_ms > IMPORT_BUDGET_MS:
+        failed = True
+        print(f"{Colors.RED}❌ Import time {import_ms:.1f}ms exceeds the {IMPORT_BUDGET_MS:.0f}ms budget "
+              f"(python -X importtime -c 'import aipo.cli, aipo.commands.next'){Colors.NC}")
+    else:
+        print(f"{Colors.GREEN}✓{Colors.NC} Import time {import_ms:.1f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)")
+
+    payload = results_payload(timings, import_ms, seed=seed, density=density, agents=agents)
+
+    if baseline_data is not None:
+        rows = compare_results(payload, baseline_data, tolerance)
+        regressions = [row for row in rows if row[4]]
+        print()
+        print(f"{Colors.BOLD}Compared with {baseline} (tolerance {tolerance:.0%}):{Colors.NC}")
+        for size, command, before, after, regressed in rows:
+            change = (after - before) / before * 100 if before else 0.0
+            color = Colors.RED if regressed else Colors.GREEN if change < 0 else ""
+            mark = "❌" if regressed else "✓"
+            print(f"  {mark} {size:<10}{command:<24}{before:>8.1f}ms → {after:>8.1f}ms "
+                  f"{color}{change:+.0f}%{Colors.NC}")
+        if not rows:
+            print(f"{Colors.YELLOW}  No sizes/commands in common with the baseline{Colors.NC}")
+        if regressions:
+            failed = True
+            print(f"{Colors.RED}❌ {len(regressions)} regression(s){Colors.NC}")
+
+    if output:
+        output.write_text(json.dumps(payload, indent=2) + "\n")
+        print()
+        print(f"Results written to {output}")
+
+    return 1 if failed else 0
@@ -0,0 +1,60 @@
+"""Context command - print a token-budgeted context pack for one task."""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from ..utils import Colors
+
+
+def context_command(
+    initiative: str,
+    task_id: str,
+    base_path: Path = Path("."),
+    budget: int = 1500,
+    output_json: bool = False
+) -> int:
+    """Print the task, its dependencies and the relevant PRD sections within a token budget.
+
+    The pack is plain markdown so agents can read it instead of whole
+    tasks.prd, description.prd and project-state.prd files.
+
+    Args:
+        initiative: Initiative directory, name or ID
+        task_id: Task ID (e.g. "TASK-004")
+        base_path: Base path to search from
+        budget: Token budget of the pack
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    from ..context import build_context
+
+    if budget < 1:
+        print(f"{Colors.RED}❌ Error: --budget must be positive{Colors.NC}")
+        return 1
+    try:
+        pack = build_context(initiative, task_id, base_path, budget)
+    except (ValueError, OSError) as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        return 1
+
+    if output_json:
+        print(json.dumps({
+            "initiative": pack.initiative,
+            "task": pack.task_id,
+            "budget": pack.budget,
+            "tokens": pack.tokens,
+            "cached": pack.cached,
+            "parts": [asdict(part) for part in pack.parts],
+            "text": pack.render(),
+        }, indent=2))
+        return 0
+
+    print(pack.render(), end="")
+    trimmed = sum(1 for part in pack.parts if part.trimmed)
+    note = f", {trimmed} part(s) trimmed" if trimmed else ""
+    print(f"\n<!-- aipo context: ~{pack.tokens}/{pack.budget} tokens{note}"
+          f"{', cached' if pack.cached else ''} -->")
+    return 0
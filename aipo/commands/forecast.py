@@ -0,0 +1,125 @@
+"""Forecast command - Monte Carlo completion dates."""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..core import get_all_initiatives
+from ..forecast import DEFAULT_ITERATIONS, HOURS_PER_DAY, PERCENTILES, forecast, historical_ratios, task_estimates
+from ..graph import build_task_graph, load_tasks
+from ..profiling import phase
+from ..utils import Colors, format_time_estimate
+from .graph import print_cycles
+
+
+# Initiatives finishing by **Target Date** in fewer runs than this are flagged
+ON_TIME_THRESHOLD = 0.5
+
+
+def forecast_command(
+    base_path: Path = Path("."),
+    iterations: int = DEFAULT_ITERATIONS,
+    agents: Optional[int] = None,
+    seed: Optional[int] = None,
+    hours_per_day: float = HOURS_PER_DAY,
+    output_json: bool = False
+) -> int:
+    """Forecast completion dates of the remaining work.
+
+    Args:
+        base_path: Base path to search from
+        iterations: Number of simulated completions
+        agents: Concurrent agents bounding overall throughput (None = unbounded)
+        seed: Random seed for reproducible forecasts
+        hours_per_day: Working hours per calendar day
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 for success, 1 for error or likely missed target dates)
+    """
+    initiatives = [i for i in get_all_initiatives(base_path) if not i.is_completed and not i.is_cancelled]
+
+    if not initiatives:
+        if output_json:
+            print(json.dumps({"error": "No open initiatives found"}, indent=2))
+        else:
+            print(f"{Colors.YELLOW}⚠️  No open initiatives to forecast{Colors.NC}")
+        return 1
+
+    tasks = load_tasks(initiatives)
+    graph = build_task_graph(initiatives, tasks)
+    cycles = graph.cycles()
+    if cycles:
+        print_cycles(cycles, "task")
+        return 1
+
+    ratios = historical_ratios(task_estimates(initiatives, tasks))
+
+    phase("simulate")
+    started = time.perf_counter()
+    result = forecast(initiatives, tasks, graph, iterations=iterations, agents=agents,
+                      ratios=ratios, seed=seed, hours_per_day=hours_per_day)
+    elapsed = time.perf_counter() - started
+    phase("render")
+
+    target_dates = {i.name: i.target_date for i in initiatives}
+    at_risk = sorted(name for name, p in result.on_time.items() if p < ON_TIME_THRESHOLD)
+
+    if output_json:
+        def dates(percentiles):
+            return {f"p{q}": result.finish_date(h).date().isoformat() for q, h in percentiles.items()}
+
+        data = {
+            "iterations": result.iterations,
+            "engine": result.engine,
+            "duration_model": result.ratio_source,
+            "remaining_tasks": result.remaining_tasks,
+            "overall": dates(result.overall),
+            "initiatives": [
+                {
+                    "name": name,
+                    **dates(percentiles),
+                    "target_date": target_dates.get(name),
+                    "on_time_probability": round(result.on_time[name], 3) if name in result.on_time else None,
+                }
+                for name, percentiles in result.initiatives.items()
+            ],
+            "at_risk": at_risk,
+        }
+        print(json.dumps(data, indent=2))
+        return 1 if at_risk else 0
+
+    print(f"{Colors.BOLD}🔮 Completion Forecast{Colors.NC}")
+    print(f"{Colors.DIM}{result.iterations} simulations of {result.remaining_tasks} remaining task(s) "
+          f"in {elapsed:.2f}s ({result.engine}), durations from {result.ratio_source}{Colors.NC}")
+    print()
+
+    header = "  ".join(f"P{q:<10}" for q in PERCENTILES)
+    print(f"{'Initiative':<32}{header}Target")
+    for name, percentiles in result.initiatives.items():
+        cells = "  ".join(f"{result.finish_date(percentiles[q]).strftime('%Y-%m-%d'):<11}" for q in PERCENTILES)
+        target = target_dates.get(name) or "-"
+        if name in result.on_time:
+            probability = result.on_time[name]
+            color = Colors.RED if probability < ON_TIME_THRESHOLD else Colors.GREEN
+            target = f"{color}{target} ({probability:.0%} on time){Colors.NC}"
+        print(f"{name[:31]:<32}{cells}{target}")
+    print()
+
+    overall = result.overall
+    print(f"{Colors.BOLD}Overall:{Colors.NC} " + ", ".join(
+        f"P{q} {result.finish_date(overall[q]).strftime('%Y-%m-%d')} (~{format_time_estimate(overall[q])})"
+        for q in PERCENTILES))
+    if agents:
+        print(f"{Colors.DIM}Bounded by {agents} concurrent agent(s){Colors.NC}")
+    print()
+
+    if at_risk:
+        print(f"{Colors.RED}⚠️  Likely to miss **Target Date** ({len(at_risk)}):{Colors.NC}")
+        for name in at_risk:
+            print(f"  • {name}: target {target_dates[name]}, P85 {result.finish_date(result.initiatives[name][85]).strftime('%Y-%m-%d')}")
+        print()
+        return 1
+
+    return 0
@@ -0,0 +1,102 @@
+"""Graph command - dependency graph analysis."""
+
+import json
+from pathlib import Path
+from typing import List
+
+from ..core import get_all_initiatives
+from ..graph import DependencyGraph, build_initiative_graph, build_task_graph
+from ..profiling import phase
+from ..utils import Colors
+
+
+def graph_command(base_path: Path = Path("."), stats: bool = False, output_json: bool = False) -> int:
+    """Analyze initiative and task dependency graphs.
+
+    Args:
+        base_path: Base path to search from
+        stats: Whether to show graph statistics instead of execution waves
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 for success, 1 for cycles or error)
+    """
+    initiatives = get_all_initiatives(base_path)
+
+    if not initiatives:
+        if output_json:
+            print(json.dumps({"error": "No initiatives found"}, indent=2))
+        else:
+            print(f"{Colors.RED}❌ No initiatives found{Colors.NC}")
+        return 1
+
+    initiative_graph = build_initiative_graph(initiatives)
+    task_graph = build_task_graph(initiatives)
+    has_cycles = bool(initiative_graph.cycles() or task_graph.cycles())
+    phase("render")
+
+    if output_json:
+        data = {
+            "initiatives": _graph_data(initiative_graph),
+            "tasks": _graph_data(task_graph),
+        }
+        print(json.dumps(data, indent=2))
+        return 1 if has_cycles else 0
+
+    if stats:
+        print(f"{Colors.BOLD}📈 Dependency Graph Statistics{Colors.NC}")
+        print()
+        _print_stats("Initiatives", initiative_graph)
+        _print_stats("Tasks", task_graph)
+    else:
+        print(f"{Colors.BOLD}🌊 Initiative Execution Waves{Colors.NC}")
+        print()
+        names = {i.id: i.name for i in initiatives}
+        for number, wave in enumerate(initiative_graph.waves(), 1):
+            print(f"Wave {number} ({len(wave)}): {', '.join(names[node] for node in wave)}")
+        print()
+
+    print_cycles(initiative_graph.cycles(), "initiative")
+    print_cycles(task_graph.cycles(), "task")
+
+    return 1 if has_cycles else 0
+
+
+def print_cycles(cycles: List[List[str]], kind: str) -> None:
+    """Print dependency cycles.
+
+    Args:
+        cycles: Node lists, one per cycle
+        kind: Node kind for the heading ("initiative" or "task")
+    """
+    if not cycles:
+        return
+    print(f"{Colors.RED}🔁 {len(cycles)} {kind} dependency cycle(s) - these can never start:{Colors.NC}")
+    for cycle in cycles:
+        print(f"  ✗ {' ⇄ '.join(cycle)}")
+    print()
+
+
+def _print_stats(label: str, graph: DependencyGraph) -> None:
+    """Print statistics of one graph."""
+    stats = graph.stats()
+    print(f"{Colors.BOLD}{label}:{Colors.NC}")
+    print(f"  Nodes: {stats['nodes']}  Edges: {stats['edges']}")
+    print(f"  Depth: {stats['depth']} wave(s) minimum")
+    print(f"  Width: {stats['width']} (maximum useful parallelism)")
+    if stats['missing_dependencies']:
+        print(f"  {Colors.YELLOW}Unknown dependencies: {stats['missing_dependencies']}{Colors.NC}")
+    if stats['cycles']:
+        print(f"  {Colors.RED}Cycles: {stats['cycles']} ({stats['nodes_in_cycles']} nodes){Colors.NC}")
+    else:
+        print(f"  {Colors.GREEN}Cycles: none{Colors.NC}")
+    print()
+
+
+def _graph_data(graph: DependencyGraph) -> dict:
+    """JSON-compatible summary of one graph."""
+    data = graph.stats()
+    data["waves"] = graph.waves()
+    data["cycle_members"] = graph.cycles()
+    data["unknown"] = graph.missing
+    return data
@@ -0,0 +1,133 @@
+"""History command - burn-down and velocity from recorded snapshots."""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ..history import HistoryStore, parse_since
+from ..profiling import phase
+from ..utils import Colors
+
+
+# Rows shown in the burn-down chart
+BURNDOWN_ROWS = 12
+
+
+def history_command(
+    base_path: Path = Path("."),
+    burndown: bool = False,
+    velocity: bool = False,
+    since: Optional[str] = None,
+    initiative: Optional[str] = None,
+    output_json: bool = False
+) -> int:
+    """Show progress history recorded by status and monitor.
+
+    Args:
+        base_path: Base path to search from
+        burndown: Whether to show the burn-down of remaining tasks
+        velocity: Whether to show tasks/hour by initiative and agent
+        since: Start of the range ("24h", "7d", ISO date); defaults to all history
+        initiative: Restrict the burn-down to one initiative directory name
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    if not burndown and not velocity:
+        burndown = velocity = True
+
+    try:
+        since_ts = parse_since(since) if since else None
+    except ValueError:
+        print(f"{Colors.RED}❌ Invalid --since value: {since} (use e.g. 24h, 7d or 2025-01-31){Colors.NC}")
+        return 1
+
+    store = HistoryStore(base_path)
+    if not store.exists:
+        if output_json:
+            print(json.dumps({"error": "No history recorded"}, indent=2))
+        else:
+            print(f"{Colors.YELLOW}⚠️  No history recorded yet{Colors.NC}")
+            print(f"{Colors.DIM}Snapshots are recorded whenever 'aipo status' or 'aipo monitor' (without --no-record) sees a change{Colors.NC}")
+        return 1
+
+    try:
+        count, first_ts, last_ts = store.span()
+        rows = store.burndown(since_ts, initiative=initiative) if burndown else []
+        by_initiative = store.velocity(since_ts, by="initiative") if velocity else []
+        by_agent = store.velocity(since_ts, by="agent") if velocity else []
+    finally:
+        store.close()
+
+    phase("render")
+    if output_json:
+        data = {
+            "snapshots": count,
+            "first": _iso(first_ts),
+            "last": _iso(last_ts),
+        }
+        if burndown:
+            data["burndown"] = [
+                {"time": _iso(ts), "total": total, "completed": completed, "remaining": total - completed}
+                for ts, total, completed in rows
+            ]
+        if velocity:
+            data["velocity"] = {
+                "initiatives": [{"name": n, "completed": c, "tasks_per_hour": round(r, 3)} for n, c, r in by_initiative],
+                "agents": [{"name": n, "completed": c, "tasks_per_hour": round(r, 3)} for n, c, r in by_agent],
+            }
+        print(json.dumps(data, indent=2))
+        return 0
+
+    print(f"{Colors.BOLD}📈 Progress History{Colors.NC}")
+    print(f"{Colors.DIM}{count} snapshot(s) from {_format_time(first_ts)} to {_format_time(last_ts)}{Colors.NC}")
+    print()
+
+    if burndown:
+        title = f"Burn-down: {initiative}" if initiative else "Burn-down"
+        print(f"{Colors.BOLD}{title}{Colors.NC}")
+        if rows:
+            _print_burndown(rows)
+        else:
+            print("  No snapshots in range")
+        print()
+
+    if velocity:
+        print(f"{Colors.BOLD}Velocity (tasks/hour){Colors.NC}")
+        if not by_initiative and not by_agent:
+            print("  No tasks completed in range")
+        for label, velocity_rows in (("By initiative", by_initiative), ("By agent", by_agent)):
+            if velocity_rows:
+                print(f"  {label}:")
+                for name, completed, rate in velocity_rows:
+                    print(f"    • {name}: {rate:.2f}/h ({completed} task(s))")
+        print()
+
+    return 0
+
+
+def _print_burndown(rows: List[Tuple[float, int, int]], width: int = 30) -> None:
+    """Print remaining tasks over time, one bar per time bucket."""
+    start, end = rows[0][0], rows[-1][0]
+    step = (end - start) / BURNDOWN_ROWS if end > start else 1
+
+    # Last snapshot of each bucket
+    buckets = {}
+    for ts, total, completed in rows:
+        buckets[min(int((ts - start) / step), BURNDOWN_ROWS - 1)] = (ts, total - completed)
+
+    peak = max(remaining for _, remaining in buckets.values()) or 1
+    for _, (ts, remaining) in sorted(buckets.items()):
+        bar = "█" * round(width * remaining / peak)
+        print(f"  {_format_time(ts)}  {bar:<{width}} {remaining} remaining")
+
+
+def _format_time(ts: Optional[float]) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M") if ts else "-"
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(ts).isoformat(timespec="seconds") if ts else None
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from ..core import get_all_initiatives
+from ..profiling import phase
 from ..models import Status
 from ..utils import Colors
 
@@ -29,12 +30,15 @@ def list_initiatives(base_path: Path = Path(".")) -> int:
         print("No initiatives found")
         return 0
 
+    phase("render")
     print(f"{Colors.BOLD}Initiatives:{Colors.NC}")
     print()
 
     for initiative in initiatives:
         # Determine status emoji
-        if initiative.status == Status.READY:
+        if initiative.archived:
+            emoji = "📦"
+        elif initiative.status == Status.READY:
             emoji = "✅"
         elif initiative.status == Status.WARNING:
             emoji = "⚠️ "
@@ -49,7 +53,8 @@ def list_initiatives(base_path: Path = Path(".")) -> int:
         else:
             tasks_info = f"({initiative.task_count} tasks)"
 
-        print(f"  {emoji} {initiative.name} {tasks_info}")
+        archived = f" {Colors.DIM}(archived){Colors.NC}" if initiative.archived else ""
+        print(f"  {emoji} {initiative.name} {tasks_info}{archived}")
 
     return 0
 
@@ -5,26 +5,74 @@ import sys
 import time
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional
 
-from ..core import get_all_initiatives, categorize_initiatives
+from ..activity import find_latest_session, find_session_log
+from ..core import get_all_initiatives, categorize_initiatives, project_fingerprint
+from ..history import record_snapshot
+from ..profiling import phase
+from ..stall import DEFAULT_STALL_FACTOR, StallDetector, StalledAgent
 from ..utils import Colors, create_progress_bar, extract_tasks
 
 
-def monitor_swarm(base_path: Path = Path("."), show_tasks: bool = False, interactive: bool = False) -> int:
+def monitor_swarm(
+    base_path: Path = Path("."),
+    show_tasks: bool = False,
+    interactive: bool = False,
+    stall_factor: float = DEFAULT_STALL_FACTOR,
+    on_stall: Optional[str] = None,
+    record: bool = True
+) -> int:
     """Monitor current swarm status deterministically without LLM.
     
     Args:
         base_path: Base path to search from
         show_tasks: Whether to show detailed task information
         interactive: Whether to run in interactive mode with auto-refresh
+        stall_factor: Flag agents whose open task runs this many times past its baseline
+        on_stall: Shell command to run once per newly stalled agent
+        record: Whether to append a history snapshot when the project changed
+            (False keeps the run read-only)
         
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    detector = _create_stall_detector(base_path, stall_factor, on_stall)
     if interactive:
-        return _interactive_monitor(base_path, show_tasks)
+        return _interactive_monitor(base_path, show_tasks, detector=detector, record=record)
     else:
-        return _single_monitor(base_path, show_tasks)
+        return _single_monitor(base_path, show_tasks, detector=detector, record=record)
+
+
+def _create_stall_detector(base_path: Path, stall_factor: float, on_stall: Optional[str]) -> Optional[StallDetector]:
+    """Create a stall detector for the latest swarm session, if there is one."""
+    session_path = find_latest_session()
+    log_file = find_session_log(session_path) if session_path else None
+    if not log_file:
+        return None
+    return StallDetector(log_file, base_path, factor=stall_factor, hook=on_stall)
+
+
+def print_stall_report(stalled: List[StalledAgent], orphaned: List[str]) -> None:
+    """Print stalled agents and in-progress tasks with no open work period.
+    
+    Args:
+        stalled: Agents past their stall threshold
+        orphaned: In-progress task keys not being worked on in the log
+    """
+    if stalled:
+        print(f"{Colors.BOLD}{Colors.RED}⏱  Stalled Agents ({len(stalled)}):{Colors.NC}")
+        for item in stalled:
+            print(f"  {Colors.RED}●{Colors.NC} {item.agent}: {item.task or '(unknown task)'} "
+                  f"running {item.elapsed_minutes:.0f}m (threshold {item.threshold_minutes:.0f}m)")
+            print(f"    {Colors.DIM}since {item.started.strftime('%H:%M:%S')}, {item.baseline}{Colors.NC}")
+        print()
+    
+    if orphaned:
+        print(f"{Colors.BOLD}{Colors.YELLOW}👻 In Progress Without Active Agent ({len(orphaned)}):{Colors.NC}")
+        for key in orphaned:
+            print(f"  {Colors.YELLOW}○{Colors.NC} {key}")
+        print()
 
 
 def _clear_screen():
@@ -32,13 +80,16 @@ def _clear_screen():
     os.system('clear' if os.name == 'posix' else 'cls')
 
 
-def _interactive_monitor(base_path: Path, show_tasks: bool, refresh_interval: int = 5) -> int:
+def _interactive_monitor(base_path: Path, show_tasks: bool, refresh_interval: int = 5,
+                         detector: Optional[StallDetector] = None, record: bool = True) -> int:
     """Run monitor in interactive mode with auto-refresh.
     
     Args:
         base_path: Base path to search from
         show_tasks: Whether to show detailed task information
         refresh_interval: Seconds between refreshes
+        detector: Stall detector reused across refreshes (reads only new log lines)
+        record: Whether to append history snapshots
         
     Returns:
         Exit code (0 for success, 1 for error)
@@ -57,7 +108,8 @@ def _interactive_monitor(base_path: Path, show_tasks: bool, refresh_interval: in
             print()
             
             # Run the monitor logic
-            result = _single_monitor(base_path, show_tasks, suppress_header=True)
+            result = _single_monitor(base_path, show_tasks, suppress_header=True, detector=detector,
+                                     record=record)
             
             if result != 0:
                 # If there's an error, don't keep looping
@@ -72,13 +124,16 @@ def _interactive_monitor(base_path: Path, show_tasks: bool, refresh_interval: in
         return 0
 
 
-def _single_monitor(base_path: Path, show_tasks: bool, suppress_header: bool = False) -> int:
+def _single_monitor(base_path: Path, show_tasks: bool, suppress_header: bool = False,
+                    detector: Optional[StallDetector] = None, record: bool = True) -> int:
     """Run monitor once (non-interactive).
     
     Args:
         base_path: Base path to search from
         show_tasks: Whether to show detailed task information
         suppress_header: Whether to suppress the header (for interactive mode)
+        detector: Stall detector for the running swarm session, if any
+        record: Whether to append a history snapshot if the project changed
         
     Returns:
         Exit code (0 for success, 1 for error)
@@ -99,16 +154,21 @@ def _single_monitor(base_path: Path, show_tasks: bool, suppress_header: bool = F
         return 1
     
     # Get all initiatives
+    fingerprint = project_fingerprint(base_path)
     initiatives = get_all_initiatives(base_path)
     
     if not initiatives:
         print(f"{Colors.YELLOW}⚠️  No initiatives found{Colors.NC}")
         return 0
     
+    if record:
+        record_snapshot(base_path, initiatives, fingerprint)
+    
     # Categorize initiatives
     active, completed, not_started, cancelled = categorize_initiatives(initiatives)
     
     # Print summary
+    phase("render")
     total = len(initiatives)
     print(f"{Colors.BOLD}Overview:{Colors.NC}")
     print(f"  Total initiatives: {total}")
@@ -119,6 +179,11 @@ def _single_monitor(base_path: Path, show_tasks: bool, suppress_header: bool = F
         print(f"  {Colors.RED}✗ Cancelled: {len(cancelled)}{Colors.NC}")
     print()
     
+    # Stalled agents and runaway tasks
+    if detector:
+        stalled, orphaned = detector.check()
+        print_stall_report(stalled, orphaned)
+    
     # Show active initiatives in detail
     if active:
         print(f"{Colors.BOLD}🔄 Active Initiatives:{Colors.NC}")
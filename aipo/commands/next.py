@@ -3,8 +3,11 @@
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+from ..archive import archived_message
 from ..core import get_all_initiatives, categorize_initiatives
 from ..models import Initiative, Task
+from ..project import next_in_group_order
+from ..swarm_config import load_swarm_config
 from ..utils import Colors, extract_tasks
 
 
@@ -13,7 +16,8 @@ def next_command(
     show_all: bool = False,
     initiative_dir: Optional[str] = None,
     agent: Optional[str] = None,
-    agent_initiatives: Optional[str] = None
+    agent_initiatives: Optional[str] = None,
+    swarm_file: Optional[str] = None
 ) -> int:
     """Intelligently suggest next task to work on.
     
@@ -23,13 +27,14 @@ def next_command(
         initiative_dir: Specific initiative directory to check
         agent: Agent name (for swarm coordination)
         agent_initiatives: Comma-separated list of initiative dirs assigned to agent
+        swarm_file: Swarm file restricting agent mode to its initiatives
         
     Returns:
         Exit code (0 for success, 1 for error)
     """
     # Handle agent mode (for swarm coordination)
     if agent:
-        return _next_for_agent(base_path, agent, agent_initiatives)
+        return _next_for_agent(base_path, agent, agent_initiatives, swarm_file)
     
     # Get all initiatives
     initiatives = get_all_initiatives(base_path)
@@ -44,6 +49,9 @@ def next_command(
         if not initiative:
             print(f"{Colors.RED}❌ Initiative not found: {initiative_dir}{Colors.NC}")
             return 1
+        if initiative.archived:
+            print(f"{Colors.RED}❌ {archived_message(initiative)}{Colors.NC}")
+            return 1
         
         next_task = _get_next_task_for_initiative(initiative, initiatives)
         if next_task:
@@ -169,39 +177,11 @@ def _get_next_task_for_initiative(initiative: Initiative, all_initiatives: List[
         for t in tasks_data
     ]
     
-    # Find current group (highest group with completed or in-progress tasks)
-    current_group = max(
-        (t.group for t in tasks if t.is_completed or t.is_in_progress),
-        default=0
-    )
-    
-    # Check if current group is complete
-    current_group_tasks = [t for t in tasks if t.group == current_group]
-    current_group_complete = all(t.is_completed for t in current_group_tasks)
-    
-    # If current group is complete, move to next group
-    if current_group_complete:
-        # Check if dependencies for next group are satisfied
-        next_group = current_group + 1
-        next_group_tasks = [t for t in tasks if t.group == next_group]
-        
-        if next_group_tasks:
-            # Dependencies satisfied, use next group
-            current_group = next_group
-        else:
-            # No more tasks
-            return None
-    
-    # Find first pending task in current group
-    pending_tasks = [
-        t for t in tasks
-        if t.group == current_group and t.is_pending
-    ]
-    
-    return pending_tasks[0] if pending_tasks else None
+    return next_in_group_order(tasks)
 
 
-def _next_for_agent(base_path: Path, agent: str, agent_initiatives: Optional[str]) -> int:
+def _next_for_agent(base_path: Path, agent: str, agent_initiatives: Optional[str],
+                    swarm_file: Optional[str] = None) -> int:
     """Get next task for a specific agent in swarm mode.
     
     Reads agent assignments from tasks.prd files (Agent: field).
@@ -210,6 +190,8 @@ def _next_for_agent(base_path: Path, agent: str, agent_initiatives: Optional[str
         base_path: Base path to search from
         agent: Agent name
         agent_initiatives: Comma-separated list of initiative dirs (optional, deprecated)
+        swarm_file: Swarm file; restricts candidates to its initiatives and
+            checks that the agent is one of its instances
         
     Returns:
         Exit code (0 for success, 1 for error)
@@ -221,6 +203,18 @@ def _next_for_agent(base_path: Path, agent: str, agent_initiatives: Optional[str
         print(f"{agent}: No initiatives found")
         return 1
     
+    if swarm_file:
+        swarm_path = Path(swarm_file)
+        if not swarm_path.exists():
+            print(f"{agent}: Swarm file not found: {swarm_file}")
+            return 1
+        config = load_swarm_config(swarm_path, base_path)
+        if agent not in config.agents:
+            print(f"{agent}: Not an agent instance in {swarm_path.name}")
+            return 1
+        swarm_ids = set(config.initiative_ids)
+        all_initiatives = [i for i in all_initiatives if i.id in swarm_ids]
+    
     # Find all tasks assigned to this agent across all initiatives
     agent_tasks = []
     
@@ -247,8 +241,7 @@ def _next_for_agent(base_path: Path, agent: str, agent_initiatives: Optional[str
             )
             
             # Check if task is assigned to this agent
-            task_agent = _extract_agent_from_task(tasks_file, task.id)
-            if task_agent == agent and task.is_pending:
+            if task_data['agent'] == agent and task.is_pending:
                 # Add to candidates with priority
                 # Priority: group number (lower first), then task number
                 priority = (task.group, int(task.id.split('-')[1]))
@@ -268,41 +261,6 @@ def _next_for_agent(base_path: Path, agent: str, agent_initiatives: Optional[str
     return 0
 
 
-def _extract_agent_from_task(tasks_file: Path, task_id: str) -> Optional[str]:
-    """Extract agent assignment from a task in tasks.prd.
-    
-    Args:
-        tasks_file: Path to tasks.prd
-        task_id: Task ID to find
-        
-    Returns:
-        Agent name or None
-    """
-    try:
-        content = tasks_file.read_text()
-        lines = content.split('\n')
-        
-        # Find the task line
-        in_task = False
-        for i, line in enumerate(lines):
-            if task_id in line and line.strip().startswith('-'):
-                in_task = True
-                continue
-            
-            if in_task:
-                # Look for Agent: field
-                if line.strip().startswith('- Agent:'):
-                    agent = line.split(':', 1)[1].strip()
-                    return agent
-                # Stop if we hit another task or section
-                elif line.strip().startswith('- [') or line.strip().startswith('##'):
-                    break
-        
-        return None
-    except Exception:
-        return None
-
-
 def _print_next_task(initiative: Initiative, task: Task, compact: bool = False) -> None:
     """Print next task recommendation.
     
@@ -0,0 +1,105 @@
+"""Perf command - latency report from the always-on telemetry ring."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ..history import parse_duration, parse_since
+from ..telemetry import SLOTS, latency_over_time, latency_summary, read_runs
+from ..utils import Colors
+
+
+# Percentile shown in the trend table
+TREND_PERCENTILE = 90
+
+# Commands shown as trend columns (most frequent first)
+TREND_COLUMNS = 5
+
+# A bucket this much slower than the command's overall percentile is highlighted
+SLOW_FACTOR = 1.5
+
+
+def perf_report_command(
+    base_path: Path = Path("."),
+    since: Optional[str] = None,
+    bucket: str = "1h",
+    output_json: bool = False
+) -> int:
+    """Summarize recorded command latency.
+
+    Args:
+        base_path: Base path to search from
+        since: Start of the range ("1h", "7d", ISO date); defaults to all records
+        bucket: Width of the trend buckets ("15m", "1h", "1d")
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    try:
+        since_ts = parse_since(since) if since else None
+        bucket_seconds = parse_duration(bucket)
+    except ValueError as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        return 1
+
+    runs = read_runs(base_path, since=since_ts)
+    if not runs:
+        if output_json:
+            print(json.dumps({"error": "No runs recorded"}, indent=2))
+        else:
+            print(f"{Colors.YELLOW}⚠️  No runs recorded in ai-project/.aipo/telemetry.ring yet{Colors.NC}")
+        return 1
+
+    summary = latency_summary(runs)
+    trend = latency_over_time(runs, bucket_seconds, TREND_PERCENTILE)
+
+    if output_json:
+        data = {
+            "runs": len(runs),
+            "first": datetime.fromtimestamp(runs[0].timestamp).isoformat(timespec='seconds'),
+            "last": datetime.fromtimestamp(runs[-1].timestamp).isoformat(timespec='seconds'),
+            "commands": [{k: round(v, 3) if isinstance(v, float) else v for k, v in row.items()} for row in summary],
+            "trend": [
+                {
+                    "start": datetime.fromtimestamp(start).isoformat(timespec='seconds'),
+                    "commands": {c: {"runs": n, f"p{TREND_PERCENTILE}": round(ms, 3)} for c, (n, ms) in commands.items()},
+                }
+                for start, commands in trend
+            ],
+        }
+        print(json.dumps(data, indent=2))
+        return 0
+
+    first = datetime.fromtimestamp(runs[0].timestamp).strftime('%Y-%m-%d %H:%M')
+    last = datetime.fromtimestamp(runs[-1].timestamp).strftime('%Y-%m-%d %H:%M')
+    print(f"{Colors.BOLD}📈 Command Latency{Colors.NC}")
+    print(f"{Colors.DIM}{len(runs)} run(s) from {first} to {last} (ring keeps the last {SLOTS}){Colors.NC}")
+    print()
+
+    print(f"{'Command':<20}{'Runs':>6}{'P50':>10}{'P90':>10}{'P99':>10}{'Max':>10}{'Scan':>7}{'Cache':>7}")
+    for row in summary:
+        rate = f"{row['cache_hit_rate']:.0%}" if row['cache_hit_rate'] is not None else "-"
+        print(f"{row['command'][:19]:<20}{row['runs']:>6}{row['p50']:>8.1f}ms{row['p90']:>8.1f}ms"
+              f"{row['p99']:>8.1f}ms{row['max']:>8.1f}ms{row['mean_scanned']:>7.0f}{rate:>7}")
+
+    columns = [row['command'] for row in summary[:TREND_COLUMNS]]
+    overall = {row['command']: row[f"p{TREND_PERCENTILE}"] for row in summary}
+    print()
+    print(f"{Colors.BOLD}P{TREND_PERCENTILE} over time ({bucket} buckets):{Colors.NC}")
+    print(f"{'Start':<14}" + "".join(f"{c[:11]:>12}" for c in columns))
+    for start, commands in trend:
+        cells = []
+        for command in columns:
+            if command not in commands:
+                cells.append(f"{'-':>12}")
+                continue
+            ms = commands[command][1]
+            cell = f"{ms:>10.1f}ms"
+            if ms > overall[command] * SLOW_FACTOR:
+                cell = f"{Colors.RED}{cell}{Colors.NC}"
+            cells.append(cell)
+        print(f"{datetime.fromtimestamp(start).strftime('%m-%d %H:%M'):<14}" + "".join(cells))
+
+    return 0
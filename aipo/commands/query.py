@@ -0,0 +1,114 @@
+"""Query command - filter tasks and initiatives through the indexed project model."""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+from ..profiling import phase
+from ..utils import Colors
+
+
+def query_command(
+    query: str,
+    base_path: Path = Path("."),
+    output_json: bool = False,
+    count: bool = False,
+    initiatives: bool = False
+) -> int:
+    """Print the tasks (or their initiatives) matching a query.
+
+    Args:
+        query: Whitespace-separated terms, e.g. "status=pending agent=backend_2 group<=2 ready"
+        base_path: Base path to search from
+        output_json: Whether to output JSON format
+        count: Only print the number of matches
+        initiatives: List the initiatives with matching tasks instead of the tasks
+
+    Returns:
+        Exit code (0 for success, 1 for a malformed query or missing project)
+    """
+    from ..project import Project, initiative_state
+    from ..query import parse_query, run_query
+
+    try:
+        terms = parse_query(query)
+    except ValueError as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        return 1
+
+    if not (base_path / "ai-project" / "initiatives").is_dir():
+        print(f"{Colors.RED}❌ No initiatives found{Colors.NC}")
+        return 1
+
+    phase("load")
+    project = Project(base_path)
+    phase("query")
+    tasks = run_query(project, terms)
+    ready = project.indexes['ready'][True]
+
+    phase("render")
+    if initiatives:
+        matching = Counter(task.initiative for task in tasks)
+        matches = [project.by_name[name] for name in matching]
+        if count:
+            print(json.dumps({"initiatives": len(matches)}) if output_json else len(matches))
+        elif output_json:
+            print(json.dumps([
+                dict(init.to_dict(), state=initiative_state(init),
+                     matching_tasks=matching[init.name])
+                for init in matches
+            ], indent=2))
+        else:
+            for init in matches:
+                print(f"{Colors.BOLD}{init.name}{Colors.NC}  {initiative_state(init).replace('_', ' ')}, "
+                      f"{init.completed_count}/{init.task_count} tasks, {matching[init.name]} matching")
+        return 0
+
+    if count:
+        print(json.dumps({"tasks": len(tasks)}) if output_json else len(tasks))
+        return 0
+
+    if output_json:
+        print(json.dumps([
+            {
+                "initiative": task.initiative,
+                "id": task.id,
+                "title": task.title,
+                "status": task.status,
+                "group": task.group,
+                "agent": task.agent,
+                "ready": task.key in ready,
+                "dependencies": task.dependencies,
+                "cross_dependencies": task.cross_dependencies,
+                "estimated_hours": task.estimated_hours,
+            }
+            for task in tasks
+        ], indent=2))
+        return 0
+
+    if not tasks:
+        print(f"{Colors.YELLOW}⚠️  No tasks match{Colors.NC}")
+        return 0
+
+    icons = {
+        'completed': f"{Colors.GREEN}✓{Colors.NC}",
+        'in_progress': f"{Colors.YELLOW}⧗{Colors.NC}",
+        'pending': f"{Colors.BLUE}○{Colors.NC}",
+    }
+    current = None
+    for task in tasks:
+        if task.initiative != current:
+            if current is not None:
+                print()
+            current = task.initiative
+            print(f"{Colors.BOLD}{current}{Colors.NC}")
+        details = [f"group {task.group}"]
+        if task.agent:
+            details.append(task.agent)
+        if task.key in ready:
+            details.append(f"{Colors.GREEN}ready{Colors.NC}")
+        print(f"  {icons.get(task.status, '•')} {task.id}: {task.title} {Colors.DIM}[{Colors.NC}"
+              f"{', '.join(details)}{Colors.DIM}]{Colors.NC}")
+    print()
+    print(f"{len(tasks)} task(s)")
+    return 0
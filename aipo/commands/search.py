@@ -0,0 +1,73 @@
+"""Search command - ranked full-text search over tasks and descriptions."""
+
+import json
+from pathlib import Path
+
+from ..profiling import phase
+from ..utils import Colors
+
+
+def search_command(
+    query: str,
+    base_path: Path = Path("."),
+    limit: int = 10,
+    output_json: bool = False
+) -> int:
+    """Search task titles, sub-bullets and description.prd sections.
+
+    Args:
+        query: Free-text query (e.g. "jwt refresh")
+        base_path: Base path to search from
+        limit: Maximum number of results
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 if something matched, 1 for no matches or errors)
+    """
+    from ..search import search, tokenize
+
+    if not tokenize(query):
+        print(f"{Colors.RED}❌ Error: Empty search query{Colors.NC}")
+        return 1
+    if not (base_path / "ai-project" / "initiatives").is_dir():
+        print(f"{Colors.RED}❌ No initiatives found{Colors.NC}")
+        return 1
+
+    results = search(query, base_path, limit)
+
+    phase("render")
+    if output_json:
+        print(json.dumps([
+            {
+                "score": round(result.score, 3),
+                "initiative": result.initiative,
+                "kind": result.kind,
+                "ref": result.ref,
+                "title": result.title,
+                "status": result.status,
+                "archived": result.archived,
+            }
+            for result in results
+        ], indent=2))
+        return 0 if results else 1
+
+    if not results:
+        print(f"{Colors.YELLOW}⚠️  No matches for \"{query}\"{Colors.NC}")
+        return 1
+
+    icons = {
+        'completed': f"{Colors.GREEN}✓{Colors.NC}",
+        'in_progress': f"{Colors.YELLOW}⧗{Colors.NC}",
+        'pending': f"{Colors.BLUE}○{Colors.NC}",
+    }
+    print(f"{Colors.BOLD}🔎 {len(results)} match(es) for \"{query}\"{Colors.NC}")
+    print()
+    for result in results:
+        archived = f" {Colors.DIM}(archived){Colors.NC}" if result.archived else ""
+        if result.kind == 'task':
+            print(f"  {result.score:>6.2f}  {icons.get(result.status, '•')} {result.initiative} "
+                  f"{Colors.BOLD}{result.ref}{Colors.NC}: {result.title}{archived}")
+        else:
+            print(f"  {result.score:>6.2f}  {Colors.DIM}§{Colors.NC} {result.initiative} "
+                  f"description.prd: {Colors.BOLD}{result.ref}{Colors.NC}{archived}")
+    return 0
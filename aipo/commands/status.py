@@ -2,32 +2,66 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from ..core import get_all_initiatives, categorize_initiatives
+from ..core import get_all_initiatives, categorize_initiatives, project_fingerprint
+from ..history import record_snapshot
+from ..profiling import phase
 from ..utils import Colors
 
 
-def status_command(base_path: Path = Path("."), output_json: bool = False) -> int:
+# Exit code when --if-changed matches the current fingerprint
+EXIT_UNCHANGED = 3
+
+
+def status_command(base_path: Path = Path("."), output_json: bool = False,
+                   changed_since: Optional[str] = None, if_changed: Optional[str] = None,
+                   record: bool = True) -> int:
     """Quick project health check.
     
     Args:
         base_path: Base path to search from
         output_json: Whether to output JSON format
+        changed_since: Git revision; only initiatives changed since it (and
+            their dependents) are re-validated, the rest come from cache
+        if_changed: Fingerprint from a previous run; if the project still
+            matches it, exit with EXIT_UNCHANGED without scanning
+        record: Whether to append a history snapshot if the project changed
+            (False keeps the run read-only)
         
     Returns:
-        Exit code (0 for success, 1 for error)
+        Exit code (0 for success, 1 for error, EXIT_UNCHANGED if unchanged)
     """
+    # Conditional poll: stat calls only, no parsing
+    fingerprint = project_fingerprint(base_path)
+    if if_changed and if_changed == fingerprint:
+        if output_json:
+            print(json.dumps({"fingerprint": fingerprint, "changed": False}))
+        else:
+            print(f"Unchanged ({fingerprint})")
+        return EXIT_UNCHANGED
+    
     # Get all initiatives
-    initiatives = get_all_initiatives(base_path)
+    try:
+        initiatives = get_all_initiatives(base_path, changed_since=changed_since)
+    except RuntimeError as e:
+        error = f"Cannot diff against {changed_since}: {e}"
+        if output_json:
+            print(json.dumps({"error": error, "fingerprint": fingerprint}, indent=2))
+        else:
+            print(f"{Colors.RED}❌ Error: {error}{Colors.NC}")
+        return 1
     
     if not initiatives:
         if output_json:
-            print(json.dumps({"error": "No initiatives found"}, indent=2))
+            print(json.dumps({"error": "No initiatives found", "fingerprint": fingerprint}, indent=2))
         else:
             print(f"{Colors.RED}❌ No initiatives found{Colors.NC}")
         return 1
     
+    if record:
+        record_snapshot(base_path, initiatives, fingerprint)
+    
     # Categorize initiatives
     active, completed, not_started, cancelled = categorize_initiatives(initiatives)
     
@@ -46,9 +80,12 @@ def status_command(base_path: Path = Path("."), output_json: bool = False) -> in
         if i.dependencies and not i.is_completed
     ]
     
+    phase("render")
     if output_json:
         # JSON output for CI/CD and automation
         data: Dict[str, Any] = {
+            "fingerprint": fingerprint,
+            "changed": True,
             "overview": {
                 "total_initiatives": len(initiatives),
                 "active": len(active),
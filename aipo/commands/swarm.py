@@ -3,15 +3,37 @@
 import os
 import signal
 import subprocess
-import json
+import time
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict, Counter
+from collections import Counter, defaultdict
+from typing import Optional
+from ..activity import (
+    classify_idle_gaps,
+    find_latest_session,
+    find_session_log,
+    iter_work_periods,
+    percentile,
+)
 from ..core import get_all_initiatives
-from ..utils import Colors, extract_initiative_ids, find_initiative_directory
+from ..prd import apply_changes
+from ..stall import DEFAULT_STALL_FACTOR, StallDetector
+from .monitor import print_stall_report
+from ..swarm_config import load_swarm_config
+from ..utils import Colors, extract_tasks, find_initiative_directory
 
 
-def swarm_command(swarm_file: str, cancel: bool = False, archive: bool = False, activity: bool = False) -> int:
+def swarm_command(
+    swarm_file: str,
+    cancel: bool = False,
+    archive: bool = False,
+    activity: bool = False,
+    export_dir: Optional[str] = None,
+    export_format: str = 'csv',
+    follow: bool = False,
+    stall_factor: float = DEFAULT_STALL_FACTOR,
+    on_stall: Optional[str] = None
+) -> int:
     """Manage swarm lifecycle.
     
     Args:
@@ -19,6 +41,11 @@ def swarm_command(swarm_file: str, cancel: bool = False, archive: bool = False,
         cancel: If True, cancel running swarm
         archive: If True, archive completed swarm
         activity: If True, analyze agent activity and parallelism
+        export_dir: With activity, export tables to this directory instead of printing
+        export_format: Export format ('csv', 'parquet' or 'arrow')
+        follow: With activity, follow the live log and flag stalled agents
+        stall_factor: Flag agents whose open task runs this many times past its baseline
+        on_stall: Shell command to run once per newly stalled agent
     
     Returns:
         Exit code (0 for success, 1 for error)
@@ -34,7 +61,9 @@ def swarm_command(swarm_file: str, cancel: bool = False, archive: bool = False,
     elif archive:
         return _archive_swarm(swarm_path)
     elif activity:
-        return _analyze_agents(swarm_path)
+        if follow:
+            return _follow_agents(swarm_path, stall_factor, on_stall)
+        return _analyze_agents(swarm_path, export_dir, export_format)
     else:
         print(f"{Colors.RED}❌ Error: Must specify --cancel, --archive, or --activity{Colors.NC}")
         print()
@@ -96,7 +125,11 @@ def _archive_swarm(swarm_path: Path) -> int:
     print()
     
     # Extract initiative IDs from swarm file
-    initiative_ids = extract_initiative_ids(swarm_path)
+    config = load_swarm_config(swarm_path)
+    initiative_ids = config.initiative_ids
+    if config.initiatives_source == "prompt":
+        print(f"{Colors.YELLOW}⚠️  Initiatives scanned from the coordinator prompt (deprecated); "
+              f"add a 'swarm.initiatives' list to {swarm_path.name}{Colors.NC}")
     
     if not initiative_ids:
         print(f"{Colors.RED}❌ Error: Could not find initiative IDs in swarm config{Colors.NC}")
@@ -119,20 +152,20 @@ def _archive_swarm(swarm_path: Path) -> int:
     print()
     
     # Check that all initiatives are completed
-    initiatives_dir = Path("ai-project/initiatives")
-    initiatives = get_all_initiatives(initiatives_dir)
+    by_id = {i.id: i for i in get_all_initiatives(base_path)}
     
     incomplete_initiatives = []
     for dir_name in initiative_dirs:
         # Extract initiative ID from directory name (NNNN-name format)
         init_id = dir_name.split('-')[0]
         
-        initiative = next((i for i in initiatives if i.id == init_id), None)
+        initiative = by_id.get(init_id)
         if not initiative:
             print(f"{Colors.RED}❌ Initiative not found: {dir_name}{Colors.NC}")
             incomplete_initiatives.append(dir_name)
-        elif initiative.status != 'completed':
-            print(f"{Colors.RED}❌ Initiative not completed: {dir_name} (status: {initiative.status}){Colors.NC}")
+        elif not initiative.is_completed:
+            status = initiative.summary_status or ("active" if initiative.is_active else "not started")
+            print(f"{Colors.RED}❌ Initiative not completed: {dir_name} (status: {status}){Colors.NC}")
             incomplete_initiatives.append(dir_name)
         else:
             print(f"{Colors.GREEN}✓{Colors.NC} {dir_name} is completed")
@@ -160,6 +193,22 @@ def _archive_swarm(swarm_path: Path) -> int:
     archive_name = swarm_path.stem + f"-{timestamp}" + swarm_path.suffix
     archive_path = archive_dir / archive_name
     
+    # Mark the swarm binding archived in every task file in one transaction
+    print(f"{Colors.BOLD}Updating task files...{Colors.NC}")
+    changes = [
+        {"initiative": dir_name, "swarm": f"{swarm_path.name} (archived {timestamp})"}
+        for dir_name in initiative_dirs
+        if by_id[dir_name.split('-')[0]].swarm == swarm_path.name
+    ]
+    try:
+        updated = apply_changes(changes, base_path)
+    except (ValueError, OSError) as e:
+        print(f"{Colors.RED}❌ Error updating task files (none were changed): {e}{Colors.NC}")
+        return 1
+    for tasks_file in sorted(updated):
+        print(f"{Colors.GREEN}✓{Colors.NC} Updated: {tasks_file}")
+    print()
+    
     # Move swarm file to archive
     try:
         swarm_path.rename(archive_path)
@@ -168,24 +217,6 @@ def _archive_swarm(swarm_path: Path) -> int:
         print(f"{Colors.RED}❌ Error moving swarm file: {e}{Colors.NC}")
         return 1
     
-    # Update task files to remove swarm reference
-    print()
-    print(f"{Colors.BOLD}Updating task files...{Colors.NC}")
-    for dir_name in initiative_dirs:
-        task_file = initiatives_dir / dir_name / "tasks.prd"
-        if task_file.exists():
-            try:
-                content = task_file.read_text()
-                # Remove or comment out the Swarm field
-                updated_content = content.replace(
-                    f"**Swarm**: {swarm_path.name}",
-                    f"**Swarm**: {swarm_path.name} (archived {timestamp})"
-                )
-                task_file.write_text(updated_content)
-                print(f"{Colors.GREEN}✓{Colors.NC} Updated: {task_file}")
-            except Exception as e:
-                print(f"{Colors.YELLOW}⚠{Colors.NC}  Could not update {task_file}: {e}")
-    
     print()
     print(f"{Colors.GREEN}✅ Swarm archived successfully{Colors.NC}")
     print()
@@ -194,124 +225,108 @@ def _archive_swarm(swarm_path: Path) -> int:
     return 0
 
 
-def _analyze_agents(swarm_path: Path) -> int:
+def _analyze_agents(swarm_path: Path, export_dir: Optional[str] = None, export_format: str = 'csv') -> int:
     """Analyze agent activity and parallelism from Claude Swarm logs."""
     
     print(f"{Colors.BOLD}📊 Agent Activity Analysis: {swarm_path.name}{Colors.NC}")
     print()
     
     # Find the most recent session for this swarm
-    session_path = _find_latest_session()
+    session_path = find_latest_session()
     
     if not session_path:
         print(f"{Colors.RED}❌ Error: No Claude Swarm sessions found{Colors.NC}")
         print(f"{Colors.YELLOW}💡 Run: claude-swarm start {swarm_path.name}{Colors.NC}")
         return 1
     
-    log_file = session_path / "session.log.json"
+    # Archived sessions may keep only a compressed log (.gz/.xz/.zst)
+    log_file = find_session_log(session_path)
     
-    if not log_file.exists():
-        print(f"{Colors.RED}❌ Error: Log file not found: {log_file}{Colors.NC}")
+    if not log_file:
+        print(f"{Colors.RED}❌ Error: Log file not found: {session_path / 'session.log.json'}{Colors.NC}")
         return 1
     
     print(f"📁 Session: {session_path.name}")
     print()
     
+    if export_dir:
+        return _export_activity(log_file, Path(export_dir), export_format)
+    
     # Parse logs and extract agent activity
-    agent_work = _parse_agent_activity(log_file)
+    try:
+        periods = list(iter_work_periods(log_file))
+    except Exception as e:
+        print(f"{Colors.RED}❌ Error parsing log file: {e}{Colors.NC}")
+        return 1
     
-    if not agent_work:
+    if not periods:
         print(f"{Colors.YELLOW}⚠️  No agent activity found in logs{Colors.NC}")
         return 0
     
+    agent_work = defaultdict(list)
+    for period in periods:
+        agent_work[period.agent].append((period.start, period.end))
+    
     # Display results
-    _display_agent_analysis(agent_work)
+    _display_agent_analysis(dict(agent_work))
+    _display_idle_analysis(periods, Path("."))
     
     return 0
 
 
-def _find_latest_session() -> Path | None:
-    """Find the most recent Claude Swarm session."""
-    
-    # Claude Swarm stores sessions in ~/.claude-swarm/sessions/
-    home = Path.home()
-    sessions_base = home / ".claude-swarm" / "sessions"
-    
-    if not sessions_base.exists():
-        return None
-    
-    # Find sessions for current project
-    cwd = Path.cwd()
-    # Session directory format: path+with+plus+signs/session-uuid
-    # Strip leading slash before replacing
-    cwd_encoded = str(cwd).lstrip("/").replace("/", "+")
-    
-    project_sessions = sessions_base / cwd_encoded
-    
-    if not project_sessions.exists():
-        return None
-    
-    # Get all session directories sorted by creation time
-    sessions = [d for d in project_sessions.iterdir() if d.is_dir()]
+def _follow_agents(swarm_path: Path, stall_factor: float, on_stall: Optional[str],
+                   refresh_interval: int = 5) -> int:
+    """Follow the live session log and flag stalled agents until interrupted."""
+    
+    session_path = find_latest_session()
+    log_file = find_session_log(session_path) if session_path else None
+    if not log_file:
+        print(f"{Colors.RED}❌ Error: No Claude Swarm session log found{Colors.NC}")
+        print(f"{Colors.YELLOW}💡 Run: claude-swarm start {swarm_path.name}{Colors.NC}")
+        return 1
     
-    if not sessions:
-        return None
+    detector = StallDetector(log_file, Path("."), factor=stall_factor, hook=on_stall)
+    print(f"{Colors.YELLOW}🔄 Following {log_file} every {refresh_interval}s - Press Ctrl+C to exit{Colors.NC}")
+    print()
     
-    # Return most recent session
-    sessions.sort(key=lambda d: d.stat().st_mtime, reverse=True)
-    return sessions[0]
+    try:
+        while True:
+            stalled, orphaned = detector.check()
+            now = datetime.now().strftime("%H:%M:%S")
+            open_work = detector.tracker.open_work
+            
+            print(f"{Colors.BOLD}── {now} ─ {len(open_work)} agent(s) working{Colors.NC}")
+            for agent, (start, initiative, task_id) in sorted(open_work.items()):
+                task = f"{initiative}/{task_id}" if initiative and task_id else "(unknown task)"
+                elapsed = (datetime.now(tz=start.tzinfo) - start).total_seconds() / 60
+                print(f"  ● {agent}: {task} ({elapsed:.0f}m)")
+            print()
+            print_stall_report(stalled, orphaned)
+            
+            time.sleep(refresh_interval)
+    except KeyboardInterrupt:
+        print()
+        print(f"{Colors.GREEN}✓ Stopped following{Colors.NC}")
+        return 0
 
 
-def _parse_agent_activity(log_file: Path) -> dict:
-    """Parse session.log.json and extract agent work periods.
-    
-    Returns:
-        Dict mapping agent name to list of (start_time, end_time) tuples
-    """
-    
-    agent_work = defaultdict(list)
-    current_work = {}  # agent -> start_time
-    last_result = {}  # agent -> last result time (avoid duplicates)
+def _export_activity(log_file: Path, export_dir: Path, export_format: str) -> int:
+    """Stream agent activity tables to disk."""
+    from ..export import export_activity
     
     try:
-        with open(log_file, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line)
-                    timestamp = entry.get('timestamp', '')
-                    instance = entry.get('instance', '')
-                    event = entry.get('event', {})
-                    event_type = event.get('type', '')
-                    from_instance = event.get('from_instance', '')
-                    
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    
-                    # Filter to agent instances only (exclude coordinator, user)
-                    if instance in ['coordinator', 'user', '']:
-                        continue
-                    
-                    # Agent receives task from coordinator (start work)
-                    if event_type == 'request' and from_instance == 'coordinator':
-                        current_work[instance] = dt
-                    
-                    # Agent sends result (end work)
-                    if event_type == 'result':
-                        if instance in current_work:
-                            # Avoid duplicate results at same timestamp
-                            if instance not in last_result or last_result[instance] != dt:
-                                start = current_work[instance]
-                                agent_work[instance].append((start, dt))
-                                last_result[instance] = dt
-                                del current_work[instance]
-                
-                except (json.JSONDecodeError, ValueError, KeyError):
-                    continue
-    
-    except Exception as e:
-        print(f"{Colors.RED}❌ Error parsing log file: {e}{Colors.NC}")
-        return {}
+        written = export_activity(log_file, export_dir, fmt=export_format)
+    except (RuntimeError, ValueError) as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        return 1
+    except OSError as e:
+        print(f"{Colors.RED}❌ Error writing export: {e}{Colors.NC}")
+        return 1
     
-    return dict(agent_work)
+    print(f"{Colors.GREEN}✅ Exported agent activity ({export_format}):{Colors.NC}")
+    for path in written:
+        print(f"  • {path}")
+    return 0
 
 
 def _display_agent_analysis(agent_work: dict):
@@ -429,3 +444,119 @@ def _display_agent_analysis(agent_work: dict):
     
     print()
 
+
+def _load_task_graph(base_path: Path):
+    """Load task dependencies and agent assignments from all tasks.prd files.
+    
+    Returns:
+        Tuple of (task_deps, done_before, agent_tasks, initiative_tasks) as
+        expected by classify_idle_gaps
+    """
+    initiatives = get_all_initiatives(base_path)
+    dir_by_id = {i.id: i.directory.name for i in initiatives}
+    
+    task_deps = {}
+    done_before = set()
+    agent_tasks = defaultdict(list)
+    initiative_tasks = {}
+    
+    for initiative in initiatives:
+        tasks_file = initiative.directory / "tasks.prd"
+        if not tasks_file.exists():
+            continue
+        dir_name = initiative.directory.name
+        initiative_deps = [dir_by_id.get(dep_id, dep_id) for dep_id in initiative.dependencies]
+        keys = []
+        for task in extract_tasks(tasks_file):
+            key = f"{dir_name}/{task['id']}"
+            keys.append(key)
+            task_deps[key] = (
+                [f"{dir_name}/{dep}" for dep in task['dependencies']]
+                + task['cross_dependencies']
+                + initiative_deps
+            )
+            if task['status'] == 'completed':
+                done_before.add(key)
+            if task['agent']:
+                agent_tasks[task['agent']].append(key)
+        initiative_tasks[dir_name] = keys
+    
+    return task_deps, done_before, dict(agent_tasks), initiative_tasks
+
+
+def _display_idle_analysis(periods: list, base_path: Path):
+    """Display idle-time root causes joined with the task dependency graph."""
+    
+    task_deps, done_before, agent_tasks, initiative_tasks = _load_task_graph(base_path)
+    
+    # Tasks worked on in this session were not done before it
+    done_before -= {p.task_key for p in periods if p.task_key}
+    
+    gaps = classify_idle_gaps(periods, task_deps, done_before, agent_tasks, initiative_tasks)
+    
+    print(f"{Colors.BOLD}{'═' * 70}{Colors.NC}")
+    print(f"{Colors.BOLD}IDLE ROOT CAUSES{Colors.NC}")
+    print(f"{Colors.BOLD}{'═' * 70}{Colors.NC}")
+    print()
+    
+    total_idle = sum(g.minutes for g in gaps)
+    if total_idle <= 0:
+        print(f"{Colors.GREEN}✅ No idle gaps - agents were busy for the whole session{Colors.NC}")
+        print()
+        return
+    
+    causes = [
+        ("Waiting on dependencies", sum(g.dependency_minutes for g in gaps)),
+        ("Waiting for coordinator dispatch", sum(g.dispatch_minutes for g in gaps)),
+        ("No remaining work", sum(g.no_work_minutes for g in gaps)),
+        ("Unattributed (task not in request)", sum(g.unattributed_minutes for g in gaps)),
+    ]
+    print(f"Total idle: {total_idle:.1f} agent-minutes across {len(gaps)} gap(s)")
+    for label, minutes in causes:
+        if minutes > 0:
+            pct = minutes / total_idle * 100
+            print(f"  {label:<36} {minutes:7.1f} min ({pct:5.1f}%)")
+    
+    # Dispatch latency: only gaps that actually ended with a dispatch
+    latencies = sorted(g.dispatch_minutes for g in gaps if g.dispatched and g.dispatch_minutes > 0)
+    if latencies:
+        print()
+        print("Dispatch Latency (task ready → agent dispatched):")
+        print(f"  P50: {percentile(latencies, 50):.1f}m  P90: {percentile(latencies, 90):.1f}m  "
+              f"Max: {latencies[-1]:.1f}m  ({len(latencies)} dispatches)")
+        buckets = [("< 1m", 0, 1), ("1-5m", 1, 5), ("5-15m", 5, 15), ("15-60m", 15, 60), ("> 60m", 60, float('inf'))]
+        for label, low, high in buckets:
+            count = sum(1 for v in latencies if low <= v < high)
+            pct = count / len(latencies) * 100
+            print(f"  {label:>6}: {count:3d} ({pct:5.1f}%) {'█' * int(pct / 5)}")
+    
+    # Dependency edges that cost the most agent-minutes
+    edge_cost = Counter()
+    for g in gaps:
+        if g.dependency_minutes > 0 and g.blocking_dependency:
+            edge_cost[(g.blocking_dependency, g.next_task)] += g.dependency_minutes
+    if edge_cost:
+        print()
+        print("Costliest Dependency Edges:")
+        for (dep, task), minutes in edge_cost.most_common(5):
+            print(f"  {minutes:7.1f} min  {dep} → {task}")
+    
+    # Individual coordinator delays
+    delays = sorted((g for g in gaps if g.dispatched and g.dispatch_minutes > 0),
+                    key=lambda g: g.dispatch_minutes, reverse=True)
+    if delays:
+        print()
+        print("Longest Coordinator Delays:")
+        for g in delays[:5]:
+            print(f"  {g.dispatch_minutes:7.1f} min  {g.agent} before {g.next_task or '(unknown task)'} "
+                  f"(dispatched {g.end.strftime('%H:%M:%S')})")
+    
+    # Recommendation
+    dependency_minutes, dispatch_minutes = causes[0][1], causes[1][1]
+    print()
+    if dependency_minutes > dispatch_minutes and dependency_minutes > 0:
+        print(f"{Colors.YELLOW}💡 Tip:{Colors.NC} Most idle time is dependency waits - restructure the plan "
+              f"(split or reorder the edges above)")
+    elif dispatch_minutes > 0:
+        print(f"{Colors.YELLOW}💡 Tip:{Colors.NC} Most idle time is dispatch latency - the coordinator is the bottleneck")
+    print()
@@ -0,0 +1,62 @@
+"""Sync-state command - regenerate the computed fields of project-state.prd."""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from ..profiling import phase
+from ..utils import Colors
+
+
+def sync_state_command(
+    base_path: Path = Path("."),
+    check: bool = False,
+    output_json: bool = False
+) -> int:
+    """Recompute initiative counts, module counts and milestones in project-state.prd.
+
+    Only the values of the generated fields are rewritten (see aipo.state);
+    prose is left untouched.
+
+    Args:
+        base_path: Base path to search from
+        check: Report stale fields without writing (for CI)
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 for success, 1 for errors or, with check, stale fields)
+    """
+    from ..state import sync_state
+
+    phase("sync")
+    try:
+        updates = sync_state(base_path, check=check)
+    except (FileNotFoundError, OSError) as e:
+        print(f"{Colors.RED}❌ Error: {e}{Colors.NC}")
+        return 1
+
+    phase("render")
+    if output_json:
+        print(json.dumps({
+            "written": bool(updates) and not check,
+            "updates": [asdict(update) for update in updates],
+        }, indent=2))
+        return 1 if check and updates else 0
+
+    if not updates:
+        print(f"{Colors.GREEN}✅ project-state.prd is up to date{Colors.NC}")
+        return 0
+
+    verb = "stale" if check else "updated"
+    print(f"{Colors.BOLD}🔄 project-state.prd: {len(updates)} field(s) {verb}{Colors.NC}")
+    for update in updates:
+        if update.old:
+            print(f"  {update.field}: {Colors.DIM}{update.old}{Colors.NC} → {update.new}")
+        else:
+            for line in update.new.strip('\n').split('\n'):
+                print(f"  {Colors.GREEN}+{Colors.NC} {line}")
+    if check:
+        print()
+        print(f"{Colors.YELLOW}⚠️  Run 'aipo sync-state' to regenerate them{Colors.NC}")
+        return 1
+    return 0
@@ -0,0 +1,61 @@
+"""Task commands - complete, start and reopen tasks in tasks.prd."""
+
+from pathlib import Path
+
+from ..archive import not_found_message
+from ..core import validate_initiative
+from ..prd import update_task_state
+from ..utils import Colors, resolve_initiative_directory
+
+
+_STATE_LABELS = {
+    'completed': ("✅", "completed"),
+    'in_progress': ("🔄", "started"),
+    'pending': ("↩️ ", "reopened"),
+}
+
+
+def task_state_command(initiative: str, task_id: str, state: str, base_path: Path = Path(".")) -> int:
+    """Set the state of a task in place.
+
+    Args:
+        initiative: Initiative directory, name or ID
+        task_id: Task ID (e.g. "TASK-004")
+        state: "completed", "in_progress" or "pending"
+        base_path: Base path to search from
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    directory = resolve_initiative_directory(initiative, base_path)
+    if directory is None:
+        print(f"{Colors.RED}❌ Error: {not_found_message(initiative, base_path)}{Colors.NC}")
+        return 1
+
+    tasks_file = directory / "tasks.prd"
+    if not tasks_file.exists():
+        print(f"{Colors.RED}❌ Error: Missing tasks.prd in {directory}{Colors.NC}")
+        return 1
+
+    task_id = task_id.upper()
+    try:
+        changed = update_task_state(tasks_file, task_id, state)
+    except ValueError as e:
+        print(f"{Colors.RED}❌ Error: {e} in {directory.name}{Colors.NC}")
+        return 1
+    except OSError as e:
+        print(f"{Colors.RED}❌ Error updating {tasks_file}: {e}{Colors.NC}")
+        return 1
+
+    icon, verb = _STATE_LABELS[state]
+    result = validate_initiative(directory)
+    progress = f"{result.completed_count}/{result.task_count} tasks"
+    if changed:
+        print(f"{icon} {task_id} {verb} in {directory.name} ({progress})")
+    else:
+        print(f"{Colors.DIM}{task_id} already {verb} in {directory.name} ({progress}){Colors.NC}")
+
+    if result.is_completed and state == 'completed' and changed:
+        print(f"{Colors.GREEN}🎉 INITIATIVE COMPLETE: {directory.name}{Colors.NC}")
+
+    return 0
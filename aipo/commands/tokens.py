@@ -0,0 +1,101 @@
+"""Tokens command - estimate the token cost of PRD files and check module budgets."""
+
+import json
+from pathlib import Path
+
+from ..profiling import phase
+from ..utils import Colors
+
+
+def tokens_command(
+    base_path: Path = Path("."),
+    module_budget: int = 500,
+    top: int = 10,
+    sections: bool = False,
+    output_json: bool = False
+) -> int:
+    """Report estimated tokens per file, section and module.
+
+    Counts use the offline approximation in aipo.tokens and are cached by
+    content hash, so unchanged files are not read again.
+
+    Args:
+        base_path: Base path to search from
+        module_budget: Token budget of one module (project-state.prd
+            ``Module:`` section or ai-project/modules/*.prd file)
+        top: Number of files to list, largest first (0 for all)
+        sections: Whether to break the listed files down by section
+        output_json: Whether to output JSON format
+
+    Returns:
+        Exit code (0 if every module fits the budget, 1 otherwise or on error)
+    """
+    from ..tokens import count_project
+
+    if module_budget < 1:
+        print(f"{Colors.RED}❌ Error: --budget must be positive{Colors.NC}")
+        return 1
+    if not (base_path / "ai-project").is_dir():
+        print(f"{Colors.RED}❌ No ai-project directory found{Colors.NC}")
+        return 1
+
+    files = count_project(base_path)
+    modules = [(file.path, name, tokens) for file in files for name, tokens in file.modules]
+    over = [module for module in modules if module[2] > module_budget]
+    total = sum(file.tokens for file in files)
+
+    phase("render")
+    if output_json:
+        print(json.dumps({
+            "tokens": total,
+            "module_budget": module_budget,
+            "files": [
+                {
+                    "path": file.path,
+                    "tokens": file.tokens,
+                    "sections": [{"heading": heading, "tokens": tokens} for heading, tokens in file.sections],
+                }
+                for file in files
+            ],
+            "modules": [
+                {"file": path, "module": name, "tokens": tokens, "over_budget": tokens > module_budget}
+                for path, name, tokens in modules
+            ],
+        }, indent=2))
+        return 1 if over else 0
+
+    print(f"{Colors.BOLD}🔢 Token Estimate: ~{total:,} tokens in {len(files)} file(s){Colors.NC}")
+    print()
+
+    largest = sorted(files, key=lambda file: -file.tokens)
+    if top > 0:
+        largest = largest[:top]
+    print(f"{Colors.BOLD}Largest files:{Colors.NC}" if top > 0 and len(files) > top else f"{Colors.BOLD}Files:{Colors.NC}")
+    for file in largest:
+        print(f"  {file.tokens:>9,}  {file.path}")
+        if sections:
+            for heading, tokens in file.sections:
+                print(f"  {Colors.DIM}{tokens:>9,}    § {heading}{Colors.NC}")
+    if len(largest) < len(files):
+        print(f"  {Colors.DIM}... {len(files) - len(largest)} more (--top 0 lists all){Colors.NC}")
+
+    if modules:
+        print()
+        print(f"{Colors.BOLD}Modules (budget {module_budget:,} tokens):{Colors.NC}")
+        for path, name, tokens in modules:
+            source = "" if path.endswith("project-state.prd") else f" {Colors.DIM}({path}){Colors.NC}"
+            if tokens > module_budget:
+                print(f"  {Colors.RED}✗ {tokens:>7,}  {name}  (+{tokens - module_budget:,}){Colors.NC}{source}")
+            else:
+                print(f"  {Colors.GREEN}✓{Colors.NC} {tokens:>7,}  {name}{source}")
+
+    print()
+    if over:
+        print(f"{Colors.RED}❌ {len(over)} module(s) over the {module_budget:,}-token budget{Colors.NC}")
+        return 1
+    if modules:
+        print(f"{Colors.GREEN}✅ All {len(modules)} module(s) within budget{Colors.NC}")
+    else:
+        print(f"{Colors.YELLOW}⚠️  No modules found (## Module: sections in project-state.prd "
+              f"or ai-project/modules/*.prd){Colors.NC}")
+    return 0
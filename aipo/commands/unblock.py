@@ -2,7 +2,10 @@
 
 from pathlib import Path
 from ..core import get_all_initiatives, categorize_initiatives
+from ..graph import build_initiative_graph, dependency_id, downstream_impact
+from ..profiling import phase
 from ..utils import Colors
+from .graph import print_cycles
 
 
 def unblock_command(base_path: Path = Path(".")) -> int:
@@ -28,25 +31,40 @@ def unblock_command(base_path: Path = Path(".")) -> int:
         print(f"{Colors.YELLOW}⚠️  No initiatives found{Colors.NC}")
         return 0
     
+    # Cycles can never be unblocked by finishing work: report them first
+    graph = build_initiative_graph(initiatives)
+    cycles = graph.cycles()
+    if cycles:
+        print(f"{Colors.BOLD}🔓 Dependency Analysis{Colors.NC}")
+        print()
+        print_cycles(cycles, "initiative")
+        print(f"{Colors.YELLOW}💡 Break each cycle by editing **Dependencies**: in one of its tasks.prd files{Colors.NC}")
+        return 1
+    
     # Categorize initiatives
     active, completed, not_started, cancelled = categorize_initiatives(initiatives)
+    by_id = {init.id: init for init in initiatives}
     
     # Analyze blocking relationships
+    phase("render")
     print(f"{Colors.BOLD}🔓 Dependency Analysis{Colors.NC}")
     print()
     
     # Find blocked initiatives
     blocked_initiatives = []
+    blocker_ids = set()
     for init in not_started + active:
         if init.dependencies:
             blocking_deps = []
-            for dep_id in init.dependencies:
-                dep = next((i for i in initiatives if i.id == dep_id), None)
-                if not dep:
-                    blocking_deps.append(f"{dep_id} (NOT FOUND)")
-                elif not dep.is_completed:
-                    status_str = "completed" if dep.is_completed else ("active" if dep.is_active else "not started")
-                    blocking_deps.append(f"{dep_id} ({status_str})")
+            for dep in init.dependencies:
+                dep_id = dependency_id(dep)
+                dep_init = by_id.get(dep_id)
+                if not dep_init:
+                    blocking_deps.append(f"{dep} (NOT FOUND)")
+                elif not dep_init.is_completed:
+                    status_str = "active" if dep_init.is_active else "not started"
+                    blocking_deps.append(f"{dep} ({status_str})")
+                    blocker_ids.add(dep_id)
             
             if blocking_deps:
                 blocked_initiatives.append((init, blocking_deps))
@@ -70,6 +88,7 @@ def unblock_command(base_path: Path = Path(".")) -> int:
     print(f"{Colors.RED}🔒 Blocked Initiatives ({len(blocked_initiatives)}):{Colors.NC}")
     print()
     
+    blocked_ids = {init.id for init, _ in blocked_initiatives}
     for init, blocking_deps in blocked_initiatives:
         print(f"{Colors.BOLD}{init.directory.name}{Colors.NC}")
         status_str = "completed" if init.is_completed else ("active" if init.is_active else "not started")
@@ -80,49 +99,39 @@ def unblock_command(base_path: Path = Path(".")) -> int:
             print(f"    ❌ {dep}")
         print()
     
-    # Suggest actions
-    print(f"{Colors.BOLD}💡 Suggested Actions:{Colors.NC}")
+    # Suggest actions, highest downstream impact first
+    print(f"{Colors.BOLD}💡 Suggested Actions (by downstream impact):{Colors.NC}")
     print()
     
-    # Find initiatives that are blocking others and need attention
-    blocking_initiatives = set()
-    for _, blocking_deps in blocked_initiatives:
-        for dep in blocking_deps:
-            dep_id = dep.split()[0]  # Extract ID before status
-            blocking_initiatives.add(dep_id)
-    
-    active_blocking = [i for i in active if i.id in blocking_initiatives]
-    not_started_blocking = [i for i in not_started if i.id in blocking_initiatives]
-    
-    if active_blocking:
-        print(f"{Colors.YELLOW}📋 Active initiatives blocking others:{Colors.NC}")
-        for init in active_blocking:
-            print(f"  • {init.directory.name} ({init.completed_count}/{init.task_count} tasks)")
-            print(f"    → Continue with: /aipo-start-task {init.directory.name}")
-        print()
-    
-    if not_started_blocking:
-        print(f"{Colors.YELLOW}🚀 Not started initiatives blocking others:{Colors.NC}")
-        for init in not_started_blocking:
-            # Check if this initiative is itself blocked
-            is_blocked = any(i.id == init.id for i, _ in blocked_initiatives)
-            if is_blocked:
-                print(f"  • {init.directory.name} (also blocked by dependencies)")
-            else:
-                print(f"  • {init.directory.name} (ready to start)")
-                print(f"    → Start with: /aipo-start-task {init.directory.name}")
-        print()
+    reverse = graph.dependents()
+    impacts = sorted(
+        (downstream_impact(graph, reverse, by_id, blocker_id) for blocker_id in blocker_ids),
+        key=lambda impact: (-impact['hours'], -impact['tasks'], -impact['initiatives'], impact['init'].id),
+    )
+    
+    for rank, impact in enumerate(impacts, 1):
+        init = impact['init']
+        unlocks = (f"unlocks {impact['initiatives']} initiative(s), "
+                   f"{impact['tasks']} task(s), ~{impact['hours']}h")
+        if init.is_active:
+            print(f"  {rank}. {Colors.YELLOW}⧗ {init.directory.name}{Colors.NC} ({init.completed_count}/{init.task_count} tasks) - {unlocks}")
+            print(f"     → Continue with: /aipo-start-task {init.directory.name}")
+        elif init.id in blocked_ids:
+            print(f"  {rank}. {Colors.BLUE}○ {init.directory.name}{Colors.NC} (also blocked by dependencies) - {unlocks}")
+        else:
+            print(f"  {rank}. {Colors.GREEN}🚀 {init.directory.name}{Colors.NC} (ready to start) - {unlocks}")
+            print(f"     → Start with: /aipo-start-task {init.directory.name}")
+    print()
     
     # Show dependency chain
-    if blocked_initiatives:
-        print(f"{Colors.BOLD}📊 Dependency Chain:{Colors.NC}")
-        print()
-        _print_dependency_tree(initiatives, completed, active, not_started)
+    print(f"{Colors.BOLD}📊 Dependency Chain:{Colors.NC}")
+    print()
+    _print_dependency_tree(by_id, completed, active, not_started)
     
-    return 1 if blocked_initiatives else 0
+    return 1
 
 
-def _print_dependency_tree(initiatives, completed, active, not_started):
+def _print_dependency_tree(by_id, completed, active, not_started):
     """Print a visual dependency tree."""
     
     # Start with completed initiatives (unblocking)
@@ -150,7 +159,7 @@ def _print_dependency_tree(initiatives, completed, active, not_started):
                 met_deps = []
                 unmet_deps = []
                 for dep_id in deps:
-                    dep = next((i for i in initiatives if i.id == dep_id), None)
+                    dep = by_id.get(dependency_id(dep_id))
                     if dep and dep.is_completed:
                         met_deps.append(dep_id)
                     else:
@@ -166,4 +175,3 @@ def _print_dependency_tree(initiatives, completed, active, not_started):
             else:
                 print(f"  ○ {init.id}: {init.directory.name} [ready]")
         print()
-
@@ -1,33 +1,51 @@
 """Validate command - validate swarm configurations."""
 
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from ..models import Initiative, Status
-from ..core import validate_initiative
-from ..utils import Colors, extract_initiative_ids, find_initiative_directory
+from ..models import Initiative, ProjectScan, Status
+from ..core import scan_project
+from ..graph import build_initiative_graph, build_task_graph
+from ..profiling import phase
+from ..swarm_config import SwarmConfig, load_swarm_config
+from ..tokens import PROJECT_STATE, SWARM_CONTEXT_LIMIT, TokenCounter
+from ..utils import Colors, extract_tasks
+from .graph import print_cycles
 
 
-def validate_swarm(swarm_file: Path, base_path: Path = Path(".")) -> Tuple[List[Initiative], int, int]:
+def validate_swarm(swarm_file: Path, base_path: Path = Path("."),
+                   scan: Optional[ProjectScan] = None,
+                   context_limit: int = SWARM_CONTEXT_LIMIT) -> Tuple[List[Initiative], int, int]:
     """Validate all initiatives in a swarm configuration.
     
     Args:
         swarm_file: Path to swarm YAML file
         base_path: Base path to search from
+        scan: Project scan to reuse (scanned from base_path if omitted)
+        context_limit: Token limit of the swarm's PRDs (0 disables the check)
         
     Returns:
         Tuple of (initiatives, blocking_errors, warnings)
     """
+    if scan is None:
+        scan = scan_project(base_path)
+    
     print(f"🔍 Validating swarm readiness...")
     print(f"   Swarm config: {swarm_file}")
     print()
 
-    # Extract initiative IDs
-    initiative_ids = extract_initiative_ids(swarm_file)
+    # Parse swarm file and extract initiative IDs
+    try:
+        config = load_swarm_config(swarm_file, base_path)
+    except Exception as e:
+        print(f"{Colors.RED}❌ Error: Could not parse swarm file: {e}{Colors.NC}")
+        return [], 1, 0
+    initiative_ids = config.initiative_ids
 
     if not initiative_ids:
         print(f"{Colors.YELLOW}⚠️  Warning: No initiatives found in swarm config{Colors.NC}")
-        print("   Looking for patterns like 'Initiative 0003' or '0004-backend-api'")
+        print("   Looking for 'swarm.initiatives' or patterns like 'Initiative 0003' or '0004-backend-api'")
+        print("   in the swarm name and coordinator prompt")
         return [], 0, 1
 
     print(f"Found {len(initiative_ids)} initiative(s): {', '.join(initiative_ids)}")
@@ -37,17 +55,21 @@ def validate_swarm(swarm_file: Path, base_path: Path = Path(".")) -> Tuple[List[
     blocking_errors = 0
     warnings = 0
 
+    if config.initiatives_source == "prompt":
+        print(f"{Colors.YELLOW}⚠️  Warning: Initiatives were scanned from the coordinator prompt (deprecated){Colors.NC}")
+        print("   Dependency rules in the prompt can bind initiatives the swarm does not own;")
+        print("   add a 'swarm.initiatives' list of initiative directories to the swarm file")
+        print()
+        warnings += 1
+
     for init_id in initiative_ids:
-        # Find directory
-        directory = find_initiative_directory(init_id, base_path)
+        initiative = scan.by_id.get(init_id)
 
-        if directory is None:
+        if initiative is None:
             print(f"{Colors.RED}❌ Initiative {init_id} directory not found{Colors.NC}")
             blocking_errors += 1
             continue
 
-        # Validate initiative
-        initiative = validate_initiative(directory)
         initiatives.append(initiative)
 
         # Print status
@@ -61,31 +83,111 @@ def validate_swarm(swarm_file: Path, base_path: Path = Path(".")) -> Tuple[List[
 
     # Check bidirectional swarm-task binding
     print()
-    binding_errors, binding_warnings = _check_swarm_binding(swarm_file, initiatives, base_path)
+    binding_errors, binding_warnings = _check_swarm_binding(swarm_file, initiatives, scan, base_path)
     blocking_errors += binding_errors
     warnings += binding_warnings
 
+    # Task-level cycles deadlock the swarm's agents
+    task_cycles = build_task_graph(initiatives).cycles()
+    if task_cycles:
+        print()
+        print_cycles(task_cycles, "task")
+        blocking_errors += len(task_cycles)
+
+    # Check task → agent assignments against swarm instances
+    print()
+    agent_errors, agent_warnings = _check_agent_assignments(config, initiatives)
+    blocking_errors += agent_errors
+    warnings += agent_warnings
+
+    if context_limit > 0:
+        print()
+        warnings += _check_context_size(initiatives, base_path, context_limit)
+
     return initiatives, blocking_errors, warnings
 
 
-def print_summary(initiatives: List[Initiative], blocking_errors: int, warnings: int, swarm_file: Path) -> int:
+def validate_swarms(swarm_files: List[Path], base_path: Path = Path("."),
+                    changed_since: Optional[str] = None,
+                    context_limit: int = SWARM_CONTEXT_LIMIT) -> Tuple[List[Initiative], int, int]:
+    """Validate several swarm configurations against one project scan.
+    
+    Besides validating each swarm, reports initiatives claimed by more
+    than one of the swarm files.
+    
+    Args:
+        swarm_files: Paths to swarm YAML files
+        base_path: Base path to search from
+        changed_since: Git revision; only initiatives changed since it (and
+            their dependents) are re-validated, the rest come from cache
+        context_limit: Token limit of each swarm's PRDs (0 disables the check)
+        
+    Returns:
+        Tuple of (initiatives, blocking_errors, warnings) over all swarms
+    """
+    try:
+        scan = scan_project(base_path, changed_since=changed_since)
+    except RuntimeError as e:
+        print(f"{Colors.RED}❌ Error: Cannot diff against {changed_since}: {e}{Colors.NC}")
+        return [], 1, 0
+    
+    if scan.revalidated is not None:
+        print(f"♻️  Incremental: re-validated {len(scan.revalidated)} of {len(scan.initiatives)} "
+              f"initiative(s) changed since {changed_since}, reused cached results for the rest")
+        print()
+    
+    # Fail fast: initiatives in a dependency cycle can never start
+    cycles = build_initiative_graph(scan.initiatives).cycles()
+    if cycles:
+        print_cycles(cycles, "initiative")
+        return [], len(cycles), 0
+    
+    all_initiatives = []
+    blocking_errors = 0
+    warnings = 0
+    claims: Dict[str, List[str]] = {}
+    
+    for index, swarm_file in enumerate(swarm_files):
+        if index:
+            print()
+            print("-" * 50)
+            print()
+        initiatives, errors, swarm_warnings = validate_swarm(swarm_file, base_path, scan=scan,
+                                                         context_limit=context_limit)
+        blocking_errors += errors
+        warnings += swarm_warnings
+        for initiative in initiatives:
+            claims.setdefault(initiative.name, []).append(swarm_file.name)
+            if initiative not in all_initiatives:
+                all_initiatives.append(initiative)
+    
+    if len(swarm_files) > 1:
+        blocking_errors += _check_swarm_overlap(claims)
+    
+    return all_initiatives, blocking_errors, warnings
+
+
+def print_summary(initiatives: List[Initiative], blocking_errors: int, warnings: int, swarm_files: List[Path]) -> int:
     """Print validation summary.
     
     Args:
         initiatives: List of validated initiatives
         blocking_errors: Number of blocking errors
         warnings: Number of warnings
-        swarm_file: Path to swarm file
+        swarm_files: Paths to the validated swarm files
         
     Returns:
         Exit code (0 for success, 1 for blocked)
     """
+    phase("render")
     ready_count = sum(1 for i in initiatives if i.status == Status.READY)
 
     print()
     print("=" * 50)
     print(f"{Colors.BOLD}VALIDATION SUMMARY{Colors.NC}")
     print("=" * 50)
+    if len(swarm_files) > 1:
+        print(f"📄 Swarm files: {len(swarm_files)}")
     print(f"✅ Ready initiatives: {ready_count}")
     print(f"❌ Blocking errors: {blocking_errors}")
     print(f"⚠️  Warnings: {warnings}")
@@ -104,16 +206,19 @@ def print_summary(initiatives: List[Initiative], blocking_errors: int, warnings:
         print(f"{Colors.GREEN}✅ All checks passed! Safe to start swarm.{Colors.NC}")
         print()
         print("Start swarm with:")
-        print(f"  claude-swarm start {swarm_file} --background")
+        for swarm_file in swarm_files:
+            print(f"  claude-swarm start {swarm_file} --background")
         return 0
 
 
-def _check_swarm_binding(swarm_file: Path, initiatives: List[Initiative], base_path: Path) -> Tuple[int, int]:
+def _check_swarm_binding(swarm_file: Path, initiatives: List[Initiative], scan: ProjectScan,
+                         base_path: Path) -> Tuple[int, int]:
     """Check bidirectional binding between swarm file and tasks.prd files.
     
     Args:
         swarm_file: Path to swarm YAML file
         initiatives: List of initiatives found in swarm
+        scan: Project scan providing the **Swarm** field of every initiative
         base_path: Base path to search from
         
     Returns:
@@ -135,42 +240,30 @@ def _check_swarm_binding(swarm_file: Path, initiatives: List[Initiative], base_p
     print()
     print("Direction 1: Swarm → Tasks")
     for init in initiatives:
-        task_file = init.directory / "tasks.prd"
-        if task_file.exists():
-            content = task_file.read_text()
-            if f"**Swarm**: {swarm_name}" in content:
-                print(f"{Colors.GREEN}  ✓{Colors.NC} {init.directory_name} references {swarm_name}")
-            elif "**Swarm**:" in content:
-                # Has Swarm field but different file
-                import re
-                match = re.search(r'\*\*Swarm\*\*:\s*(\S+)', content)
-                if match:
-                    other_swarm = match.group(1)
-                    print(f"{Colors.YELLOW}  ⚠{Colors.NC}  {init.directory_name} references different swarm: {other_swarm}")
-                    warnings += 1
-            else:
-                print(f"{Colors.YELLOW}  ⚠{Colors.NC}  {init.directory_name} missing Swarm field")
-                warnings += 1
-        else:
-            print(f"{Colors.RED}  ✗{Colors.NC} {init.directory_name} tasks.prd not found")
+        if not (init.directory / "tasks.prd").exists():
+            print(f"{Colors.RED}  ✗{Colors.NC} {init.name} tasks.prd not found")
             errors += 1
+        elif init.swarm == swarm_name:
+            print(f"{Colors.GREEN}  ✓{Colors.NC} {init.name} references {swarm_name}")
+        elif init.swarm:
+            # Has Swarm field but different file
+            print(f"{Colors.YELLOW}  ⚠{Colors.NC}  {init.name} references different swarm: {init.swarm}")
+            warnings += 1
+        else:
+            print(f"{Colors.YELLOW}  ⚠{Colors.NC}  {init.name} missing Swarm field")
+            warnings += 1
     
     # Check 2: Initiatives with this Swarm field should be in the swarm config
     print()
     print("Direction 2: Tasks → Swarm")
-    swarm_initiative_names = {i.directory_name for i in initiatives}
-    
-    for init_dir in initiatives_dir.iterdir():
-        if init_dir.is_dir() and init_dir.name.startswith(tuple('0123456789')):
-            task_file = init_dir / "tasks.prd"
-            if task_file.exists():
-                content = task_file.read_text()
-                if f"**Swarm**: {swarm_name}" in content:
-                    if init_dir.name in swarm_initiative_names:
-                        print(f"{Colors.GREEN}  ✓{Colors.NC} {init_dir.name} is in {swarm_name}")
-                    else:
-                        print(f"{Colors.RED}  ✗{Colors.NC} {init_dir.name} references {swarm_name} but not in swarm config")
-                        errors += 1
+    swarm_initiative_names = {i.name for i in initiatives}
+    
+    for init in scan.by_swarm.get(swarm_name, []):
+        if init.name in swarm_initiative_names:
+            print(f"{Colors.GREEN}  ✓{Colors.NC} {init.name} is in {swarm_name}")
+        else:
+            print(f"{Colors.RED}  ✗{Colors.NC} {init.name} references {swarm_name} but not in swarm config")
+            errors += 1
     
     print()
     if errors == 0 and warnings == 0:
@@ -183,6 +276,131 @@ def _check_swarm_binding(swarm_file: Path, initiatives: List[Initiative], base_p
     return errors, warnings
 
 
+def _check_agent_assignments(config: SwarmConfig, initiatives: List[Initiative]) -> Tuple[int, int]:
+    """Cross-check Agent: assignments in tasks.prd against swarm instances.
+    
+    Args:
+        config: Parsed swarm file
+        initiatives: Initiatives bound to the swarm
+        
+    Returns:
+        Tuple of (errors, warnings)
+    """
+    print(f"{Colors.BOLD}🤖 Checking Agent Assignments{Colors.NC}")
+    
+    if not config.agents:
+        print(f"{Colors.YELLOW}⚠️  Skipping agent check: no agent instances defined in swarm file{Colors.NC}")
+        return 0, 1
+    
+    errors = 0
+    warnings = 0
+    pending_count = {agent: 0 for agent in config.agents}
+    pending_hours = {agent: 0.0 for agent in config.agents}
+    
+    for init in initiatives:
+        tasks_file = init.directory / "tasks.prd"
+        if not tasks_file.exists():
+            continue
+        unassigned = 0
+        for task in extract_tasks(tasks_file):
+            agent = task['agent']
+            if agent and agent not in pending_count:
+                print(f"{Colors.RED}  ✗{Colors.NC} {init.name} {task['id']} assigned to unknown agent '{agent}'")
+                errors += 1
+                continue
+            if task['status'] == 'completed':
+                continue
+            if not agent:
+                unassigned += 1
+                continue
+            pending_count[agent] += 1
+            pending_hours[agent] += task['estimated_hours'] or 0.0
+        if unassigned:
+            print(f"{Colors.YELLOW}  ⚠{Colors.NC}  {init.name}: {unassigned} pending task(s) without Agent")
+            warnings += 1
+    
+    print()
+    print(f"  {'Instance':<20} {'Pending':>7} {'Hours':>8}")
+    for agent in config.agents:
+        line = f"  {agent:<20} {pending_count[agent]:>7} {pending_hours[agent]:>7.1f}h"
+        if pending_count[agent] == 0:
+            print(f"{Colors.YELLOW}{line}  ⚠ no work{Colors.NC}")
+            warnings += 1
+        else:
+            print(line)
+    
+    total_hours = sum(pending_hours.values())
+    if total_hours > 0:
+        busiest = max(pending_hours.values())
+        print()
+        print(f"  Total: {total_hours:.1f}h pending, busiest agent {busiest:.1f}h "
+              f"(balance {total_hours / len(config.agents) / busiest * 100:.0f}%)")
+    
+    return errors, warnings
+
+
+def _check_context_size(initiatives: List[Initiative], base_path: Path, limit: int) -> int:
+    """Warn when the PRDs a swarm works from exceed a token limit.
+    
+    Counts project-state.prd plus the description.prd and tasks.prd of
+    every bound initiative, using the cached estimates of aipo.tokens.
+    
+    Args:
+        initiatives: Initiatives bound to the swarm
+        base_path: Base path to search from
+        limit: Token limit
+        
+    Returns:
+        Number of warnings (0 or 1)
+    """
+    print(f"{Colors.BOLD}📏 Checking Context Size{Colors.NC}")
+    
+    counter = TokenCounter(base_path)
+    files = [counter.count(base_path / PROJECT_STATE)]
+    for init in initiatives:
+        if init.archived:
+            continue
+        files.append(counter.count(init.directory / "description.prd"))
+        files.append(counter.count(init.directory / "tasks.prd"))
+    counter.save()
+    files = [file for file in files if file is not None]
+    total = sum(file.tokens for file in files)
+    
+    if total <= limit:
+        print(f"  ~{total:,} tokens in {len(files)} file(s) (limit {limit:,})")
+        return 0
+    
+    print(f"{Colors.YELLOW}⚠️  ~{total:,} tokens in {len(files)} file(s) exceed the "
+          f"{limit:,}-token context limit{Colors.NC}")
+    for file in sorted(files, key=lambda file: -file.tokens)[:3]:
+        print(f"  {file.tokens:>9,}  {file.path}")
+    print("  Split the swarm, archive finished initiatives or trim the largest PRDs")
+    return 1
+
+
+def _check_swarm_overlap(claims: Dict[str, List[str]]) -> int:
+    """Report initiatives claimed by more than one swarm file.
+    
+    Args:
+        claims: Initiative name -> swarm file names that list it
+        
+    Returns:
+        Number of blocking errors
+    """
+    print()
+    print(f"{Colors.BOLD}🔀 Checking Swarm Overlap{Colors.NC}")
+    print()
+    
+    overlaps = {name: swarms for name, swarms in claims.items() if len(swarms) > 1}
+    if not overlaps:
+        print(f"{Colors.GREEN}✅ No initiative is claimed by more than one swarm{Colors.NC}")
+        return 0
+    
+    for name, swarms in sorted(overlaps.items()):
+        print(f"{Colors.RED}  ✗{Colors.NC} {name} claimed by {', '.join(swarms)}")
+    return len(overlaps)
+
+
 def _print_initiative_status(initiative: Initiative) -> None:
     """Print the status of an initiative.
     
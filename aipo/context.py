@@ -0,0 +1,255 @@
+"""Token-budgeted context packs for a single task.
+
+A pack holds what an agent needs to start one task, in priority order:
+the task block, the status of its direct and cross-initiative
+dependencies, the description.prd sections most relevant to the task
+and the related project-state.prd module. Parts are added until the
+token budget is spent; the last one that does not fit is trimmed.
+
+Packs are cached in ai-project/.aipo/cache, keyed by a hash of every
+file they were built from, so repeated dispatches of the same task
+reuse them until one of those files changes.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .archive import load_archived_initiatives, not_found_message
+from .cache import load_cached, store_cached
+from .search import BM25_B, BM25_K1, tokenize
+from .tokens import estimate_tokens, trim_to_tokens
+from .utils import (
+    parse_tasks,
+    read_text,
+    resolve_initiative_directory,
+    split_modules,
+    split_sections,
+    task_blocks,
+)
+
+
+PROJECT_STATE = Path("ai-project") / "project-state.prd"
+
+DEFAULT_BUDGET = 1500
+
+# Smallest leftover budget worth filling with a trimmed part
+MIN_PART_TOKENS = 40
+
+_CACHE_VERSION = 1
+
+_TARGET_MODULES = re.compile(r'\*\*Target Modules\*\*:(.*?)(?:\n\s*\n|\n\*\*|\Z)', re.DOTALL)
+
+_STATUS_LABELS = {'completed': "done", 'in_progress': "in progress", 'pending': "pending"}
+
+
+@dataclass
+class ContextPart:
+    """One block of a context pack."""
+    kind: str  # "task", "dependencies", "section" or "module"
+    title: str
+    text: str
+    tokens: int
+    trimmed: bool = False
+
+
+@dataclass
+class ContextPack:
+    """Context assembled for one task."""
+    initiative: str
+    task_id: str
+    budget: int
+    parts: List[ContextPart] = field(default_factory=list)
+    cached: bool = False
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens of all parts."""
+        return sum(part.tokens for part in self.parts)
+
+    def render(self) -> str:
+        """The pack as markdown, parts in reading order."""
+        order = {'task': 0, 'dependencies': 1, 'section': 2, 'module': 3}
+        parts = sorted(self.parts, key=lambda part: order[part.kind])
+        return "\n\n".join(part.text for part in parts) + "\n"
+
+
+def build_context(initiative: str, task_id: str, base_path: Path = Path("."),
+                  budget: int = DEFAULT_BUDGET) -> ContextPack:
+    """Assemble (or load from cache) the context pack of a task.
+
+    Args:
+        initiative: Initiative directory, name or ID
+        task_id: Task ID (e.g. "TASK-004")
+        base_path: Project base path
+        budget: Token budget of the pack
+
+    Returns:
+        ContextPack within the budget (the task block alone is trimmed if
+        it exceeds it)
+
+    Raises:
+        ValueError: If the initiative or task does not exist
+    """
+    directory = resolve_initiative_directory(initiative, base_path)
+    if directory is None or not (directory / "tasks.prd").exists():
+        raise ValueError(not_found_message(initiative, base_path))
+    task_id = task_id.upper()
+
+    tasks_content = read_text(directory / "tasks.prd")
+    tasks = parse_tasks(tasks_content)
+    index = next((i for i, task in enumerate(tasks) if task['id'] == task_id), None)
+    if index is None:
+        raise ValueError(f"{directory.name}: Task not found: {task_id}")
+    task = tasks[index]
+
+    description = _read_optional(directory / "description.prd")
+    project_state = _read_optional(base_path / PROJECT_STATE)
+    cross_contents = {
+        name: _read_optional(base_path / "ai-project" / "initiatives" / name / "tasks.prd")
+        for name in sorted({key.split('/', 1)[0] for key in task['cross_dependencies']})
+    }
+
+    digest = hashlib.blake2b(digest_size=16)
+    for text in [task_id, str(budget), tasks_content, description, project_state,
+                 *(f"{name}\0{content}" for name, content in cross_contents.items())]:
+        digest.update(text.encode('utf-8'))
+        digest.update(b"\0")
+    cache_name = f"context-{directory.name}-{task_id}.json"
+    cache_key = [_CACHE_VERSION, digest.hexdigest()]
+    cached = load_cached(base_path, cache_name, cache_key)
+    if cached is not None:
+        try:
+            return ContextPack(directory.name, task_id, budget,
+                               [ContextPart(**part) for part in cached], cached=True)
+        except TypeError:
+            pass
+
+    block = task_blocks(tasks_content, tasks)[index]
+    pack = ContextPack(directory.name, task_id, budget)
+    remaining = budget
+
+    task_text = f"# {directory.name} {task_id} (Task Group {task['group']})\n\n{block}"
+    remaining -= _add(pack, 'task', task_id, task_text, remaining)
+
+    dependencies = _dependency_lines(task, tasks, cross_contents, base_path)
+    if dependencies and remaining >= MIN_PART_TOKENS:
+        remaining -= _add(pack, 'dependencies', "Dependencies",
+                          "## Dependencies\n\n" + "\n".join(dependencies), remaining)
+
+    query = tokenize(f"{task['title']} {block}")
+    sections = [(heading, text) for heading, text in split_sections(description)
+                if not heading.lower().startswith('references')]
+    section_scores = _rank(query, [tokenize(text) for _, text in sections])
+    ranked = [sections[i] for i in sorted(range(len(sections)), key=lambda i: -section_scores[i])
+              if section_scores[i] > 0]
+
+    module = _related_module(query, description, project_state)
+    candidates = [('section', heading, text) for heading, text in ranked]
+    if module:
+        candidates.insert(1, ('module', module[0], module[1]))
+
+    for kind, title, text in candidates:
+        if remaining < MIN_PART_TOKENS:
+            break
+        remaining -= _add(pack, kind, title, text, remaining)
+
+    store_cached(base_path, cache_name, cache_key, [asdict(part) for part in pack.parts])
+    return pack
+
+
+def _add(pack: ContextPack, kind: str, title: str, text: str, budget: int) -> int:
+    """Append a part, trimmed to the budget; returns the tokens it used."""
+    tokens = estimate_tokens(text)
+    trimmed = tokens > budget
+    if trimmed:
+        text = trim_to_tokens(text, budget, marker="… (trimmed)")
+        tokens = estimate_tokens(text)
+        if not text:
+            return 0
+    pack.parts.append(ContextPart(kind, title, text, tokens, trimmed))
+    return tokens
+
+
+def _read_optional(path: Path) -> str:
+    try:
+        return read_text(path)
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _dependency_lines(task: Dict, tasks: List[Dict], cross_contents: Dict[str, str],
+                      base_path: Path) -> List[str]:
+    """One line per direct and cross-initiative dependency with its status."""
+    by_id = {t['id']: t for t in tasks}
+    lines = []
+    for dep in task['dependencies']:
+        lines.append(_dependency_line(dep, by_id.get(dep)))
+
+    parsed = {name: {t['id']: t for t in parse_tasks(content)}
+              for name, content in cross_contents.items() if content}
+    archived = None
+    for key in task['cross_dependencies']:
+        name, dep_id = key.split('/', 1)
+        if name in parsed:
+            lines.append(_dependency_line(key, parsed[name].get(dep_id)))
+            continue
+        if archived is None:
+            archived = {init.name for init in load_archived_initiatives(base_path)}
+        if name in archived:
+            lines.append(f"- [x] {key} (done, archived)")
+        else:
+            lines.append(f"- [ ] {key} (not found)")
+    return lines
+
+
+def _dependency_line(label: str, task: Optional[Dict]) -> str:
+    if task is None:
+        return f"- [ ] {label} (not found)"
+    checkbox = "x" if task['status'] == 'completed' else " "
+    return f"- [{checkbox}] {label}: {task['title']} ({_STATUS_LABELS.get(task['status'], task['status'])})"
+
+
+def _rank(query: Sequence[str], documents: Sequence[List[str]]) -> List[float]:
+    """BM25 score of each document against the query terms, with statistics local to the documents."""
+    if not documents:
+        return []
+    terms = set(query)
+    df = Counter(term for doc in documents for term in set(doc) & terms)
+    average_length = sum(len(doc) for doc in documents) / len(documents) or 1.0
+    scores = []
+    for doc in documents:
+        frequencies = Counter(term for term in doc if term in terms)
+        score = 0.0
+        for term, tf in frequencies.items():
+            idf = math.log(1 + (len(documents) - df[term] + 0.5) / (df[term] + 0.5))
+            norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / average_length)
+            score += idf * tf * (BM25_K1 + 1) / norm
+        scores.append(score)
+    return scores
+
+
+def _related_module(query: Sequence[str], description: str, project_state: str) -> Optional[Tuple[str, str]]:
+    """The project-state module named in **Target Modules** or closest to the task.
+
+    Among the modules the description targets, the one most relevant to
+    the task wins; without targets, the most relevant module overall.
+    """
+    modules = split_modules(project_state)
+    if not modules:
+        return None
+    scores = _rank(query, [tokenize(text) for _, text in modules])
+
+    targets = _TARGET_MODULES.search(description)
+    if targets:
+        target_text = targets.group(1).lower()
+        targeted = [i for i, (name, _) in enumerate(modules) if name.lower() in target_text]
+        if targeted:
+            return modules[max(targeted, key=lambda i: scores[i])]
+
+    best = max(range(len(modules)), key=lambda i: scores[i])
+    return modules[best] if scores[best] > 0 else None
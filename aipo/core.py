@@ -1,12 +1,21 @@
 """Core validation and analysis functions."""
 
+import hashlib
+import os
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
 
-from .models import Initiative, Status
+from .archive import ARCHIVE_DIR, INDEX_NAME, load_archived_initiatives
+from .cache import load_cached, stat_key, store_cached
+from .graph import dependency_id
+from .models import Initiative, ProjectScan, Status
+from .profiling import phase, timed
+from .telemetry import counters
+from .utils import git_changed_files, parse_tasks
 
 
+@timed("validate initiative")
 def validate_initiative(directory: Path) -> Initiative:
     """Validate a single initiative directory.
     
@@ -16,6 +25,7 @@ def validate_initiative(directory: Path) -> Initiative:
     Returns:
         Initiative object with validation results
     """
+    counters.scanned += 1
     name = directory.name
     init_id = name.split('-')[0]
 
@@ -40,7 +50,9 @@ def validate_initiative(directory: Path) -> Initiative:
         return initiative
 
     # Validate tasks.prd content
+    phase("read")
     tasks_content = tasks_file.read_text()
+    phase("parse")
 
     # Validate new format structure
     if "**Initiative ID**:" not in tasks_content:
@@ -78,6 +90,13 @@ def validate_initiative(directory: Path) -> Initiative:
     completed_matches = re.findall(r'^- \[x\] TASK-\d+', tasks_content, re.MULTILINE)
     initiative.completed_count = len(completed_matches)
 
+    # Completed tasks per agent, kept with the cached and archived results
+    # so history snapshots never re-read tasks.prd
+    if initiative.completed_count:
+        for task in parse_tasks(tasks_content):
+            if task['agent'] and task['status'] == 'completed':
+                initiative.agent_completed[task['agent']] = initiative.agent_completed.get(task['agent'], 0) + 1
+
     if initiative.task_count == 0:
         initiative.issues.append("tasks.prd exists but has no tasks defined")
         initiative.status = Status.BLOCKED
@@ -153,28 +172,214 @@ def _extract_initiative_metadata(initiative: Initiative, content: str) -> None:
     hours_match = re.search(r'\*\*Estimated Hours\*\*:\s*(\d+)', content)
     if hours_match:
         initiative.estimated_hours = int(hours_match.group(1))
+    
+    # Extract swarm binding (archived bindings no longer count)
+    swarm_match = re.search(r'\*\*Swarm\*\*:\s*(\S+)([^\n]*)', content)
+    if swarm_match and '(archived' not in swarm_match.group(2):
+        initiative.swarm = swarm_match.group(1)
 
 
-def get_all_initiatives(base_path: Path = Path(".")) -> List[Initiative]:
+@timed("scan")
+def get_all_initiatives(base_path: Path = Path("."), changed_since: Optional[str] = None) -> List[Initiative]:
     """Get all initiatives in the project.
     
     Args:
         base_path: Base path to search from
+        changed_since: Git revision; when given, only initiatives touched
+            since it (and their dependents) are re-validated, the rest come
+            from the validation cache (see get_initiatives_incremental)
         
     Returns:
         List of Initiative objects
     """
+    if changed_since:
+        return get_initiatives_incremental(base_path, changed_since)[0]
+    
+    return _with_archived(base_path, [validate_initiative(d) for d in _initiative_directories(base_path)])
+
+
+def _with_archived(base_path: Path, initiatives: List[Initiative]) -> List[Initiative]:
+    """Add archived initiatives from the archive index, sorted by name.
+    
+    A hot directory wins over an index entry with the same name.
+    """
+    hot = {init.name for init in initiatives}
+    cold = [init for init in load_archived_initiatives(base_path) if init.name not in hot]
+    if not cold:
+        return initiatives
+    return sorted(initiatives + cold, key=lambda init: init.name)
+
+
+@timed("list dirs")
+def _initiative_directories(base_path: Path) -> List[Path]:
+    """Sorted initiative directories (NNNN-name) of a project."""
     initiatives_dir = base_path / "ai-project" / "initiatives"
 
     if not initiatives_dir.exists():
         return []
 
-    directories = sorted([
+    return sorted([
         d for d in initiatives_dir.iterdir()
         if d.is_dir() and d.name[0].isdigit()
     ])
 
-    return [validate_initiative(d) for d in directories]
+
+# Files of an initiative directory that validate_initiative() reads
+_FINGERPRINT_FILES = ("description.prd", "tasks.prd")
+
+
+def project_fingerprint(base_path: Path = Path(".")) -> str:
+    """Cheap fingerprint of every input to initiative validation.
+    
+    Hashes the initiative directory names, the (mtime_ns, size) of each
+    description.prd and tasks.prd, and that of the archive index. It
+    costs one directory listing and two stat calls per initiative and
+    reads no file contents, so pollers can skip a full scan when nothing
+    changed.
+    
+    Args:
+        base_path: Base path to search from
+        
+    Returns:
+        16-character hex digest ("0" * 16 if there are no initiatives)
+    """
+    initiatives_dir = os.path.join(base_path, "ai-project", "initiatives")
+    try:
+        names = sorted(
+            entry.name for entry in os.scandir(initiatives_dir)
+            if entry.name[0].isdigit() and entry.is_dir()
+        )
+    except OSError:
+        return "0" * 16
+    
+    digest = hashlib.blake2b(digest_size=8)
+    try:
+        st = os.stat(os.path.join(base_path, ARCHIVE_DIR, INDEX_NAME))
+        digest.update(b"archive:%d:%d;" % (st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    for name in names:
+        digest.update(name.encode())
+        for filename in _FINGERPRINT_FILES:
+            try:
+                st = os.stat(os.path.join(initiatives_dir, name, filename))
+                digest.update(b"%s:%d:%d;" % (filename.encode(), st.st_mtime_ns, st.st_size))
+            except OSError:
+                digest.update(b"%s:-;" % filename.encode())
+    return digest.hexdigest()
+
+
+# Cache entry holding serialized validation results by directory name
+_VALIDATION_CACHE = "initiatives.json"
+_VALIDATION_CACHE_KEY = 3
+
+
+def _content_digest(directory: Path) -> str:
+    """Hash of the files validate_initiative() reads in a directory."""
+    digest = hashlib.blake2b(digest_size=16)
+    for filename in _FINGERPRINT_FILES:
+        try:
+            with open(directory / filename, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"-")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_initiatives_incremental(base_path: Path, changed_since: str) -> Tuple[List[Initiative], Set[str]]:
+    """Re-validate only initiatives changed since a git revision.
+    
+    One ``git diff --name-only`` finds touched initiative directories.
+    Those, initiatives missing from the validation cache, and everything
+    that (transitively) depends on them are re-validated; the rest are
+    loaded from the cache.
+    
+    Each cache entry records the (mtime_ns, size) and a content hash of
+    the initiative's description.prd and tasks.prd. An entry whose stat
+    key differs is only reused if the content hash still matches (a fresh
+    CI checkout touches every mtime), so results never outlive an edit
+    or a branch switch the diff does not show.
+    
+    Args:
+        base_path: Base path to search from
+        changed_since: Git revision to diff against
+        
+    Returns:
+        Tuple of (initiatives, names of re-validated initiatives)
+        
+    Raises:
+        RuntimeError: If git cannot diff against the revision
+    """
+    prefix = "ai-project/initiatives/"
+    changed = {
+        path[len(prefix):].split('/', 1)[0]
+        for path in git_changed_files(base_path, changed_since)
+        if path.startswith(prefix)
+    }
+    
+    cached = load_cached(base_path, _VALIDATION_CACHE, _VALIDATION_CACHE_KEY) or {}
+    directories = _initiative_directories(base_path)
+    stale = {d.name for d in directories if d.name in changed}
+    
+    initiatives = {}
+    entries = {}
+    for directory in directories:
+        key = [stat_key(directory / filename) for filename in _FINGERPRINT_FILES]
+        entry = cached.get(directory.name) if directory.name not in stale else None
+        digest = None
+        if isinstance(entry, dict) and entry.get('key') != key:
+            digest = _content_digest(directory)
+            if entry.get('digest') != digest:
+                entry = None
+        if isinstance(entry, dict):
+            try:
+                initiatives[directory.name] = Initiative.from_dict(entry['initiative'])
+                entries[directory.name] = dict(entry, key=key)
+                counters.scanned += 1
+                continue
+            except (KeyError, TypeError, ValueError):
+                pass
+        stale.add(directory.name)
+        initiatives[directory.name] = validate_initiative(directory)
+        entries[directory.name] = {'key': key, 'digest': digest or _content_digest(directory)}
+    
+    # Dependents of changed initiatives are re-checked too
+    stale_ids = {name.split('-')[0] for name in stale} | {name.split('-')[0] for name in changed}
+    dependents = {}
+    for init in initiatives.values():
+        for dependency in init.dependencies:
+            dependents.setdefault(dependency_id(dependency), []).append(init)
+    queue = list(stale_ids)
+    while queue:
+        for init in dependents.get(queue.pop(), []):
+            if init.name not in stale:
+                stale.add(init.name)
+                initiatives[init.name] = validate_initiative(init.directory)
+                queue.append(init.id)
+    
+    store_cached(base_path, _VALIDATION_CACHE, _VALIDATION_CACHE_KEY, {
+        name: dict(entries[name], initiative=init.to_dict()) for name, init in initiatives.items()
+    })
+    
+    return _with_archived(base_path, [initiatives[d.name] for d in directories]), stale
+
+
+def scan_project(base_path: Path = Path("."), changed_since: Optional[str] = None) -> ProjectScan:
+    """Read every initiative once and index it by ID and swarm.
+    
+    Args:
+        base_path: Base path to search from
+        changed_since: Git revision for incremental validation (see
+            get_initiatives_incremental)
+        
+    Returns:
+        ProjectScan with initiatives and lookup indexes
+    """
+    if changed_since:
+        initiatives, revalidated = get_initiatives_incremental(base_path, changed_since)
+        return ProjectScan(initiatives, revalidated=revalidated)
+    return ProjectScan(get_all_initiatives(base_path))
 
 
 def categorize_initiatives(initiatives: List[Initiative]) -> Tuple[List[Initiative], List[Initiative], List[Initiative], List[Initiative]]:
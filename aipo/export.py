@@ -0,0 +1,218 @@
+"""Columnar export of agent activity for offline analysis.
+
+Writes three tables from a session log:
+
+- ``work_periods``: one row per agent request→result cycle
+- ``concurrency``: number of busy agents at each wall-clock minute
+- ``agents``: per-agent aggregates (tasks, active time, utilization)
+
+CSV is always available. Arrow IPC and Parquet need the optional
+``pyarrow`` package. Work periods are written in batches while the log is
+streamed; only per-minute and per-agent accumulators stay in memory, and
+those grow with session length and agent count, not log size.
+"""
+
+import csv
+import math
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from .activity import iter_work_periods
+
+
+EXPORT_FORMATS = ('csv', 'parquet', 'arrow')
+DEFAULT_BATCH_SIZE = 10_000
+
+_WORK_PERIOD_COLUMNS = ['agent', 'start', 'end', 'duration_s']
+_CONCURRENCY_COLUMNS = ['minute', 'active_agents']
+_AGENT_COLUMNS = ['agent', 'tasks', 'active_s', 'first_start', 'last_end', 'utilization']
+
+
+class _CsvTable:
+    """Append-only CSV table writer."""
+
+    def __init__(self, path: Path, columns: List[str]):
+        self.path = path
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write_batch(self, columns: Dict[str, list]) -> None:
+        values = [[_csv_value(v) for v in col] for col in columns.values()]
+        self._writer.writerows(zip(*values))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowTable:
+    """Append-only Arrow IPC or Parquet table writer."""
+
+    def __init__(self, path: Path, schema, fmt: str):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.path = path
+        self._pa = pa
+        self._schema = schema
+        if fmt == 'parquet':
+            self._writer = pq.ParquetWriter(str(path), schema, compression='zstd')
+        else:
+            self._writer = pa.ipc.new_file(str(path), schema)
+
+    def write_batch(self, columns: Dict[str, list]) -> None:
+        batch = self._pa.record_batch(
+            [self._pa.array(values, type=self._schema.field(name).type) for name, values in columns.items()],
+            schema=self._schema,
+        )
+        if hasattr(self._writer, 'write_batch'):
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write_table(self._pa.Table.from_batches([batch]))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _csv_value(value):
+    """Render a cell value compactly for CSV."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return value
+
+
+def _schemas():
+    """Typed Arrow schemas for the exported tables."""
+    import pyarrow as pa
+
+    ts = pa.timestamp('ms', tz='UTC')
+    agent = pa.dictionary(pa.int16(), pa.string())
+    return {
+        'work_periods': pa.schema([('agent', agent), ('start', ts), ('end', ts), ('duration_s', pa.float32())]),
+        'concurrency': pa.schema([('minute', ts), ('active_agents', pa.int16())]),
+        'agents': pa.schema([
+            ('agent', pa.string()), ('tasks', pa.int32()), ('active_s', pa.float64()),
+            ('first_start', ts), ('last_end', ts), ('utilization', pa.float32()),
+        ]),
+    }
+
+
+def _open_table(out_dir: Path, name: str, columns: List[str], fmt: str):
+    """Open a table writer for the requested format."""
+    if fmt == 'csv':
+        return _CsvTable(out_dir / f"{name}.csv", columns)
+    suffix = 'parquet' if fmt == 'parquet' else 'arrow'
+    return _ArrowTable(out_dir / f"{name}.{suffix}", _schemas()[name], fmt)
+
+
+def export_activity(log_file: Path, out_dir: Path, fmt: str = 'csv',
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> List[Path]:
+    """Export agent activity from a session log as columnar tables.
+
+    Args:
+        log_file: Path to session.log.json (plain or compressed)
+        out_dir: Directory to write tables into (created if missing)
+        fmt: One of 'csv', 'parquet' or 'arrow'
+        batch_size: Number of work periods buffered per write
+
+    Returns:
+        Paths of the written files
+
+    Raises:
+        ValueError: If the format is unknown
+        RuntimeError: If an Arrow format is requested without pyarrow
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(EXPORT_FORMATS)})")
+    if fmt != 'csv':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError(f"{fmt} export requires the 'pyarrow' package (pip install pyarrow)")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Per-minute busy-agent deltas: +1 at the first minute boundary inside a
+    # period, -1 at the first boundary at or after its end
+    minute_deltas: Dict[int, int] = {}
+    agents: Dict[str, list] = {}  # agent -> [tasks, active_s, first_start, last_end]
+    session_start = session_end = None
+
+    periods = _open_table(out_dir, 'work_periods', _WORK_PERIOD_COLUMNS, fmt)
+    batch = {name: [] for name in _WORK_PERIOD_COLUMNS}
+    try:
+        for period in iter_work_periods(log_file):
+            duration = period.duration_seconds
+            batch['agent'].append(period.agent)
+            batch['start'].append(period.start)
+            batch['end'].append(period.end)
+            batch['duration_s'].append(duration)
+            if len(batch['agent']) >= batch_size:
+                periods.write_batch(batch)
+                batch = {name: [] for name in _WORK_PERIOD_COLUMNS}
+
+            first_minute = math.ceil(period.start.timestamp() / 60)
+            end_minute = math.ceil(period.end.timestamp() / 60)
+            if end_minute > first_minute:
+                minute_deltas[first_minute] = minute_deltas.get(first_minute, 0) + 1
+                minute_deltas[end_minute] = minute_deltas.get(end_minute, 0) - 1
+
+            stats = agents.setdefault(period.agent, [0, 0.0, period.start, period.end])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = min(stats[2], period.start)
+            stats[3] = max(stats[3], period.end)
+
+            session_start = period.start if session_start is None else min(session_start, period.start)
+            session_end = period.end if session_end is None else max(session_end, period.end)
+
+        if batch['agent']:
+            periods.write_batch(batch)
+    finally:
+        periods.close()
+
+    written = [periods.path]
+
+    # Concurrency: one row per minute over the session span
+    concurrency = _open_table(out_dir, 'concurrency', _CONCURRENCY_COLUMNS, fmt)
+    try:
+        if session_start is not None:
+            first = int(session_start.timestamp()) // 60
+            last = int(session_end.timestamp()) // 60
+            active = 0
+            batch = {name: [] for name in _CONCURRENCY_COLUMNS}
+            for minute in range(first, last + 1):
+                active += minute_deltas.get(minute, 0)
+                batch['minute'].append(datetime.fromtimestamp(minute * 60, tz=timezone.utc))
+                batch['active_agents'].append(active)
+                if len(batch['minute']) >= batch_size:
+                    concurrency.write_batch(batch)
+                    batch = {name: [] for name in _CONCURRENCY_COLUMNS}
+            if batch['minute']:
+                concurrency.write_batch(batch)
+    finally:
+        concurrency.close()
+    written.append(concurrency.path)
+
+    # Per-agent aggregates
+    session_seconds = (session_end - session_start).total_seconds() if session_start is not None else 0
+    agent_table = _open_table(out_dir, 'agents', _AGENT_COLUMNS, fmt)
+    try:
+        rows = {name: [] for name in _AGENT_COLUMNS}
+        for agent, (tasks, active_s, first_start, last_end) in sorted(agents.items()):
+            rows['agent'].append(agent)
+            rows['tasks'].append(tasks)
+            rows['active_s'].append(active_s)
+            rows['first_start'].append(first_start)
+            rows['last_end'].append(last_end)
+            rows['utilization'].append(active_s / session_seconds if session_seconds > 0 else 0.0)
+        if rows['agent']:
+            agent_table.write_batch(rows)
+    finally:
+        agent_table.close()
+    written.append(agent_table.path)
+
+    return written
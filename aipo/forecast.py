@@ -0,0 +1,324 @@
+"""Monte Carlo completion forecasting over the remaining task graph.
+
+Each iteration samples a duration for every unfinished task (its
+estimate times an actual/estimate ratio) and propagates finish times
+through the task DAG in topological order. All iterations advance
+together, one task at a time, as NumPy arrays when NumPy is installed
+and as plain lists otherwise.
+"""
+
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence
+
+from .activity import find_latest_session, find_session_log, iter_work_periods, percentile
+from .graph import DependencyGraph
+from .models import Initiative
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+
+DEFAULT_ITERATIONS = 10000
+
+# Estimate for tasks without "Estimated:" when the initiative has no total either
+DEFAULT_TASK_HOURS = 2.0
+
+# Working hours per calendar day (same convention as format_time_estimate)
+HOURS_PER_DAY = 8
+
+PERCENTILES = (50, 85, 95)
+
+# Completed tasks with a logged duration needed before their ratios are used
+MIN_RATIO_SAMPLES = 5
+
+# Default actual/estimate ratio: lognormal with median e^0.1 ≈ 1.1 (mild overrun)
+DEFAULT_RATIO_MU = 0.1
+DEFAULT_RATIO_SIGMA = 0.5
+
+# Quantiles of the ratio distribution the pure-Python engine samples from
+# (one random byte per draw)
+RATIO_TABLE_SIZE = 256
+
+
+@dataclass
+class Forecast:
+    """Simulated completion times, in working hours from the start time."""
+    iterations: int
+    start: datetime
+    engine: str  # "numpy" or "python"
+    ratio_source: str  # Human-readable source of the duration distribution
+    remaining_tasks: int
+    overall: Dict[int, float] = field(default_factory=dict)  # percentile -> hours
+    initiatives: Dict[str, Dict[int, float]] = field(default_factory=dict)  # name -> percentile -> hours
+    on_time: Dict[str, float] = field(default_factory=dict)  # name -> P(finish by **Target Date**)
+    hours_per_day: float = HOURS_PER_DAY
+
+    def finish_date(self, hours: float) -> datetime:
+        """Calendar date reached after a number of working hours."""
+        return self.start + timedelta(days=hours / self.hours_per_day)
+
+
+def task_estimates(initiatives: Sequence[Initiative], tasks: Dict[str, List[dict]]) -> Dict[str, float]:
+    """Estimated hours of every task, keyed by ``NNNN-name/TASK-XXX``.
+
+    Tasks without an ``Estimated:`` bullet get an even share of the
+    initiative's **Estimated Hours**, or DEFAULT_TASK_HOURS.
+    """
+    estimates = {}
+    for init in initiatives:
+        init_tasks = tasks.get(init.id, [])
+        share = (init.estimated_hours / len(init_tasks)) if init.estimated_hours and init_tasks else DEFAULT_TASK_HOURS
+        for task in init_tasks:
+            estimates[f"{init.name}/{task['id']}"] = task['estimated_hours'] or share
+    return estimates
+
+
+def historical_ratios(estimates: Dict[str, float], log_file: Optional[Path] = None) -> List[float]:
+    """Actual/estimate ratios of tasks worked on in a swarm session.
+
+    Args:
+        estimates: Task estimates by task key
+        log_file: Session log (defaults to the latest session)
+
+    Returns:
+        One ratio per task with both a logged duration and an estimate
+    """
+    if log_file is None:
+        session_path = find_latest_session()
+        log_file = find_session_log(session_path) if session_path else None
+    if log_file is None:
+        return []
+
+    actual: Dict[str, float] = {}
+    for period in iter_work_periods(log_file):
+        key = period.task_key
+        if key in estimates:
+            actual[key] = actual.get(key, 0.0) + period.duration_seconds / 3600
+    return [hours / estimates[key] for key, hours in actual.items() if estimates[key] > 0 and hours > 0]
+
+
+def forecast(
+    initiatives: Sequence[Initiative],
+    tasks: Dict[str, List[dict]],
+    graph: DependencyGraph,
+    iterations: int = DEFAULT_ITERATIONS,
+    agents: Optional[int] = None,
+    ratios: Optional[List[float]] = None,
+    seed: Optional[int] = None,
+    start: Optional[datetime] = None,
+    hours_per_day: float = HOURS_PER_DAY,
+    use_numpy: bool = True
+) -> Forecast:
+    """Simulate completion of all unfinished tasks.
+
+    Within an iteration a task starts when all its dependencies finish
+    (unlimited parallelism). The overall finish is additionally bounded
+    below by the total sampled work divided by ``agents``.
+
+    Args:
+        initiatives: Initiatives of the project
+        tasks: Parsed tasks by initiative ID (see graph.load_tasks)
+        graph: Acyclic task graph built from the same tasks
+        iterations: Number of simulated completions
+        agents: Concurrent agents for the capacity bound (None = unbounded)
+        ratios: Historical actual/estimate ratios to resample; the default
+            lognormal distribution is used with fewer than MIN_RATIO_SAMPLES
+        seed: Random seed for reproducible runs
+        start: Forecast start time (defaults to now)
+        hours_per_day: Working hours per calendar day
+        use_numpy: Use NumPy when it is installed
+
+    Returns:
+        Forecast
+    """
+    start = start or datetime.now()
+    estimates = task_estimates(initiatives, tasks)
+
+    done = {
+        f"{init.name}/{task['id']}"
+        for init in initiatives for task in tasks.get(init.id, [])
+        if task['status'] == 'completed'
+    }
+    # Virtual "initiative done" joins are kept as zero-hour steps
+    order = [key for key in graph.levels(include_virtual=True) if key not in done]
+    index = {key: i for i, key in enumerate(order)}
+    deps = [[index[d] for d in graph.deps[key] if d in index] for key in order]
+
+    if ratios and len(ratios) >= MIN_RATIO_SAMPLES:
+        ratio_source = f"{len(ratios)} historical actual/estimate ratios"
+    else:
+        ratios = None
+        ratio_source = f"default lognormal (median ×{math.exp(DEFAULT_RATIO_MU):.2f})"
+
+    engine = "numpy" if (use_numpy and np is not None) else "python"
+    simulate = _simulate_numpy if engine == "numpy" else _simulate_python
+    initiative_of = [key.split('/', 1)[0] for key in order]
+    hours = [0.0 if key in graph.virtual else estimates.get(key, DEFAULT_TASK_HOURS) for key in order]
+    by_initiative, overall = simulate(hours, deps, initiative_of, iterations, ratios, seed, agents)
+
+    task_count = sum(1 for key in order if key not in graph.virtual)
+    result = Forecast(iterations, start, engine, ratio_source, task_count, hours_per_day=hours_per_day)
+    result.overall = overall
+    for init in initiatives:
+        if init.name not in by_initiative:
+            continue
+        samples, percentiles = by_initiative[init.name]
+        result.initiatives[init.name] = percentiles
+        budget = _target_budget(init.target_date, start, hours_per_day)
+        if budget is None:
+            continue
+        if engine == "numpy":
+            result.on_time[init.name] = float((samples <= budget).mean())
+        else:
+            result.on_time[init.name] = sum(1 for s in samples if s <= budget) / len(samples)
+    return result
+
+
+def _target_budget(target_date: Optional[str], start: datetime, hours_per_day: float) -> Optional[float]:
+    """Working hours between start and the end of **Target Date** (None if unparseable)."""
+    if not target_date:
+        return None
+    try:
+        target = date.fromisoformat(target_date.strip()[:10])
+    except ValueError:
+        return None
+    end = datetime.combine(target + timedelta(days=1), datetime.min.time())
+    return (end - start).total_seconds() / 86400 * hours_per_day
+
+
+def _task_bookkeeping(deps, initiative_of):
+    """Dependent counts, and which tasks can finish their initiative.
+
+    Finish times are dropped once their last dependent is processed, and
+    only tasks with no dependent in their own initiative ("sinks") are
+    folded into the initiative's finish time.
+    """
+    pending = [0] * len(deps)
+    local_dependent = [False] * len(deps)
+    for i, task_deps in enumerate(deps):
+        for d in task_deps:
+            pending[d] += 1
+            if initiative_of[d] == initiative_of[i]:
+                local_dependent[d] = True
+    return pending, [not flag for flag in local_dependent]
+
+
+def _simulate_numpy(hours, deps, initiative_of, iterations, ratios, seed, agents):
+    rng = np.random.default_rng(seed)
+    ratio_pool = np.asarray(ratios, dtype=np.float32) if ratios else None
+    pending, sinks = _task_bookkeeping(deps, initiative_of)
+
+    finish: Dict[int, "np.ndarray"] = {}
+    latest: Dict[str, "np.ndarray"] = {}
+    total_work = np.zeros(iterations, dtype=np.float32)
+    for i, estimate in enumerate(hours):
+        if ratio_pool is not None:
+            duration = rng.choice(ratio_pool, size=iterations)
+        else:
+            duration = rng.lognormal(DEFAULT_RATIO_MU, DEFAULT_RATIO_SIGMA, size=iterations).astype(np.float32)
+        duration *= np.float32(estimate)
+        if agents:
+            total_work += duration
+
+        end = duration
+        if deps[i]:
+            ready = finish[deps[i][0]]
+            for d in deps[i][1:]:
+                ready = np.maximum(ready, finish[d])
+            end = ready + duration
+            for d in deps[i]:
+                pending[d] -= 1
+                if pending[d] == 0:
+                    del finish[d]
+        if pending[i]:
+            finish[i] = end
+
+        if sinks[i]:
+            name = initiative_of[i]
+            latest[name] = np.maximum(latest[name], end) if name in latest else end
+
+    overall = np.zeros(iterations, dtype=np.float32)
+    for samples in latest.values():
+        overall = np.maximum(overall, samples)
+    if agents:
+        overall = np.maximum(overall, total_work / agents)
+
+    def pcts(samples):
+        return {q: float(v) for q, v in zip(PERCENTILES, np.percentile(samples, PERCENTILES))}
+
+    return {name: (samples, pcts(samples)) for name, samples in latest.items()}, pcts(overall)
+
+
+def _ratio_table(ratios: Optional[List[float]]) -> List[float]:
+    """Midpoint quantiles of the historical ratios, or of the default lognormal.
+
+    Every entry stands for 1/RATIO_TABLE_SIZE of the probability mass, so a
+    uniformly random entry is an (approximate) draw from the distribution.
+    With up to RATIO_TABLE_SIZE historical ratios, each ratio fills an equal
+    share of the table, give or take one entry.
+    """
+    midpoints = [(2 * k + 1) / (2 * RATIO_TABLE_SIZE) for k in range(RATIO_TABLE_SIZE)]
+    if ratios:
+        ordered = sorted(ratios)
+        return [ordered[int(q * len(ordered))] for q in midpoints]
+    normal = NormalDist(DEFAULT_RATIO_MU, DEFAULT_RATIO_SIGMA)
+    return [math.exp(normal.inv_cdf(q)) for q in midpoints]
+
+
+def _simulate_python(hours, deps, initiative_of, iterations, ratios, seed, agents):
+    rng = random.Random(seed)
+    pending, sinks = _task_bookkeeping(deps, initiative_of)
+
+    # Each task draws its own ratios, independently of every other task, as
+    # in the NumPy engine: one random byte per iteration picks one of the
+    # RATIO_TABLE_SIZE entries of a quantile table of the ratio distribution.
+    # Sampling the table stands in for sampling the distribution; it only
+    # cuts off the outer 1/512 of each tail, and a byte per draw keeps the
+    # per-task work to a single list comprehension.
+    table = _ratio_table(ratios)
+
+    finish: Dict[int, List[float]] = {}
+    latest: Dict[str, List[float]] = {}
+    total_work = [0.0] * iterations
+    for i, estimate in enumerate(hours):
+        draws = rng.randbytes(iterations) if estimate else b""
+        if agents and estimate:
+            total_work = [w + estimate * table[j] for w, j in zip(total_work, draws)]
+
+        if deps[i]:
+            ready = finish[deps[i][0]]
+            for d in deps[i][1:]:
+                ready = [a if a > b else b for a, b in zip(ready, finish[d])]
+            # Virtual "initiative done" steps (estimate 0) finish when ready
+            end = [f + estimate * table[j] for f, j in zip(ready, draws)] if estimate else ready
+            for d in deps[i]:
+                pending[d] -= 1
+                if pending[d] == 0:
+                    del finish[d]
+        else:
+            end = [estimate * table[j] for j in draws] if estimate else [0.0] * iterations
+        if pending[i]:
+            finish[i] = end
+
+        if sinks[i]:
+            name = initiative_of[i]
+            latest[name] = [a if a > b else b for a, b in zip(latest[name], end)] if name in latest else end
+
+    overall = [0.0] * iterations
+    for samples in latest.values():
+        overall = [a if a > b else b for a, b in zip(overall, samples)]
+    if agents:
+        overall = [o if o > w / agents else w / agents for o, w in zip(overall, total_work)]
+
+    def pcts(samples):
+        ordered = sorted(samples)
+        return {q: percentile(ordered, q) for q in PERCENTILES}
+
+    return {name: (samples, pcts(samples)) for name, samples in latest.items()}, pcts(overall)
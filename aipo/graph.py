@@ -0,0 +1,351 @@
+"""Initiative and task dependency graphs.
+
+Graphs are built once and indexed by node ID. All analyses run in
+O(V + E): strongly connected components with an iterative Tarjan's
+algorithm, and wave levels with Kahn's topological sort.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from .models import Initiative
+from .profiling import timed
+from .utils import extract_tasks
+
+
+@dataclass
+class DependencyGraph:
+    """Directed graph where each node lists the nodes it depends on."""
+    deps: Dict[str, List[str]] = field(default_factory=dict)  # node -> dependencies
+    missing: Dict[str, List[str]] = field(default_factory=dict)  # node -> unknown dependencies
+    # Synthetic join nodes (e.g. "initiative done"): they take no time, and
+    # are left out of levels(), stats() and reported cycles
+    virtual: Set[str] = field(default_factory=set)
+
+    def add_node(self, node: str) -> None:
+        """Add a node without dependencies (no-op if present)."""
+        self.deps.setdefault(node, [])
+
+    def add_edge(self, node: str, dependency: str) -> None:
+        """Record that node depends on dependency."""
+        self.deps.setdefault(node, []).append(dependency)
+
+    def add_virtual_node(self, node: str) -> None:
+        """Add a synthetic node (see ``virtual``)."""
+        self.add_node(node)
+        self.virtual.add(node)
+
+    @property
+    def node_count(self) -> int:
+        """Number of real (non-virtual) nodes."""
+        return len(self.deps) - len(self.virtual)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of dependency edges between known real nodes."""
+        if not self.virtual:
+            return sum(len(d) for d in self.deps.values())
+        return sum(
+            sum(1 for dep in deps if dep not in self.virtual)
+            for node, deps in self.deps.items() if node not in self.virtual
+        )
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """Reverse adjacency: node -> nodes that depend on it."""
+        reverse = defaultdict(list)
+        for node, deps in self.deps.items():
+            for dep in deps:
+                reverse[dep].append(node)
+        return reverse
+
+    def downstream(self, node: str, reverse: Optional[Dict[str, List[str]]] = None) -> Set[str]:
+        """Every node that transitively depends on node.
+
+        Args:
+            node: Start node
+            reverse: Precomputed dependents() (avoids rebuilding it per call)
+
+        Returns:
+            Set of dependent nodes, excluding node itself
+        """
+        reverse = self.dependents() if reverse is None else reverse
+        seen: Set[str] = set()
+        stack = list(reverse.get(node, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen or current == node:
+                continue
+            seen.add(current)
+            stack.extend(reverse.get(current, ()))
+        return seen - self.virtual
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Tarjan's algorithm, iterative so deep graphs do not hit the recursion limit.
+
+        Returns:
+            Components in reverse topological order (dependencies first)
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+
+        for root in self.deps:
+            if root in index:
+                continue
+            work = [(root, iter(self.deps[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in self.deps:
+                        continue
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.deps[child])))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        return components
+
+    def cycles(self) -> List[List[str]]:
+        """Strongly connected components that form dependency cycles.
+
+        Returns:
+            Sorted node lists, one per cycle (including self-dependencies)
+        """
+        return [
+            sorted(node for node in component if node not in self.virtual)
+            for component in self.strongly_connected_components()
+            if len(component) > 1 or component[0] in self.deps[component[0]]
+        ]
+
+    def levels(self, include_virtual: bool = False) -> Dict[str, int]:
+        """Earliest wave of every node (0 = no dependencies), in topological order.
+
+        Nodes on or behind a cycle never become ready and are left out.
+        Virtual nodes do not add a wave: they share the level of their
+        latest dependency, so their dependents land one wave after it.
+
+        Args:
+            include_virtual: Also return virtual nodes (for consumers that
+                walk graph.deps in this order)
+        """
+        remaining = {node: len(set(d for d in deps if d in self.deps)) for node, deps in self.deps.items()}
+        reverse = defaultdict(set)
+        for node, deps in self.deps.items():
+            for dep in deps:
+                if dep in self.deps:
+                    reverse[dep].add(node)
+
+        level = {}
+        queue = [node for node, count in remaining.items() if count == 0]
+        for node in queue:
+            level[node] = -1 if node in self.virtual else 0
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for dependent in reverse[node]:
+                step = 0 if dependent in self.virtual else 1
+                level[dependent] = max(level.get(dependent, -1), level[node] + step)
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    queue.append(dependent)
+
+        if include_virtual or not self.virtual:
+            return {node: level[node] for node in queue}
+        return {node: level[node] for node in queue if node not in self.virtual}
+
+    def waves(self) -> List[List[str]]:
+        """Nodes grouped by earliest wave."""
+        grouped: Dict[int, List[str]] = defaultdict(list)
+        for node, lvl in self.levels().items():
+            grouped[lvl].append(node)
+        return [sorted(grouped[i]) for i in range(len(grouped))]
+
+    def stats(self) -> Dict[str, object]:
+        """Size, cycle, depth and width statistics.
+
+        Depth is the minimum number of waves needed to finish every node;
+        width is the largest wave, i.e. the maximum useful parallelism.
+        """
+        waves = self.waves()
+        cycles = self.cycles()
+        return {
+            'nodes': self.node_count,
+            'edges': self.edge_count,
+            'missing_dependencies': sum(len(m) for m in self.missing.values()),
+            'cycles': len(cycles),
+            'nodes_in_cycles': sum(len(c) for c in cycles),
+            'depth': len(waves),
+            'width': max((len(w) for w in waves), default=0),
+        }
+
+
+def dependency_id(dependency: str) -> str:
+    """Initiative ID of a **Dependencies** entry ("0003" or "0003-backend-models")."""
+    return dependency.strip().split('-')[0]
+
+
+@timed("graph")
+def build_initiative_graph(initiatives: Iterable[Initiative]) -> DependencyGraph:
+    """Build the initiative DAG from **Dependencies** fields, keyed by ID.
+
+    Args:
+        initiatives: Initiatives of the project
+
+    Returns:
+        DependencyGraph over initiative IDs
+    """
+    initiatives = list(initiatives)
+    graph = DependencyGraph()
+    for init in initiatives:
+        graph.add_node(init.id)
+
+    for init in initiatives:
+        for dep in init.dependencies:
+            dep_id = dependency_id(dep)
+            if dep_id in graph.deps:
+                graph.add_edge(init.id, dep_id)
+            else:
+                graph.missing.setdefault(init.id, []).append(dep)
+
+    return graph
+
+
+def downstream_impact(graph: DependencyGraph, reverse: Dict[str, List[str]],
+                      by_id: Dict[str, Initiative], initiative_id: str) -> Dict[str, object]:
+    """Work transitively unlocked by finishing one initiative.
+
+    Args:
+        graph: Initiative DependencyGraph
+        reverse: Precomputed graph.dependents()
+        by_id: Initiative ID -> Initiative index
+        initiative_id: Blocking initiative ID
+
+    Returns:
+        Dict with the initiative and the unfinished initiatives, remaining
+        tasks and estimated hours downstream of it
+    """
+    downstream = [by_id[node] for node in graph.downstream(initiative_id, reverse)]
+    downstream = [init for init in downstream if not init.is_completed and not init.is_cancelled]
+    return {
+        'init': by_id[initiative_id],
+        'initiatives': len(downstream),
+        'tasks': sum(init.task_count - init.completed_count for init in downstream),
+        'hours': sum(init.estimated_hours or 0 for init in downstream),
+    }
+
+
+def load_tasks(initiatives: Iterable[Initiative]) -> Dict[str, List[dict]]:
+    """Parsed tasks.prd entries of each initiative, keyed by initiative ID."""
+    tasks = {}
+    for init in initiatives:
+        tasks_file = init.directory / "tasks.prd"
+        tasks[init.id] = extract_tasks(tasks_file) if tasks_file.exists() else []
+    return tasks
+
+
+@timed("graph")
+def build_task_graph(initiatives: Iterable[Initiative],
+                     tasks: Optional[Dict[str, List[dict]]] = None) -> DependencyGraph:
+    """Build the task DAG across initiatives, keyed by ``NNNN-name/TASK-XXX``.
+
+    Edges come from each task's Dependencies and Cross-initiative entries.
+    An initiative-level dependency goes through one virtual
+    ``NNNN-name/(done)`` node per depended-on initiative: its exit tasks
+    (those nothing else in it depends on) point to it, and the dependent
+    initiative's entry tasks (those without in-initiative dependencies)
+    depend on it. That keeps the graph O(V + E) instead of adding
+    |entry| x |exit| edges per initiative dependency.
+
+    Args:
+        initiatives: Initiatives of the project
+        tasks: Already parsed tasks (see load_tasks); parsed here if omitted
+
+    Returns:
+        DependencyGraph over task keys
+    """
+    initiatives = list(initiatives)
+    graph = DependencyGraph()
+    by_id = {init.id: init for init in initiatives}
+    entry_tasks: Dict[str, List[str]] = {}
+    exit_tasks: Dict[str, List[str]] = {}
+    task_lists = tasks if tasks is not None else load_tasks(initiatives)
+    archived = {init.name for init in initiatives if init.archived}
+
+    for init in initiatives:
+        for task in task_lists.get(init.id, []):
+            graph.add_node(f"{init.name}/{task['id']}")
+
+    for init in initiatives:
+        tasks = task_lists.get(init.id, [])
+        referenced = set()
+        for task in tasks:
+            key = f"{init.name}/{task['id']}"
+            for dep in task['dependencies']:
+                referenced.add(dep)
+                _add_task_edge(graph, key, f"{init.name}/{dep}")
+            for dep_key in task['cross_dependencies']:
+                if dep_key.split('/', 1)[0] in archived:
+                    continue  # Archived initiatives are finished: always satisfied
+                _add_task_edge(graph, key, dep_key)
+        entry_tasks[init.id] = [f"{init.name}/{t['id']}" for t in tasks if not t['dependencies']]
+        exit_tasks[init.id] = [f"{init.name}/{t['id']}" for t in tasks if t['id'] not in referenced]
+
+    for init in initiatives:
+        for dep in init.dependencies:
+            dep_init = by_id.get(dependency_id(dep))
+            if dep_init is None:
+                continue
+            done = done_node(dep_init.name)
+            if done not in graph.virtual:
+                graph.add_virtual_node(done)
+                for dep_key in exit_tasks[dep_init.id]:
+                    graph.add_edge(done, dep_key)
+            for key in entry_tasks[init.id]:
+                graph.add_edge(key, done)
+
+    return graph
+
+
+def done_node(initiative_name: str) -> str:
+    """Key of the virtual node that completes when an initiative's tasks do."""
+    return f"{initiative_name}/(done)"
+
+
+def _add_task_edge(graph: DependencyGraph, key: str, dep_key: str) -> None:
+    if dep_key in graph.deps:
+        graph.add_edge(key, dep_key)
+    else:
+        graph.missing.setdefault(key, []).append(dep_key)
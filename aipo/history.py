@@ -0,0 +1,271 @@
+"""Append-only progress history for burn-down and velocity.
+
+Snapshots live in ``ai-project/.aipo/history.db`` (SQLite). A snapshot
+is only written when the project fingerprint differs from the latest
+one, so polling commands can record on every run. Each snapshot stores
+project totals inline (burn-down is a single indexed range scan over
+``snapshots``) plus per-initiative and per-agent counts in clustered
+tables keyed by snapshot.
+"""
+
+import re
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import Initiative
+from .profiling import timed
+
+
+HISTORY_DB = Path("ai-project") / ".aipo" / "history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    fingerprint TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_ts ON snapshots (ts);
+CREATE TABLE IF NOT EXISTS initiative_counts (
+    snapshot_id INTEGER NOT NULL,
+    initiative TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, initiative)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS agent_counts (
+    snapshot_id INTEGER NOT NULL,
+    agent TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, agent)
+) WITHOUT ROWID;
+"""
+
+_DURATION = re.compile(r'^(\d+(?:\.\d+)?)([mhdw])$')
+_DURATION_SECONDS = {'m': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_since(value: str, now: Optional[float] = None) -> float:
+    """Parse a --since value into a Unix timestamp.
+
+    Args:
+        value: Relative duration ("30m", "24h", "7d", "2w") or ISO date/datetime
+        now: Reference time for relative durations (defaults to the wall clock)
+
+    Returns:
+        Unix timestamp
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if _DURATION.match(value.strip()):
+        return (now or time.time()) - parse_duration(value)
+    return datetime.fromisoformat(value.strip()).timestamp()
+
+
+def parse_duration(value: str) -> float:
+    """Parse a duration such as "30m", "24h", "7d" or "2w" into seconds.
+
+    Raises:
+        ValueError: If the value is not a duration
+    """
+    match = _DURATION.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid duration '{value}' (expected e.g. 30m, 1h, 7d, 2w)")
+    amount, unit = match.groups()
+    return float(amount) * _DURATION_SECONDS[unit]
+
+
+class HistoryStore:
+    """SQLite-backed snapshot store of one project."""
+
+    def __init__(self, base_path: Path = Path(".")):
+        self.base_path = base_path
+        self.path = base_path / HISTORY_DB
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def exists(self) -> bool:
+        """Whether any history has been recorded."""
+        return self.path.exists()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open (and create if needed) the database."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=2.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def record(self, fingerprint: str, initiatives: Sequence[Initiative],
+               agent_completed: Dict[str, int], ts: Optional[float] = None) -> bool:
+        """Append a snapshot unless the latest one has the same fingerprint.
+
+        Args:
+            fingerprint: Project fingerprint (see core.project_fingerprint)
+            initiatives: Current initiatives
+            agent_completed: Completed task count per agent
+            ts: Snapshot time (defaults to now)
+
+        Returns:
+            True if a snapshot was written
+        """
+        conn = self.connect()
+        # BEGIN IMMEDIATE serializes concurrent pollers on the fingerprint check
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT fingerprint FROM snapshots ORDER BY id DESC LIMIT 1").fetchone()
+            if row and row[0] == fingerprint:
+                conn.execute("COMMIT")
+                return False
+
+            cursor = conn.execute(
+                "INSERT INTO snapshots (ts, fingerprint, total, completed) VALUES (?, ?, ?, ?)",
+                (ts or time.time(), fingerprint,
+                 sum(i.task_count for i in initiatives), sum(i.completed_count for i in initiatives)))
+            snapshot_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO initiative_counts VALUES (?, ?, ?, ?)",
+                [(snapshot_id, i.name, i.task_count, i.completed_count) for i in initiatives])
+            conn.executemany(
+                "INSERT INTO agent_counts VALUES (?, ?, ?)",
+                [(snapshot_id, agent, count) for agent, count in agent_completed.items()])
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def span(self) -> Tuple[int, Optional[float], Optional[float]]:
+        """Number of snapshots and the time of the first and last one."""
+        return self.connect().execute("SELECT COUNT(*), MIN(ts), MAX(ts) FROM snapshots").fetchone()
+
+    def burndown(self, since: Optional[float] = None, until: Optional[float] = None,
+                 initiative: Optional[str] = None) -> List[Tuple[float, int, int]]:
+        """Task totals over time.
+
+        Args:
+            since: Start of the range (Unix time, inclusive)
+            until: End of the range (Unix time, inclusive)
+            initiative: Restrict to one initiative directory name
+
+        Returns:
+            (timestamp, total, completed) rows in time order
+        """
+        since = since if since is not None else float('-inf')
+        until = until if until is not None else float('inf')
+        conn = self.connect()
+        if initiative:
+            return conn.execute(
+                "SELECT s.ts, c.total, c.completed FROM snapshots s "
+                "JOIN initiative_counts c ON c.snapshot_id = s.id AND c.initiative = ? "
+                "WHERE s.ts BETWEEN ? AND ? ORDER BY s.ts",
+                (initiative, since, until)).fetchall()
+        return conn.execute(
+            "SELECT ts, total, completed FROM snapshots WHERE ts BETWEEN ? AND ? ORDER BY ts",
+            (since, until)).fetchall()
+
+    def velocity(self, since: Optional[float] = None, until: Optional[float] = None,
+                 by: str = "initiative") -> List[Tuple[str, int, float]]:
+        """Tasks completed per hour over a time range.
+
+        The state at the start of the range is the last snapshot before
+        ``since`` (or the first one inside the range); the state at the end
+        is the last snapshot at or before ``until``.
+
+        Args:
+            since: Start of the range (Unix time); defaults to the first snapshot
+            until: End of the range (Unix time); defaults to now
+            by: "initiative" or "agent"
+
+        Returns:
+            (name, tasks completed, tasks per hour) rows, fastest first
+        """
+        table, column = {"initiative": ("initiative_counts", "initiative"),
+                         "agent": ("agent_counts", "agent")}[by]
+        conn = self.connect()
+        until = until if until is not None else time.time()
+
+        end = conn.execute(
+            "SELECT id, ts FROM snapshots WHERE ts <= ? ORDER BY ts DESC LIMIT 1", (until,)).fetchone()
+        if end is None:
+            return []
+        start = None
+        if since is not None:
+            start = conn.execute(
+                "SELECT id, ts FROM snapshots WHERE ts < ? ORDER BY ts DESC LIMIT 1", (since,)).fetchone()
+        if start is None:
+            start = conn.execute(
+                "SELECT id, ts FROM snapshots WHERE ts >= ? ORDER BY ts LIMIT 1",
+                (since if since is not None else float('-inf'),)).fetchone()
+        if start is None:
+            return []
+
+        begin_ts = max(start[1], since) if since is not None else start[1]
+        hours = (until - begin_ts) / 3600
+        if hours <= 0:
+            return []
+
+        query = f"SELECT {column}, completed FROM {table} WHERE snapshot_id = ?"
+        before = dict(conn.execute(query, (start[0],)).fetchall())
+        after = dict(conn.execute(query, (end[0],)).fetchall())
+
+        rows = []
+        for name, completed in after.items():
+            delta = completed - before.get(name, 0)
+            if delta > 0:
+                rows.append((name, delta, delta / hours))
+        rows.sort(key=lambda row: (-row[2], row[0]))
+        return rows
+
+
+def agent_completed_counts(initiatives: Sequence[Initiative]) -> Dict[str, int]:
+    """Completed tasks per assigned agent across initiatives, archived ones included.
+
+    Uses the counts recorded when each initiative was validated (and kept in
+    the validation cache and the archive index), so no tasks.prd is read.
+    """
+    counts: Counter = Counter()
+    for init in initiatives:
+        counts.update(init.agent_completed)
+    return dict(counts)
+
+
+@timed("history snapshot")
+def record_snapshot(base_path: Path, initiatives: Sequence[Initiative], fingerprint: str) -> bool:
+    """Record a snapshot if the project changed. Failures are ignored.
+
+    Args:
+        base_path: Project base path
+        initiatives: Current initiatives
+        fingerprint: Current project fingerprint
+
+    Returns:
+        True if a snapshot was written
+    """
+    if not initiatives or not (base_path / "ai-project").is_dir():
+        return False
+    store = HistoryStore(base_path)
+    try:
+        conn = store.connect()
+        row = conn.execute("SELECT fingerprint FROM snapshots ORDER BY id DESC LIMIT 1").fetchone()
+        if row and row[0] == fingerprint:
+            return False
+        return store.record(fingerprint, initiatives, agent_completed_counts(initiatives))
+    except (OSError, sqlite3.Error):
+        return False
+    finally:
+        store.close()
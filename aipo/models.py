@@ -1,9 +1,9 @@
 """Data models for AI Project Orchestrator."""
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 
 class Status(Enum):
@@ -22,6 +22,7 @@ class Initiative:
     status: Status
     task_count: int = 0
     completed_count: int = 0
+    agent_completed: Dict[str, int] = field(default_factory=dict)  # Completed tasks per assigned agent
     issues: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     started_at: Optional[str] = None
@@ -31,6 +32,23 @@ class Initiative:
     dependencies: List[str] = field(default_factory=list)
     target_date: Optional[str] = None
     estimated_hours: Optional[int] = None
+    swarm: Optional[str] = None  # Swarm file named in **Swarm**: (None if absent or archived)
+    archived: bool = False  # Loaded from the archive index (directory packed away)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        data = asdict(self)
+        data['directory'] = str(self.directory)
+        data['status'] = self.status.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Initiative':
+        """Rebuild an Initiative serialized with to_dict()."""
+        data = dict(data)
+        data['directory'] = Path(data['directory'])
+        data['status'] = Status(data['status'])
+        return cls(**data)
 
     @property
     def progress_percentage(self) -> float:
@@ -60,6 +78,21 @@ class Initiative:
         return "cancelled" in (self.summary_status or "").lower()
 
 
+@dataclass
+class ProjectScan:
+    """All initiatives of a project, read once and indexed for lookups."""
+    initiatives: List[Initiative]
+    revalidated: Optional[Set[str]] = None  # Names re-validated by an incremental scan
+    by_id: Dict[str, Initiative] = field(default_factory=dict)
+    by_swarm: Dict[str, List[Initiative]] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for initiative in self.initiatives:
+            self.by_id.setdefault(initiative.id, initiative)
+            if initiative.swarm:
+                self.by_swarm.setdefault(initiative.swarm, []).append(initiative)
+
+
 @dataclass
 class Task:
     """Represents a task within an initiative."""
@@ -69,6 +102,20 @@ class Task:
     group: int = 0
     description: str = ""
     dependencies: List[str] = field(default_factory=list)
+    initiative: Optional[str] = None  # Directory name (NNNN-name) of the owning initiative
+    agent: Optional[str] = None
+    cross_dependencies: List[str] = field(default_factory=list)  # NNNN-name/TASK-XXX
+    estimated_hours: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        """Project-wide task key (``NNNN-name/TASK-XXX``)."""
+        return f"{self.initiative}/{self.id}"
+
+    @property
+    def number(self) -> int:
+        """Numeric part of the task ID (TASK-004 -> 4)."""
+        return int(self.id.split('-')[1])
 
     @property
     def is_completed(self) -> bool:
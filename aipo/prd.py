@@ -0,0 +1,443 @@
+"""In-place tasks.prd mutations.
+
+Edits are pure string transforms located with the task offsets from
+parse_tasks(), so only the affected lines change. Writes go through a
+temp file and an atomic rename while holding an exclusive lock on the
+initiative directory: concurrent writers serialize and readers always
+see either the old or the new file, never a torn one.
+"""
+
+import json
+import os
+import re
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .archive import archived_message, find_archived_initiative
+from .utils import parse_tasks, resolve_initiative_directory
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no advisory locks on Windows
+    fcntl = None
+
+
+TASK_STATES = ('pending', 'in_progress', 'completed')
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+_IN_PROGRESS_MARKER = re.compile(r'[ \t]*(?:\((?i:in progress)\)|🔄)')
+_START_EMPTY = re.compile(r'\[START:[ \t]*\]')
+_START_SET = re.compile(r'\[START:[ \t]*[^\]\s]')
+_END_MARKER = re.compile(r'\[END:[ \t]*([^\]\n]*)\]')
+_STATUS = re.compile(r'(\*\*Status\*\*:[ \t]*)([^\n]*)')
+_STATUS_COUNT = re.compile(r'\(\d+/\d+ completed\)')
+_PROGRESS = re.compile(r'(\*\*Progress\*\*:[ \t]*)\d+/\d+ tasks \(\d+%\)')
+_TASK_BOX = re.compile(r'^- \[([x ])\] TASK-\d+', re.MULTILINE)
+_INLINE_AGENT = re.compile(r'(\*\*Agent\*\*:[ \t]*)[\w-]+')
+_AGENT_BULLET = re.compile(r'(\n[ \t]+-[ \t]*(?:\*\*)?[Aa]gent(?:\*\*)?:[ \t]*)[^\n]*')
+_SUB_BULLET = re.compile(r'\n([ \t]+)-')
+_SWARM_FIELD = re.compile(r'^\*\*Swarm\*\*:[ \t]*([^\n]*)$', re.MULTILINE)
+_METADATA_FIELD = re.compile(r'^\*\*[\w ]+\*\*:[^\n]*$', re.MULTILINE)
+
+_CHANGE_KEYS = {'initiative', 'task', 'state', 'agent', 'swarm'}
+
+# Sentinel for "leave the field alone"
+_UNCHANGED = object()
+
+# Write-ahead journal of the batch being applied (see apply_changes)
+JOURNAL = Path("ai-project") / ".aipo" / "journal.json"
+
+
+@contextmanager
+def locked(directory: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on an initiative directory.
+
+    The directory (not the file) is locked because atomic renames replace
+    the file's inode. Without fcntl this is a no-op.
+    """
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(str(directory), os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # Releases the lock
+
+
+def atomic_write(path: Path, content: str) -> None:
+    """Replace a file's content via a synced temp file and os.replace().
+
+    Args:
+        path: File to write
+        content: New content
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def set_task_state(content: str, task_id: str, state: str, now: Optional[datetime] = None) -> str:
+    """Set a task's checkbox and in-progress marker, then sync the lifecycle.
+
+    Lifecycle: the first started or completed task fills an empty
+    ``[START: ]``; completing the last task fills ``[END: ]`` and sets the
+    Summary status to Completed; reopening a task of a finished initiative
+    clears ``[END: ]``. ``**Progress**: N/M tasks (P%)`` is kept current.
+
+    Args:
+        content: tasks.prd content
+        task_id: Task ID (e.g. "TASK-004")
+        state: One of TASK_STATES
+        now: Timestamp for START/END markers (defaults to now)
+
+    Returns:
+        Updated content
+
+    Raises:
+        ValueError: If the state is unknown or the task does not exist
+    """
+    return edit_tasks_content(content, {task_id: {'state': state}}, now=now)
+
+
+def edit_tasks_content(content: str, task_changes: Dict[str, Dict[str, str]],
+                       swarm: object = _UNCHANGED, now: Optional[datetime] = None) -> str:
+    """Apply many task edits to tasks.prd content in one pass.
+
+    The content is parsed once; each task's block (its line and
+    sub-bullets) is rewritten independently and the blocks are spliced
+    back in reverse offset order, so the cost is linear in the file size
+    no matter how many tasks change.
+
+    Args:
+        content: tasks.prd content
+        task_changes: Task ID -> {"state": one of TASK_STATES, "agent": name}
+        swarm: New **Swarm** value, None to remove the field, or omitted
+        now: Timestamp for START/END markers (defaults to now)
+
+    Returns:
+        Updated content
+
+    Raises:
+        ValueError: If a state is unknown or a task does not exist
+    """
+    tasks = parse_tasks(content)
+    positions = {task['id']: i for i, task in enumerate(tasks)}
+    missing = sorted(task_id for task_id in task_changes if task_id not in positions)
+    if missing:
+        raise ValueError(f"Task not found: {', '.join(missing)}")
+
+    states = [change['state'] for change in task_changes.values() if change.get('state') is not None]
+    for state in states:
+        if state not in TASK_STATES:
+            raise ValueError(f"Unknown task state: {state}")
+
+    pieces = []
+    cursor = len(content)
+    for task_id in sorted(task_changes, key=lambda t: positions[t], reverse=True):
+        i = positions[task_id]
+        start = tasks[i]['offset']
+        end = tasks[i + 1]['offset'] if i + 1 < len(tasks) else len(content)
+        heading = content.find('\n#', start, end)
+        if heading != -1:
+            end = heading + 1
+        change = task_changes[task_id]
+        block = _edit_task_block(content[start:end], change.get('state'), change.get('agent'))
+        pieces.append(content[end:cursor])
+        pieces.append(block)
+        cursor = start
+    pieces.append(content[:cursor])
+    content = ''.join(reversed(pieces))
+
+    if swarm is not _UNCHANGED:
+        content = _set_swarm_field(content, swarm)
+    if states:
+        content = sync_lifecycle(content, started=any(state != 'pending' for state in states), now=now)
+    return content
+
+
+def _edit_task_block(block: str, state: Optional[str], agent: Optional[str]) -> str:
+    """Rewrite one task's line and sub-bullets."""
+    line_end = block.find('\n')
+    line_end = len(block) if line_end == -1 else line_end
+    line, rest = block[:line_end], block[line_end:]
+
+    if state is not None:
+        line = _IN_PROGRESS_MARKER.sub('', line)
+        rest = _IN_PROGRESS_MARKER.sub('', rest)
+        line = line[:3] + ('x' if state == 'completed' else ' ') + line[4:]
+        if state == 'in_progress':
+            line += ' (in progress)'
+
+    if agent is not None:
+        if _INLINE_AGENT.search(line):
+            line = _INLINE_AGENT.sub(lambda m: m.group(1) + agent, line, count=1)
+        elif _AGENT_BULLET.search(rest):
+            rest = _AGENT_BULLET.sub(lambda m: m.group(1) + agent, rest, count=1)
+        else:
+            indent = _SUB_BULLET.search(rest)
+            rest = f"\n{indent.group(1) if indent else '  '}- Agent: {agent}" + rest
+
+    return line + rest
+
+
+def _set_swarm_field(content: str, value: Optional[str]) -> str:
+    """Set, replace or (with None) remove the **Swarm** metadata field."""
+    match = _SWARM_FIELD.search(content)
+    if value is None:
+        return content[:match.start()] + content[match.end() + 1:] if match else content
+    if match:
+        return content[:match.start(1)] + value + content[match.end(1):]
+
+    # Insert after the last metadata field of the header
+    header_end = min((i for i in (content.find('\n['), content.find('\n#', 1)) if i != -1), default=len(content))
+    fields = list(_METADATA_FIELD.finditer(content, 0, header_end))
+    at = fields[-1].end() if fields else 0
+    return content[:at] + f"\n**Swarm**: {value}" + content[at:]
+
+
+def sync_lifecycle(content: str, started: bool = False, now: Optional[datetime] = None) -> str:
+    """Bring START/END markers and the Summary in line with the checkboxes.
+
+    Args:
+        content: tasks.prd content
+        started: Whether work has begun (fills an empty ``[START: ]``)
+        now: Timestamp for START/END markers (defaults to now)
+
+    Returns:
+        Updated content
+    """
+    stamp = (now or datetime.now()).strftime(TIMESTAMP_FORMAT)
+    boxes = _TASK_BOX.findall(content)
+    total = len(boxes)
+    done = boxes.count('x')
+    finished = total > 0 and done == total
+
+    if started or done:
+        content = _START_EMPTY.sub(f'[START: {stamp}]', content, count=1)
+
+    end_match = _END_MARKER.search(content)
+    if end_match:
+        if finished and not end_match.group(1).strip():
+            content = content[:end_match.start()] + f'[END: {stamp}]' + content[end_match.end():]
+        elif not finished and end_match.group(1).strip():
+            content = content[:end_match.start()] + '[END: ]' + content[end_match.end():]
+
+    summary = content.find('## Summary')
+    status_match = _STATUS.search(content, max(summary, 0))
+    if status_match and 'cancelled' not in status_match.group(2).lower():
+        value = status_match.group(2)
+        if finished:
+            label = "Completed"
+        elif done or started or _START_SET.search(content):
+            label = "In progress"
+        else:
+            label = "Not started"
+        current = _STATUS_COUNT.sub('', value).strip()
+        if current.lower() == label.lower():
+            label = current  # Keep the file's capitalization
+        count = _STATUS_COUNT.search(value)
+        new_value = f"{label} ({done}/{total} completed)" if count else label
+        content = content[:status_match.start(2)] + new_value + content[status_match.end(2):]
+
+    percent = round(done / total * 100) if total else 0
+    content = _PROGRESS.sub(lambda m: f"{m.group(1)}{done}/{total} tasks ({percent}%)", content, count=1)
+    return content
+
+
+def update_task_state(tasks_file: Path, task_id: str, state: str, now: Optional[datetime] = None) -> bool:
+    """Set a task's state in a tasks.prd file under the initiative lock.
+
+    Args:
+        tasks_file: Path to tasks.prd
+        task_id: Task ID (e.g. "TASK-004")
+        state: One of TASK_STATES
+        now: Timestamp for START/END markers (defaults to now)
+
+    Returns:
+        True if the file changed
+
+    Raises:
+        ValueError: If the state is unknown or the task does not exist
+        OSError: If the file cannot be read or written
+    """
+    base_path = _project_base(tasks_file.parent)
+    if base_path is not None:
+        recover_journal(base_path)
+
+    with locked(tasks_file.parent):
+        content = tasks_file.read_text(encoding='utf-8')
+        updated = set_task_state(content, task_id, state, now)
+        if updated == content:
+            return False
+        atomic_write(tasks_file, updated)
+        return True
+
+
+def apply_changes(changes: List[Dict[str, Any]], base_path: Path = Path("."),
+                  now: Optional[datetime] = None, dry_run: bool = False) -> Dict[Path, int]:
+    """Apply a batch of tasks.prd edits all-or-nothing.
+
+    Each change names an ``initiative`` (directory, name or ID) and one or
+    more of:
+
+    - ``task`` + ``state``: "pending", "in_progress" or "completed"
+    - ``task`` + ``agent``: reassign the task's Agent
+    - ``swarm``: new **Swarm** value (null removes the field)
+
+    Changes are grouped by file so every file is read and written once.
+    All new contents are computed first (any invalid change aborts the
+    batch untouched), then recorded in a write-ahead journal; the journal
+    is the commit point. Files are then replaced atomically and the journal
+    deleted. If the process dies in between, the next mutation replays
+    the journal (see recover_journal).
+
+    Args:
+        changes: Change dicts as described above
+        base_path: Project base path
+        now: Timestamp for START/END markers (defaults to now)
+        dry_run: Compute and validate without writing
+
+    Returns:
+        Number of changes per tasks.prd file that changed
+
+    Raises:
+        ValueError: If a change is malformed or names an unknown initiative/task
+        OSError: If a file cannot be read or written
+    """
+    groups = _group_changes(changes, base_path)
+
+    with ExitStack() as stack:
+        if not dry_run:
+            stack.enter_context(locked(base_path / "ai-project"))
+            _replay_journal(base_path)
+            for tasks_file in sorted(groups):
+                stack.enter_context(locked(tasks_file.parent))
+
+        updated = {}
+        counts = {}
+        for tasks_file, (task_changes, swarm, count) in groups.items():
+            content = tasks_file.read_text(encoding='utf-8')
+            try:
+                new_content = edit_tasks_content(content, task_changes, swarm, now)
+            except ValueError as e:
+                raise ValueError(f"{tasks_file.parent.name}: {e}") from None
+            if new_content != content:
+                updated[tasks_file] = new_content
+                counts[tasks_file] = count
+
+        if updated and not dry_run:
+            journal = base_path / JOURNAL
+            journal.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(journal, json.dumps({'files': {str(p.resolve()): c for p, c in updated.items()}}))
+            for tasks_file, new_content in updated.items():
+                atomic_write(tasks_file, new_content)
+            journal.unlink()
+
+    return counts
+
+
+def recover_journal(base_path: Path = Path(".")) -> int:
+    """Finish a batch interrupted after its journal was committed.
+
+    Args:
+        base_path: Project base path
+
+    Returns:
+        Number of files rewritten from the journal
+    """
+    if not (base_path / JOURNAL).exists():
+        return 0
+    with locked(base_path / "ai-project"):
+        return _replay_journal(base_path)
+
+
+def _replay_journal(base_path: Path) -> int:
+    """Rewrite every file recorded in the journal (caller holds the project lock)."""
+    journal = base_path / JOURNAL
+    try:
+        entry = json.loads(journal.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return 0
+    except ValueError:
+        # Only complete journals are ever renamed into place; be defensive anyway
+        journal.unlink()
+        return 0
+
+    files = entry.get('files', {})
+    for path, content in files.items():
+        atomic_write(Path(path), content)
+    journal.unlink()
+    return len(files)
+
+
+def _group_changes(changes: List[Dict[str, Any]], base_path: Path):
+    """Validate changes and group them by tasks.prd file.
+
+    Returns:
+        tasks_file -> (task ID -> {"state", "agent"}, swarm value or _UNCHANGED, change count)
+    """
+    directories: Dict[str, Optional[Path]] = {}
+    groups: Dict[Path, list] = {}
+
+    for number, change in enumerate(changes, 1):
+        if not isinstance(change, dict) or not change.get('initiative'):
+            raise ValueError(f"Change {number}: missing 'initiative'")
+        unknown = set(change) - _CHANGE_KEYS
+        if unknown:
+            raise ValueError(f"Change {number}: unknown field(s) {', '.join(sorted(unknown))}")
+        has_task_edit = 'state' in change or 'agent' in change
+        if has_task_edit and not change.get('task'):
+            raise ValueError(f"Change {number}: 'state' and 'agent' need a 'task'")
+        if not has_task_edit and 'swarm' not in change:
+            raise ValueError(f"Change {number}: nothing to change")
+        if change.get('state') is not None and change['state'] not in TASK_STATES:
+            raise ValueError(f"Change {number}: unknown state {change['state']!r}")
+
+        initiative = str(change['initiative'])
+        if initiative not in directories:
+            directories[initiative] = resolve_initiative_directory(initiative, base_path)
+        directory = directories[initiative]
+        if directory is None:
+            archived = find_archived_initiative(initiative, base_path)
+            if archived is not None:
+                raise ValueError(f"Change {number}: {archived_message(archived)}")
+            raise ValueError(f"Change {number}: initiative not found: {initiative}")
+
+        tasks_file = directory / "tasks.prd"
+        group = groups.setdefault(tasks_file, [{}, _UNCHANGED, 0])
+        if has_task_edit:
+            edit = group[0].setdefault(str(change['task']).upper(), {})
+            for key in ('state', 'agent'):
+                if key in change:
+                    edit[key] = change[key]
+        if 'swarm' in change:
+            group[1] = change['swarm']
+        group[2] += 1
+
+    for tasks_file in groups:
+        if not tasks_file.exists():
+            raise ValueError(f"Missing tasks.prd in {tasks_file.parent}")
+
+    return {path: tuple(group) for path, group in groups.items()}
+
+
+def _project_base(directory: Path) -> Optional[Path]:
+    """Project base path of an initiative directory (None if not in ai-project/initiatives/)."""
+    initiatives_dir = directory.resolve().parent
+    if initiatives_dir.name == "initiatives" and initiatives_dir.parent.name == "ai-project":
+        return initiatives_dir.parent.parent
+    return None
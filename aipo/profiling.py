@@ -0,0 +1,224 @@
+"""Opt-in per-phase timing for ``--profile`` and ``AIPO_PROFILE``.
+
+Code marks phases with ``span("name")`` (a context manager), the
+``timed("name")`` decorator, or ``phase("name")``, which lasts until the
+next phase or the end of the enclosing span. While profiling is off each
+of them is a single global check, so they stay in hot paths.
+
+At the end of the run the spans are printed as a summary table on stderr,
+or written as a Chrome trace (``--profile=trace.json``, open it in
+chrome://tracing or Perfetto). ``--profile=out.prof`` runs the command
+under cProfile instead and writes pstats data.
+"""
+
+import functools
+import os
+import sys
+import time
+from contextlib import nullcontext
+from typing import List, Optional, Sequence, Tuple
+
+
+ENV_VAR = "AIPO_PROFILE"
+
+# Reference point for all timestamps: when the CLI module started loading
+_STARTED = time.perf_counter()
+
+_NULL_SPAN = nullcontext()
+
+_CPROFILE_SUFFIXES = ('.prof', '.pstats')
+
+
+class _Span:
+    """An open span; closes its current phase on exit."""
+    __slots__ = ('profiler', 'name', 'start', 'phase')
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.phase: Optional[Tuple[str, float]] = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.profiler._stack.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        profiler = self.profiler
+        profiler._close_phase(self, end)
+        profiler._stack.pop()
+        profiler.records.append((profiler._path() + (self.name,), self.start, end))
+        return False
+
+
+class Profiler:
+    """Spans recorded during one run.
+
+    Records are ``(path, start, end)`` tuples in closing order, with
+    perf_counter timestamps. The path holds the names of the enclosing
+    spans and phases, so a span started during a phase nests under it.
+    """
+
+    def __init__(self, output: Optional[str] = None):
+        self.output = output  # None for the summary table, else a .json/.prof path
+        self.records: List[Tuple[Tuple[str, ...], float, float]] = []
+        self._stack: List[_Span] = []
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def phase(self, name: str) -> None:
+        if not self._stack:
+            return
+        frame = self._stack[-1]
+        now = time.perf_counter()
+        self._close_phase(frame, now)
+        frame.phase = (name, now)
+
+    def _path(self) -> Tuple[str, ...]:
+        parts = []
+        for frame in self._stack:
+            parts.append(frame.name)
+            if frame.phase:
+                parts.append(frame.phase[0])
+        return tuple(parts)
+
+    def _close_phase(self, frame: _Span, end: float) -> None:
+        if frame.phase:
+            self.records.append((self._path(), frame.phase[1], end))
+            frame.phase = None
+
+
+_profiler: Optional[Profiler] = None
+_cprofile = None
+
+
+def span(name: str):
+    """Context manager timing a phase (a shared no-op while profiling is off)."""
+    if _profiler is None:
+        return _NULL_SPAN
+    return _profiler.span(name)
+
+
+def phase(name: str) -> None:
+    """Start a phase that runs until the next phase or the end of the enclosing span."""
+    if _profiler is not None:
+        _profiler.phase(name)
+
+
+def timed(name: str):
+    """Decorator timing every call of a function as a span."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return func(*args, **kwargs)
+            with _profiler.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def extract_option(argv: Sequence[str]) -> Tuple[List[str], Optional[str]]:
+    """Remove ``--profile`` / ``--profile=FILE`` from the arguments.
+
+    The option is accepted anywhere on the command line. Without it,
+    ``AIPO_PROFILE`` is used ("1" for the summary table, or a file name).
+
+    Returns:
+        Tuple of (remaining arguments, profile target or None); the target
+        is "" for the summary table
+    """
+    rest, target = [], None
+    for arg in argv:
+        if arg == '--profile':
+            target = ""
+        elif arg.startswith('--profile='):
+            target = arg.split('=', 1)[1]
+        else:
+            rest.append(arg)
+
+    if target is None:
+        env = os.environ.get(ENV_VAR, "").strip()
+        if env and env.lower() not in ('0', 'false', 'no', 'off'):
+            target = "" if env.lower() in ('1', 'true', 'yes', 'on', 'summary') else env
+    return rest, target
+
+
+def start(target: str) -> None:
+    """Start profiling; ``target`` is "" (summary), a .json trace or a .prof file."""
+    global _profiler, _cprofile
+    _profiler = Profiler(target or None)
+    now = time.perf_counter()
+    _profiler.records.append((("startup",), _STARTED, now))
+    if target.endswith(_CPROFILE_SUFFIXES):
+        import cProfile
+        _cprofile = cProfile.Profile()
+        _cprofile.enable()
+
+
+def stop() -> None:
+    """Stop profiling and print or write the results."""
+    global _profiler, _cprofile
+    profiler, _profiler = _profiler, None
+    if profiler is None:
+        return
+
+    if _cprofile is not None:
+        _cprofile.disable()
+        _cprofile.dump_stats(profiler.output)
+        _cprofile = None
+        print(f"aipo: cProfile stats written to {profiler.output} "
+              f"(python -m pstats {profiler.output})", file=sys.stderr)
+    elif profiler.output:
+        write_chrome_trace(profiler.records, profiler.output)
+        print(f"aipo: trace written to {profiler.output} (open in chrome://tracing or ui.perfetto.dev)",
+              file=sys.stderr)
+    else:
+        print_summary(profiler.records)
+
+
+def summarize(records: Sequence[Tuple[Tuple[str, ...], float, float]]) -> List[Tuple[Tuple[str, ...], int, float]]:
+    """Aggregate spans by path.
+
+    Returns:
+        (path, calls, total seconds) in tree order, children after their
+        parent in order of first start
+    """
+    first, calls, totals = {}, {}, {}
+    for path, start, end in records:
+        first[path] = min(first.get(path, start), start)
+        calls[path] = calls.get(path, 0) + 1
+        totals[path] = totals.get(path, 0.0) + end - start
+
+    def tree_key(path):
+        return tuple(first.get(path[:i + 1], 0.0) for i in range(len(path)))
+
+    return [(path, calls[path], totals[path]) for path in sorted(first, key=tree_key)]
+
+
+def print_summary(records: Sequence[Tuple[Tuple[str, ...], float, float]], file=None) -> None:
+    """Print the per-phase summary table (to stderr by default)."""
+    file = file or sys.stderr
+    wall = max(end for _, _, end in records) - _STARTED if records else 0.0
+    print(f"\n⏱️  Profile: {wall * 1000:.1f}ms wall", file=file)
+    print(f"{'Phase':<32}{'Calls':>7}{'Total':>12}{'Share':>8}", file=file)
+    for path, count, total in summarize(records):
+        share = total / wall * 100 if wall else 0.0
+        label = ("  " * (len(path) - 1) + path[-1])[:31]
+        print(f"{label:<32}{count:>7}{total * 1000:>10.2f}ms{share:>7.0f}%", file=file)
+
+
+def write_chrome_trace(records: Sequence[Tuple[Tuple[str, ...], float, float]], path: str) -> None:
+    """Write spans in the Chrome trace event format ("X" complete events)."""
+    import json
+
+    pid = os.getpid()
+    events = [
+        {"name": span_path[-1], "cat": "aipo", "ph": "X", "pid": pid, "tid": 0,
+         "ts": round((start - _STARTED) * 1e6, 1), "dur": round((end - start) * 1e6, 1)}
+        for span_path, start, end in sorted(records, key=lambda r: (r[1], len(r[0])))
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
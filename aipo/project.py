@@ -0,0 +1,493 @@
+"""In-process project model with indexed lookups.
+
+``Project`` reads every initiative and its tasks once and keeps them in
+memory. ``refresh()`` stats each initiative's description.prd and
+tasks.prd and re-parses only the directories whose files changed, so a
+long-lived process (a swarm coordinator, an editor plugin) can query and
+update the project without shelling out to the CLI::
+
+    from aipo import Project
+
+    project = Project(".")
+    project.tasks(agent="backend_2", status="pending", ready=True)
+    task = project.next_task(agent="backend_2")
+    project.start(task.initiative, task.id)
+
+The parsed model is also kept in the on-disk cache, so a fresh process
+(each ``aipo query`` run) only re-parses initiatives changed since the
+last one. Mutations go through prd.apply_changes (locked and journaled)
+and refresh the model afterwards. Changes made by other processes are
+picked up by the next ``refresh()``.
+"""
+
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from .archive import ARCHIVE_DIR, INDEX_NAME, archived_message, load_archived_initiatives
+from .cache import load_cached, stat_key, store_cached
+from .core import validate_initiative
+from .graph import DependencyGraph, build_initiative_graph, dependency_id, downstream_impact
+from .models import Initiative, Task
+from .utils import extract_tasks
+
+
+# Task fields with a secondary index (field -> value -> task keys)
+INDEXED_FIELDS = ('status', 'agent', 'group', 'initiative', 'ready')
+
+# Initiative states, in categorize_initiatives() order
+INITIATIVE_STATES = ('active', 'completed', 'not_started', 'cancelled')
+
+# Cache entry holding the parsed model by directory name
+_MODEL_CACHE = "project.json"
+_MODEL_CACHE_KEY = 2
+
+
+def initiative_state(initiative: Initiative) -> str:
+    """State of an initiative as categorize_initiatives() sees it."""
+    if initiative.is_cancelled:
+        return 'cancelled'
+    if initiative.is_completed:
+        return 'completed'
+    if initiative.is_active:
+        return 'active'
+    return 'not_started'
+
+
+def next_in_group_order(tasks: Sequence[Task]) -> Optional[Task]:
+    """Next task of an initiative, working through task groups in order.
+
+    The current group is the highest one with completed or in-progress
+    tasks; once it is complete the next group becomes current.
+
+    Args:
+        tasks: Tasks of one initiative, in file order
+
+    Returns:
+        First pending task of the current group, or None
+    """
+    current_group = max(
+        (t.group for t in tasks if t.is_completed or t.is_in_progress),
+        default=0
+    )
+
+    if all(t.is_completed for t in tasks if t.group == current_group):
+        current_group += 1
+        if not any(t.group == current_group for t in tasks):
+            return None
+
+    return next((t for t in tasks if t.group == current_group and t.is_pending), None)
+
+
+class _Entry:
+    """One initiative directory as last read."""
+    __slots__ = ('key', 'initiative', 'tasks')
+
+    def __init__(self, key: tuple, initiative: Initiative, tasks: List[Task]):
+        self.key = key
+        self.initiative = initiative
+        self.tasks = tasks
+
+
+class Project:
+    """All initiatives and tasks of a project, kept in memory and indexed.
+
+    Attributes:
+        base_path: Project base path
+        revision: Incremented whenever refresh() picks up a change
+        by_name: Directory name -> Initiative
+        by_id: Initiative ID -> Initiative
+        by_swarm: **Swarm** file -> Initiatives bound to it
+        by_state: Initiative state (see INITIATIVE_STATES) -> Initiatives
+        indexes: Task field (see INDEXED_FIELDS) -> value -> set of task keys
+    """
+
+    def __init__(self, path: Path = Path("."), cache: bool = True):
+        """Load the project.
+
+        Args:
+            path: Project base path
+            cache: Start from the parsed model in ai-project/.aipo/cache and
+                write it back after changes
+        """
+        self.base_path = Path(path)
+        self.revision = 0
+        self._cache = cache
+        self._entries: Dict[str, _Entry] = {}
+        self._archive_key = None
+        self._archived: List[Initiative] = []
+        self._graph: Optional[DependencyGraph] = None
+        if cache:
+            self._load_cache()
+        self.refresh()
+
+    def refresh(self) -> Set[str]:
+        """Re-read the initiatives whose files changed since the last refresh.
+
+        Costs one directory listing and two stat calls per initiative when
+        nothing changed; changed directories are re-validated and their
+        tasks re-parsed, then the indexes are rebuilt.
+
+        Returns:
+            Directory names that were added, changed or removed
+        """
+        initiatives_dir = self.base_path / "ai-project" / "initiatives"
+        try:
+            names = sorted(
+                entry.name for entry in os.scandir(initiatives_dir)
+                if entry.name[0].isdigit() and entry.is_dir()
+            )
+        except OSError:
+            names = []
+
+        changed = set(self._entries) - set(names)
+        for name in changed:
+            del self._entries[name]
+
+        for name in names:
+            directory = initiatives_dir / name
+            tasks_file = directory / "tasks.prd"
+            key = (stat_key(directory / "description.prd"), stat_key(tasks_file))
+            entry = self._entries.get(name)
+            if entry is not None and entry.key == key:
+                continue
+            tasks = [_task(name, data) for data in extract_tasks(tasks_file)] if key[1] is not None else []
+            self._entries[name] = _Entry(key, validate_initiative(directory), tasks)
+            changed.add(name)
+
+        archive_key = stat_key(self.base_path / ARCHIVE_DIR / INDEX_NAME)
+        archive_changed = archive_key != self._archive_key
+        if archive_changed:
+            before = {init.name for init in self._archived}
+            self._archive_key = archive_key
+            self._archived = load_archived_initiatives(self.base_path) if archive_key else []
+            changed |= before ^ {init.name for init in self._archived}
+
+        if changed or archive_changed or not self.revision:
+            self._build_indexes()
+            self.revision += 1
+        if changed and self._cache:
+            self._store_cache()
+        return changed
+
+    def _load_cache(self) -> None:
+        cached = load_cached(self.base_path, _MODEL_CACHE, _MODEL_CACHE_KEY) or {}
+        initiatives_dir = self.base_path / "ai-project" / "initiatives"
+        try:
+            for name, entry in cached.items():
+                initiative = Initiative.from_dict(entry['initiative'])
+                initiative.directory = initiatives_dir / name  # Relative to this base path
+                self._entries[name] = _Entry(
+                    tuple(entry['key']),
+                    initiative,
+                    [Task(**task) for task in entry['tasks']],
+                )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            self._entries = {}  # Unreadable entry: parse everything
+
+    def _store_cache(self) -> None:
+        store_cached(self.base_path, _MODEL_CACHE, _MODEL_CACHE_KEY, {
+            name: {
+                'key': list(entry.key),
+                'initiative': entry.initiative.to_dict(),
+                'tasks': [asdict(task) for task in entry.tasks],
+            }
+            for name, entry in self._entries.items()
+        })
+
+    def _build_indexes(self) -> None:
+        hot = {name: entry.initiative for name, entry in self._entries.items()}
+        cold = [init for init in self._archived if init.name not in hot]
+        self._initiatives = sorted(list(hot.values()) + cold, key=lambda init: init.name)
+        self._graph = None
+
+        self.by_name = {init.name: init for init in self._initiatives}
+        self.by_id: Dict[str, Initiative] = {}
+        self.by_swarm: Dict[str, List[Initiative]] = {}
+        self.by_state: Dict[str, List[Initiative]] = {state: [] for state in INITIATIVE_STATES}
+        for init in self._initiatives:
+            self.by_id.setdefault(init.id, init)
+            if init.swarm:
+                self.by_swarm.setdefault(init.swarm, []).append(init)
+            self.by_state[initiative_state(init)].append(init)
+
+        self._tasks: Dict[str, Task] = {}
+        for init in self._initiatives:
+            entry = self._entries.get(init.name)
+            if entry is not None:
+                for task in entry.tasks:
+                    self._tasks[task.key] = task
+        self._position = {key: position for position, key in enumerate(self._tasks)}
+
+        status, agent, group = {}, {}, {}
+        ready = {True: set(), False: set()}
+        for key, task in self._tasks.items():
+            status.setdefault(task.status, set()).add(key)
+            agent.setdefault(task.agent, set()).add(key)
+            group.setdefault(task.group, set()).add(key)
+            ready[task.is_pending and self._is_ready(task)].add(key)
+        initiative = {
+            name: {task.key for task in entry.tasks}
+            for name, entry in self._entries.items() if entry.tasks
+        }
+        self.indexes: Dict[str, Dict[Any, Set[str]]] = {
+            'status': status, 'agent': agent, 'group': group, 'initiative': initiative, 'ready': ready,
+        }
+
+    def _is_ready(self, task: Task) -> bool:
+        """Pending, with every task and initiative dependency finished."""
+        if not task.is_pending:
+            return False
+        init = self.by_name[task.initiative]
+        if init.is_cancelled:
+            return False
+        for dep in task.dependencies:
+            dep_task = self._tasks.get(f"{task.initiative}/{dep}")
+            if dep_task is None or not dep_task.is_completed:
+                return False
+        for dep_key in task.cross_dependencies:
+            dep_task = self._tasks.get(dep_key)
+            if dep_task is None:
+                dep_init = self.by_name.get(dep_key.split('/', 1)[0])
+                if dep_init is not None and dep_init.archived:
+                    continue  # Archived initiatives are finished: always satisfied
+                return False
+            if not dep_task.is_completed:
+                return False
+        for dep in init.dependencies:
+            dep_init = self.by_id.get(dependency_id(dep))
+            if dep_init is None or not dep_init.is_completed:
+                return False
+        return True
+
+    # Lookups
+
+    def initiatives(self, state: Optional[str] = None, swarm: Optional[str] = None) -> List[Initiative]:
+        """Initiatives sorted by name, optionally filtered.
+
+        Args:
+            state: One of INITIATIVE_STATES
+            swarm: Swarm file name from the **Swarm** field
+
+        Returns:
+            Matching initiatives
+        """
+        if state is not None and state not in self.by_state:
+            raise ValueError(f"Unknown initiative state: {state}")
+        initiatives = self.by_state[state] if state is not None else self._initiatives
+        if swarm is not None:
+            initiatives = [init for init in initiatives if init.swarm == swarm]
+        return list(initiatives)
+
+    def initiative(self, ref: str) -> Optional[Initiative]:
+        """Initiative by directory name or ID ("0003-backend" or "0003")."""
+        return self.by_name.get(ref) or self.by_id.get(dependency_id(ref))
+
+    def task(self, initiative: str, task_id: str) -> Optional[Task]:
+        """Task by initiative (name or ID) and task ID."""
+        init = self.initiative(initiative)
+        if init is None:
+            return None
+        return self._tasks.get(f"{init.name}/{task_id.upper()}")
+
+    def tasks(
+        self,
+        initiative: Optional[str] = None,
+        status: Optional[str] = None,
+        agent: Optional[str] = None,
+        group: Optional[int] = None,
+        ready: Optional[bool] = None
+    ) -> List[Task]:
+        """Tasks matching every given filter, from the secondary indexes.
+
+        Args:
+            initiative: Initiative name or ID
+            status: "pending", "in_progress" or "completed"
+            agent: Assigned agent
+            group: Task group number
+            ready: Whether the task is pending with all dependencies finished
+
+        Returns:
+            Matching tasks in project order (initiative name, then file order)
+        """
+        if initiative is not None:
+            init = self.initiative(initiative)
+            if init is None:
+                return []
+            initiative = init.name
+        filters = (('initiative', initiative), ('status', status), ('agent', agent),
+                   ('group', group), ('ready', ready))
+        return self.select([self.indexes[field].get(value, set()) for field, value in filters if value is not None])
+
+    def select(self, key_sets: Sequence[Set[str]]) -> List[Task]:
+        """Tasks whose keys are in every set, in project order.
+
+        Intersects from the smallest set, so the cost follows the most
+        selective filter rather than the number of tasks.
+
+        Args:
+            key_sets: Sets of task keys (e.g. values of ``indexes``); no sets
+                selects every task
+
+        Returns:
+            Matching tasks
+        """
+        if not key_sets:
+            return list(self._tasks.values())
+        smallest, *others = sorted(key_sets, key=len)
+        keys = smallest.intersection(*others)
+        return [self._tasks[key] for key in sorted(keys, key=self._position.__getitem__)]
+
+    @property
+    def task_count(self) -> int:
+        """Number of tasks in hot (not archived) initiatives."""
+        return len(self._tasks)
+
+    # Scheduling
+
+    def next_task(self, agent: Optional[str] = None, initiative: Optional[str] = None,
+                  swarm: Optional[str] = None) -> Optional[Task]:
+        """Next task to work on, as ``aipo next`` would suggest it.
+
+        Args:
+            agent: Lowest-group pending task assigned to this agent in an
+                active initiative
+            initiative: Next task of this initiative in group order
+            swarm: With ``agent``, only initiatives bound to this swarm file
+
+        Returns:
+            Task or None if nothing is available
+        """
+        if agent is not None:
+            candidates = [
+                task for task in self.select([self.indexes['agent'].get(agent, set()),
+                                              self.indexes['status'].get('pending', set())])
+                if self.by_name[task.initiative].is_active
+                and (swarm is None or self.by_name[task.initiative].swarm == swarm)
+            ]
+            return min(candidates, key=lambda task: (task.group, task.number), default=None)
+
+        if initiative is not None:
+            init = self._require(initiative)
+            return next_in_group_order(self.tasks(initiative=init.name)) if init.is_active else None
+
+        # Least-progressed active initiative first
+        for init in sorted(self.by_state['active'], key=lambda init: init.progress_percentage):
+            task = next_in_group_order(self.tasks(initiative=init.name))
+            if task:
+                return task
+        return None
+
+    @property
+    def initiative_graph(self) -> DependencyGraph:
+        """Initiative dependency graph (rebuilt after a refresh picks up changes)."""
+        if self._graph is None:
+            self._graph = build_initiative_graph(self._initiatives)
+        return self._graph
+
+    def blocked(self) -> List[Tuple[Initiative, List[str]]]:
+        """Active and not-started initiatives with unfinished dependencies.
+
+        Returns:
+            (initiative, unfinished **Dependencies** entries) pairs
+        """
+        blocked = []
+        for init in self.by_state['not_started'] + self.by_state['active']:
+            unmet = [dep for dep in init.dependencies
+                     if not getattr(self.by_id.get(dependency_id(dep)), 'is_completed', False)]
+            if unmet:
+                blocked.append((init, unmet))
+        return blocked
+
+    def unblock_suggestions(self) -> List[Dict[str, object]]:
+        """Blocking initiatives ranked by the work finishing them unlocks.
+
+        Returns:
+            downstream_impact() dicts, highest estimated hours first
+        """
+        graph = self.initiative_graph
+        reverse = graph.dependents()
+        blockers = {
+            dependency_id(dep)
+            for _, unmet in self.blocked() for dep in unmet
+            if dependency_id(dep) in self.by_id
+        }
+        return sorted(
+            (downstream_impact(graph, reverse, self.by_id, blocker) for blocker in blockers),
+            key=lambda impact: (-impact['hours'], -impact['tasks'], -impact['initiatives'], impact['init'].id),
+        )
+
+    # Mutations
+
+    def set_task_state(self, initiative: str, task_id: str, state: str) -> bool:
+        """Set a task's state ("pending", "in_progress" or "completed").
+
+        Returns:
+            True if tasks.prd changed
+
+        Raises:
+            ValueError: If the initiative, task or state is unknown
+        """
+        init = self._require(initiative)
+        return bool(self.apply([{'initiative': init.name, 'task': task_id, 'state': state}]))
+
+    def start(self, initiative: str, task_id: str) -> bool:
+        """Mark a task in progress (see set_task_state)."""
+        return self.set_task_state(initiative, task_id, 'in_progress')
+
+    def complete(self, initiative: str, task_id: str) -> bool:
+        """Mark a task completed (see set_task_state)."""
+        return self.set_task_state(initiative, task_id, 'completed')
+
+    def assign(self, initiative: str, task_id: str, agent: Optional[str]) -> bool:
+        """Reassign a task's Agent (None removes it; see set_task_state)."""
+        init = self._require(initiative)
+        return bool(self.apply([{'initiative': init.name, 'task': task_id, 'agent': agent}]))
+
+    def apply(self, changes: List[Dict[str, Any]], dry_run: bool = False) -> Dict[Path, int]:
+        """Apply a batch of changes all-or-nothing and refresh.
+
+        Args:
+            changes: Change dicts as accepted by prd.apply_changes
+            dry_run: Validate without writing
+
+        Returns:
+            Number of changes per tasks.prd file that changed
+
+        Raises:
+            ValueError: If a change is malformed or names an unknown initiative/task
+        """
+        from .prd import apply_changes
+
+        counts = apply_changes(changes, self.base_path, dry_run=dry_run)
+        if counts and not dry_run:
+            self.refresh()
+        return counts
+
+    def _require(self, ref: str) -> Initiative:
+        init = self.initiative(ref)
+        if init is None:
+            raise ValueError(f"Initiative not found: {ref}")
+        if init.archived:
+            raise ValueError(archived_message(init))
+        return init
+
+    def __repr__(self) -> str:
+        return (f"Project({str(self.base_path)!r}, initiatives={len(self._initiatives)}, "
+                f"tasks={len(self._tasks)}, revision={self.revision})")
+
+
+def _task(initiative: str, data: Dict[str, Any]) -> Task:
+    """Task model from an extract_tasks() entry."""
+    return Task(
+        id=data['id'],
+        title=data['title'],
+        status=data['status'],
+        group=data.get('group', 0),
+        dependencies=data['dependencies'],
+        initiative=initiative,
+        agent=data['agent'],
+        cross_dependencies=data['cross_dependencies'],
+        estimated_hours=data['estimated_hours'],
+    )
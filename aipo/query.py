@@ -0,0 +1,148 @@
+"""Filter language over the Project model's secondary indexes.
+
+A query is a list of whitespace-separated terms, all of which must hold::
+
+    status=pending agent=backend_2 group<=2 ready
+
+Terms:
+
+- ``status``, ``agent``, ``initiative`` (``init``): ``=`` or ``!=`` one
+  value or a comma-separated list (``agent=backend_1,backend_2``);
+  ``agent=none`` matches unassigned tasks and initiatives accept IDs
+- ``group``: ``=``, ``!=``, ``<``, ``<=``, ``>`` or ``>=`` a number
+- ``state`` (initiative state) and ``swarm`` (**Swarm** file): ``=``/``!=``
+- ``ready`` / ``!ready``: pending with every dependency finished
+
+Each term resolves to a set of task keys straight from an index (a range
+or ``!=`` combines the few index entries of that field), and the sets are
+intersected smallest first, so selective queries never visit every task.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Set, Tuple
+
+from .models import Task
+from .project import INITIATIVE_STATES, Project, initiative_state
+
+
+# Fields accepted in query terms
+QUERY_FIELDS = ('status', 'agent', 'group', 'initiative', 'state', 'swarm', 'ready')
+
+_FIELD_ALIASES = {'init': 'initiative'}
+
+_TERM = re.compile(r'^([a-z_]+)\s*(!=|<=|>=|=|<|>)\s*(.+)$')
+
+_COMPARE = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+
+
+@dataclass
+class Term:
+    """One parsed query term."""
+    field: str
+    op: str
+    values: Tuple[str, ...] = ()
+
+
+def parse_query(text: str) -> List[Term]:
+    """Parse a query string into terms.
+
+    Args:
+        text: Query such as ``"status=pending agent=backend_2 group<=2 ready"``
+
+    Returns:
+        Terms (empty for an empty query, which matches every task)
+
+    Raises:
+        ValueError: If a term is malformed or names an unknown field
+    """
+    terms = []
+    for token in text.split():
+        lowered = token.lower()
+        if lowered in ('ready', '!ready'):
+            terms.append(Term('ready', '=' if lowered == 'ready' else '!='))
+            continue
+
+        match = _TERM.match(token)
+        if not match:
+            raise ValueError(f"Cannot parse query term: {token!r}")
+        field, op, value = match.groups()
+        field = _FIELD_ALIASES.get(field, field)
+        if field not in QUERY_FIELDS or field == 'ready':
+            raise ValueError(f"Unknown query field: {field} (use {', '.join(QUERY_FIELDS)})")
+        values = tuple(v.strip() for v in value.split(',') if v.strip())
+
+        if field == 'group':
+            if len(values) != 1 or not values[0].isdigit():
+                raise ValueError(f"group needs a number: {token!r}")
+        elif op not in ('=', '!='):
+            raise ValueError(f"{field} only supports = and !=: {token!r}")
+        if field == 'status':
+            values = tuple(v.lower().replace('-', '_') for v in values)
+        if field == 'state':
+            values = tuple(v.lower().replace('-', '_') for v in values)
+            unknown = [v for v in values if v not in INITIATIVE_STATES]
+            if unknown:
+                raise ValueError(f"Unknown initiative state: {unknown[0]} (use {', '.join(INITIATIVE_STATES)})")
+        terms.append(Term(field, op, values))
+    return terms
+
+
+def run_query(project: Project, terms: List[Term]) -> List[Task]:
+    """Tasks matching every term, in project order.
+
+    Args:
+        project: Loaded project
+        terms: Parsed terms (see parse_query)
+
+    Returns:
+        Matching tasks
+    """
+    return project.select([_term_keys(project, term) for term in terms])
+
+
+def _term_keys(project: Project, term: Term) -> Set[str]:
+    """Task keys matching one term, built from index entries only."""
+    if term.field == 'ready':
+        return project.indexes['ready'][term.op == '=']
+
+    if term.field in ('state', 'swarm'):
+        names = {
+            init.name for init in project.initiatives()
+            if (_initiative_value(init, term.field) in term.values) == (term.op == '=')
+        }
+        return _union(project.indexes['initiative'].get(name, set()) for name in names)
+
+    index = project.indexes[term.field]
+    if term.field == 'group':
+        number = int(term.values[0])
+        compare = _COMPARE[term.op]
+        return _union(keys for group, keys in index.items() if compare(group, number))
+
+    if term.field == 'initiative':
+        wanted = {init.name for init in map(project.initiative, term.values) if init is not None}
+    elif term.field == 'agent':
+        wanted = {None if v.lower() == 'none' else v for v in term.values}
+    else:
+        wanted = set(term.values)
+    if term.op == '=':
+        return _union(index.get(value, set()) for value in wanted)
+    return _union(keys for value, keys in index.items() if value not in wanted)
+
+
+def _initiative_value(initiative, field: str):
+    return initiative.swarm if field == 'swarm' else initiative_state(initiative)
+
+
+def _union(sets) -> Set[str]:
+    sets = list(sets)
+    if len(sets) == 1:
+        return sets[0]
+    return set().union(*sets)
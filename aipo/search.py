@@ -0,0 +1,354 @@
+"""Full-text search over tasks and initiative descriptions.
+
+The inverted index lives in ``ai-project/.aipo/search.db`` (SQLite).
+Documents are tasks (title plus sub-bullets, from tasks.prd) and
+``## `` sections of description.prd. Postings are keyed by
+``(term, doc)``, so a query reads only the posting lists of its own terms,
+and per-term document frequencies plus corpus totals are stored alongside
+them for BM25 scoring.
+
+``update()`` stats every tasks.prd and description.prd and re-indexes only
+the files whose (mtime_ns, size) changed since they were last indexed.
+Archived initiatives are indexed from their members in the archive pack,
+keyed by the (mtime_ns, size) of the archive index, which every archive
+and restore rewrites.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import zipfile
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .archive import ARCHIVE_DIR, INDEX_NAME, PACK_NAME, load_archived_initiatives
+from .profiling import timed
+from .utils import parse_tasks, split_sections, task_blocks
+
+
+SEARCH_DB = Path("ai-project") / ".aipo" / "search.db"
+
+# Files of an initiative directory that are indexed
+INDEXED_FILES = ("tasks.prd", "description.prd")
+
+# Path prefix of archived files: members of the archive pack
+ARCHIVE_PREFIX = f"{(ARCHIVE_DIR / PACK_NAME).as_posix()}/"
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Title terms count this many times toward a task's term frequency
+TITLE_WEIGHT = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    initiative TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    ref TEXT NOT NULL,
+    title TEXT NOT NULL,
+    status TEXT,
+    length INTEGER NOT NULL,
+    terms TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_path ON docs (path);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    docs INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+"""
+
+# Bound variables per IN (...) lookup
+_LOOKUP_CHUNK = 500
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or that the this to was will with".split()
+)
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased alphanumeric terms of a text, without stopwords."""
+    return [word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS]
+
+
+@dataclass
+class SearchResult:
+    """One ranked match."""
+    score: float
+    initiative: str
+    kind: str  # "task" or "section"
+    ref: str  # Task ID or section heading
+    title: str
+    status: Optional[str] = None  # Task status (None for sections)
+    archived: bool = False  # Found in the archive pack
+
+
+class SearchIndex:
+    """SQLite-backed inverted index of one project."""
+
+    def __init__(self, base_path: Path = Path(".")):
+        self.base_path = base_path
+        self.path = base_path / SEARCH_DB
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pack: Optional[zipfile.ZipFile] = None
+
+    def connect(self) -> sqlite3.Connection:
+        """Open (and create if needed) the database."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=2.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @timed("search index")
+    def update(self) -> int:
+        """Re-index the files changed since the last update.
+
+        Returns:
+            Number of files (re-)indexed or dropped
+        """
+        current = _indexed_files(self.base_path)
+        conn = self.connect()
+        # BEGIN IMMEDIATE serializes concurrent updaters on the file stat check
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            known = {path: (mtime, size) for path, mtime, size in conn.execute("SELECT * FROM files")}
+            stale = [path for path, key in current.items() if known.get(path) != key]
+            removed = [path for path in known if path not in current]
+            if not stale and not removed:
+                conn.execute("COMMIT")
+                return 0
+
+            for path in stale + removed:
+                self._drop_file(conn, path)
+            next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM docs").fetchone()[0]
+            for path in stale:
+                next_id = self._add_file(conn, path, next_id)
+            conn.executemany("INSERT INTO files VALUES (?, ?, ?)",
+                             [(path, *current[path]) for path in stale])
+            conn.execute("COMMIT")
+            return len(stale) + len(removed)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            if self._pack is not None:
+                self._pack.close()
+                self._pack = None
+
+    def _drop_file(self, conn: sqlite3.Connection, path: str) -> None:
+        """Remove a file's documents; postings are deleted by primary key."""
+        rows = conn.execute("SELECT id, length, terms FROM docs WHERE path = ?", (path,)).fetchall()
+        if rows:
+            removed = [(term, doc) for doc, _, terms in rows for term in terms.split()]
+            conn.executemany("DELETE FROM postings WHERE term = ? AND doc = ?", removed)
+            conn.executemany("UPDATE terms SET df = df - ? WHERE term = ?",
+                             [(count, term) for term, count in Counter(term for term, _ in removed).items()])
+            conn.execute("DELETE FROM terms WHERE df <= 0 AND term IN (SELECT value FROM json_each(?))",
+                         (json.dumps(sorted({term for term, _ in removed})),))
+            conn.execute("DELETE FROM docs WHERE path = ?", (path,))
+            conn.execute("UPDATE totals SET docs = docs - ?, length = length - ?",
+                         (len(rows), sum(length for _, length, _ in rows)))
+        conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def _add_file(self, conn: sqlite3.Connection, path: str, next_id: int) -> int:
+        """Index a file's documents with IDs from ``next_id``; returns the next free ID."""
+        full_path = self.base_path / path
+        try:
+            content = self._read(path)
+        except (OSError, KeyError, UnicodeDecodeError, zipfile.BadZipFile):
+            return next_id
+        initiative = full_path.parent.name
+        if full_path.name == "tasks.prd":
+            documents = _task_documents(content)
+        else:
+            documents = _section_documents(content)
+
+        docs, postings, df = [], [], Counter()
+        for doc, (kind, ref, title, status, terms) in enumerate(documents, next_id):
+            frequencies = Counter(terms)
+            docs.append((doc, path, initiative, kind, ref, title, status, len(terms), " ".join(frequencies)))
+            postings.extend((term, doc, tf, len(terms)) for term, tf in frequencies.items())
+            df.update(frequencies.keys())
+        conn.executemany("INSERT INTO docs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", docs)
+        postings.sort()  # Key order keeps the B-tree inserts local
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)", postings)
+        conn.executemany(
+            "INSERT INTO terms VALUES (?, ?) ON CONFLICT (term) DO UPDATE SET df = df + excluded.df",
+            df.items())
+        conn.execute("UPDATE totals SET docs = docs + ?, length = length + ?",
+                     (len(docs), sum(doc[7] for doc in docs)))
+        return next_id + len(docs)
+
+    def _read(self, path: str) -> str:
+        """Content of an indexed file, from disk or from the archive pack."""
+        if not path.startswith(ARCHIVE_PREFIX):
+            return (self.base_path / path).read_text(encoding='utf-8')
+        if self._pack is None:
+            self._pack = zipfile.ZipFile(self.base_path / ARCHIVE_DIR / PACK_NAME)
+        return self._pack.read(path[len(ARCHIVE_PREFIX):]).decode('utf-8')
+
+    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+        """Rank documents against a query with BM25.
+
+        Terms are scored rarest first. Once the documents found so far fill
+        the top ``limit`` and no unseen document could still outscore them
+        (MaxScore), the remaining, more common terms are only looked up for
+        the existing candidates instead of reading their whole posting lists.
+
+        Args:
+            query: Free text; every term adds to the score (OR semantics)
+            limit: Maximum number of results
+
+        Returns:
+            Results, best first
+        """
+        conn = self.connect()
+        doc_count, total_length = conn.execute("SELECT docs, length FROM totals").fetchone()
+        if not doc_count or limit < 1:
+            return []
+        average_length = total_length / doc_count or 1.0
+
+        weighted = []
+        for term in dict.fromkeys(tokenize(query)):
+            row = conn.execute("SELECT df FROM terms WHERE term = ?", (term,)).fetchone()
+            if row:
+                weighted.append((math.log(1 + (doc_count - row[0] + 0.5) / (row[0] + 0.5)), term))
+        weighted.sort(reverse=True)
+
+        # Highest score a term can add to a document (tf -> infinity)
+        remaining = sum(idf * (BM25_K1 + 1) for idf, _ in weighted)
+        scores: Dict[int, float] = {}
+        for idf, term in weighted:
+            threshold = heapq.nlargest(limit, scores.values())[-1] if len(scores) >= limit else 0.0
+            if remaining > threshold:
+                rows = conn.execute("SELECT doc, tf, length FROM postings WHERE term = ?", (term,)).fetchall()
+            else:
+                candidates = [doc for doc, score in scores.items() if score + remaining > threshold]
+                rows = []
+                for i in range(0, len(candidates), _LOOKUP_CHUNK):
+                    chunk = candidates[i:i + _LOOKUP_CHUNK]
+                    rows.extend(conn.execute(
+                        f"SELECT doc, tf, length FROM postings WHERE term = ? AND doc IN ({','.join('?' * len(chunk))})",
+                        (term, *chunk)))
+            for doc, tf, length in rows:
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+            remaining -= idf * (BM25_K1 + 1)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        if not best:
+            return []
+        docs = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                f"SELECT id, initiative, kind, ref, title, status, path FROM docs "
+                f"WHERE id IN ({','.join('?' * len(best))})",
+                [doc for doc, _ in best])
+        }
+        return [SearchResult(score, *docs[doc][:5], archived=docs[doc][5].startswith(ARCHIVE_PREFIX))
+                for doc, score in best]
+
+
+def _indexed_files(base_path: Path) -> Dict[str, Tuple[int, int]]:
+    """(mtime_ns, size) of every indexed file, keyed by path relative to the project.
+
+    Archived files are keyed by the archive index (see ARCHIVE_PREFIX).
+    """
+    initiatives_dir = os.path.join(base_path, "ai-project", "initiatives")
+    try:
+        names = [entry.name for entry in os.scandir(initiatives_dir)
+                 if entry.name[0].isdigit() and entry.is_dir()]
+    except OSError:
+        names = []
+
+    files = {}
+    for name in names:
+        for filename in INDEXED_FILES:
+            path = f"ai-project/initiatives/{name}/{filename}"
+            try:
+                st = os.stat(os.path.join(base_path, path))
+            except OSError:
+                continue
+            files[path] = (st.st_mtime_ns, st.st_size)
+
+    # Archived initiatives; a hot directory with the same name wins, as in scans
+    try:
+        st = os.stat(base_path / ARCHIVE_DIR / INDEX_NAME)
+    except OSError:
+        return files
+    hot = set(names)
+    for init in load_archived_initiatives(base_path):
+        if init.name not in hot:
+            for filename in INDEXED_FILES:
+                files[f"{ARCHIVE_PREFIX}{init.name}/{filename}"] = (st.st_mtime_ns, st.st_size)
+    return files
+
+
+def _task_documents(content: str) -> List[Tuple[str, str, str, Optional[str], List[str]]]:
+    """One document per task: its title (weighted) and sub-bullet lines."""
+    tasks = parse_tasks(content)
+    documents = []
+    for task, block in zip(tasks, task_blocks(content, tasks)):
+        body = block.split('\n', 1)[1] if '\n' in block else ""
+        terms = tokenize(task['title']) * TITLE_WEIGHT + tokenize(body)
+        documents.append(('task', task['id'], task['title'], task['status'], terms))
+    return documents
+
+
+def _section_documents(content: str) -> List[Tuple[str, str, str, Optional[str], List[str]]]:
+    """One document per description.prd section."""
+    return [('section', heading, heading, None, tokenize(text)) for heading, text in split_sections(content)]
+
+
+def search(query: str, base_path: Path = Path("."), limit: int = 10) -> List[SearchResult]:
+    """Bring the index up to date and run one query.
+
+    Args:
+        query: Free-text query
+        base_path: Project base path
+        limit: Maximum number of results
+
+    Returns:
+        Results, best first
+    """
+    index = SearchIndex(base_path)
+    try:
+        index.update()
+        return index.search(query, limit)
+    finally:
+        index.close()
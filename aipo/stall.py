@@ -0,0 +1,173 @@
+"""Stalled-agent and runaway-task detection for live swarms."""
+
+import os
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .activity import ActivityTracker, agent_role, percentile
+from .cache import load_cached, store_cached
+from .utils import extract_tasks
+
+
+DEFAULT_STALL_FACTOR = 2.0
+
+# Completed periods of a role needed before its percentiles are trusted
+MIN_SAMPLES = 5
+
+# Percentile of historical durations used as the baseline
+BASELINE_PERCENTILE = 90
+
+# Cache entry recording the work periods the stall hook already ran for
+_HOOK_CACHE = "stall-hooks.json"
+
+
+@dataclass
+class StalledAgent:
+    """An agent whose open work period exceeds its expected duration."""
+    agent: str
+    task: Optional[str]  # Task key, if the dispatch named one
+    started: datetime
+    elapsed_minutes: float
+    threshold_minutes: float
+    baseline: str  # Human-readable source of the threshold
+
+
+class StallDetector:
+    """Incremental stall check over a session log and the tasks.prd files.
+
+    The log is followed with an ActivityTracker and tasks.prd files are
+    only re-parsed when their size or mtime changes, so check() stays
+    cheap enough to call on every monitor refresh.
+    """
+
+    def __init__(self, log_file: Path, base_path: Path = Path("."),
+                 factor: float = DEFAULT_STALL_FACTOR, hook: Optional[str] = None):
+        self.tracker = ActivityTracker(log_file)
+        self.base_path = base_path
+        self.factor = factor
+        self.hook = hook
+        self._task_cache: Dict[Path, Tuple[Tuple[int, int], List[dict]]] = {}
+        self._hooked: Optional[Set[Tuple[str, str]]] = None  # Loaded on first stall
+        self._children: List[subprocess.Popen] = []
+
+    def check(self, now: Optional[datetime] = None) -> Tuple[List[StalledAgent], List[str]]:
+        """Poll the log and evaluate every open work period.
+
+        Args:
+            now: Current time (defaults to the wall clock)
+
+        Returns:
+            Tuple of (stalled agents, in-progress task keys without an open
+            work period in the log)
+        """
+        self.tracker.poll()
+        estimates, in_progress = self._scan_tasks()
+
+        stalled = []
+        open_tasks = set()
+        for agent, (start, initiative, task_id) in self.tracker.open_work.items():
+            task_key = f"{initiative}/{task_id}" if initiative and task_id else None
+            if task_key:
+                open_tasks.add(task_key)
+
+            threshold, baseline = self._threshold(agent, task_key, estimates)
+            if threshold is None:
+                continue
+
+            current = now or datetime.now(tz=start.tzinfo)
+            elapsed = (current - start).total_seconds() / 60
+            if elapsed > threshold:
+                stalled.append(StalledAgent(agent, task_key, start, elapsed, threshold, baseline))
+
+        stalled.sort(key=lambda s: s.elapsed_minutes / s.threshold_minutes, reverse=True)
+        orphaned = sorted(key for key in in_progress if key not in open_tasks)
+
+        if self.hook:
+            self._run_hook(stalled)
+
+        return stalled, orphaned
+
+    def _threshold(self, agent: str, task_key: Optional[str], estimates: Dict[str, float]):
+        """Expected-duration threshold in minutes for an open work period."""
+        role = agent_role(agent)
+        durations = self.tracker.durations.get(role, [])
+        if len(durations) >= MIN_SAMPLES:
+            p = percentile(durations, BASELINE_PERCENTILE)
+            return p * self.factor, f"{self.factor:g}× P{BASELINE_PERCENTILE} of {len(durations)} {role} tasks ({p:.0f}m)"
+        if task_key in estimates:
+            hours = estimates[task_key]
+            return hours * 60 * self.factor, f"{self.factor:g}× Estimated {hours:g}h"
+        return None, ""
+
+    def _scan_tasks(self) -> Tuple[Dict[str, float], List[str]]:
+        """Collect task estimates and in-progress tasks, re-parsing only changed files."""
+        estimates = {}
+        in_progress = []
+        initiatives_dir = self.base_path / "ai-project" / "initiatives"
+        if not initiatives_dir.exists():
+            return estimates, in_progress
+
+        for directory in initiatives_dir.iterdir():
+            if not directory.name[0].isdigit():
+                continue
+            tasks_file = directory / "tasks.prd"
+            try:
+                st = tasks_file.stat()
+            except OSError:
+                continue
+            stat_key = (st.st_mtime_ns, st.st_size)
+            cached = self._task_cache.get(tasks_file)
+            if cached is None or cached[0] != stat_key:
+                cached = (stat_key, extract_tasks(tasks_file))
+                self._task_cache[tasks_file] = cached
+
+            for task in cached[1]:
+                key = f"{directory.name}/{task['id']}"
+                if task['estimated_hours']:
+                    estimates[key] = task['estimated_hours']
+                if task['status'] == 'in_progress':
+                    in_progress.append(key)
+
+        return estimates, in_progress
+
+    def _run_hook(self, stalled: List[StalledAgent]) -> None:
+        """Run the stall hook once per stalled work period, without waiting.
+
+        Fired (agent, start) markers are kept in ai-project/.aipo/cache, so
+        separate one-shot ``aipo monitor`` runs do not fire the hook again
+        for the same stall. Markers of work periods that are no longer
+        open are dropped.
+        """
+        self._reap()
+        cache_key = [str(self.tracker.log_file)]
+        if self._hooked is None:
+            cached = load_cached(self.base_path, _HOOK_CACHE, cache_key) or []
+            self._hooked = {tuple(marker) for marker in cached if isinstance(marker, list)}
+
+        open_markers = {(agent, start.isoformat()) for agent, (start, _, _) in self.tracker.open_work.items()}
+        changed = not self._hooked <= open_markers
+        self._hooked &= open_markers
+        for item in stalled:
+            marker = (item.agent, item.started.isoformat())
+            if marker in self._hooked:
+                continue
+            self._hooked.add(marker)
+            changed = True
+            env = dict(os.environ,
+                       AIPO_STALL_AGENT=item.agent,
+                       AIPO_STALL_TASK=item.task or "",
+                       AIPO_STALL_ELAPSED_MINUTES=f"{item.elapsed_minutes:.1f}",
+                       AIPO_STALL_THRESHOLD_MINUTES=f"{item.threshold_minutes:.1f}")
+            try:
+                self._children.append(subprocess.Popen(self.hook, shell=True, env=env))
+            except OSError:
+                pass
+        if changed:
+            store_cached(self.base_path, _HOOK_CACHE, cache_key, sorted(list(m) for m in self._hooked))
+
+    def _reap(self) -> None:
+        """Collect hook processes that have exited, so watch loops leave no zombies."""
+        self._children = [child for child in self._children if child.poll() is None]
@@ -0,0 +1,234 @@
+"""Regeneration of the computed fields of project-state.prd.
+
+project-state.prd is mostly prose, but a few of its lines are rollups of
+the initiative model that drift as work progresses:
+
+- ``Initiatives: 3 active, 12 completed`` (the /aipo-create-project form)
+- ``**Active Initiatives**: 3``, ``**Completed Initiatives**: 12``,
+  ``**Not Started Initiatives**``, ``**Cancelled Initiatives**`` and
+  ``**Total Initiatives**``
+- ``Modules: 8`` / ``**Total Modules**: 8`` (number of ``Module:`` sections)
+- ``**Token Count**: ~420`` inside a module (its estimated tokens, not
+  counting that line)
+- The ``**Key Milestones**:`` list (or a ``## Milestones`` section): items
+  naming an initiative get its current state, initiatives not listed yet
+  are appended
+
+``sync_state()`` recomputes these values from the cached Project model,
+finds each field by its offsets in the file and splices in only the
+changed values. Everything else, including the whitespace around the
+values, is kept byte for byte, and a second run changes nothing.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .models import Initiative
+from .prd import atomic_write, locked
+from .project import Project, initiative_state
+from .tokens import PROJECT_STATE, estimate_tokens
+from .utils import module_spans, read_text
+
+
+# "Label: value" lines, optionally bold (**Label**: value) or bulleted
+_FIELD = re.compile(
+    r'^[ \t]*(?:[-*][ \t]+)?(?:\*\*)?(?P<label>[A-Za-z][A-Za-z ]*?)(?:\*\*)?:(?:\*\*)?[ \t]*'
+    r'(?P<value>.*?)[ \t]*$',
+    re.MULTILINE
+)
+
+# A count or a template placeholder such as [N]
+_COUNT = re.compile(r'^(?:\d[\d,]*|\[[^\]]*\])?$')
+
+_INITIATIVES_ROLLUP = re.compile(r'^(?:\d+|\[[^\]]*\]) active, (?:\d+|\[[^\]]*\]) completed$')
+
+_TOKEN_COUNT = re.compile(r'^~?(?:\d[\d,]*|\[[^\]]*\])(?P<unit> tokens)?$')
+
+_MILESTONES = re.compile(r'^(?:\*\*(?:Key )?Milestones\*\*:|#{2,3} (?:Key )?Milestones)[ \t]*$',
+                         re.MULTILINE | re.IGNORECASE)
+
+_MILESTONE_ITEM = re.compile(r'^- (?P<label>[^:\n]+):[ \t]*(?P<value>.*?)[ \t]*$')
+
+_FENCE = re.compile(r'^```.*?^```[ \t]*$', re.MULTILINE | re.DOTALL)
+
+# Count fields -> initiative state they count (None: all initiatives)
+_STATE_FIELDS = {
+    'active initiatives': 'active',
+    'completed initiatives': 'completed',
+    'not started initiatives': 'not_started',
+    'cancelled initiatives': 'cancelled',
+    'total initiatives': None,
+}
+
+_MODULE_FIELDS = ('modules', 'total modules')
+
+
+@dataclass
+class StateUpdate:
+    """One regenerated value of project-state.prd."""
+    field: str
+    old: str
+    new: str
+    start: int  # Offsets of the old value in the file
+    end: int
+
+
+def compute_updates(content: str, project: Project) -> List[StateUpdate]:
+    """Find the generated fields of a project-state.prd and their current values.
+
+    Args:
+        content: project-state.prd content
+        project: Loaded project model
+
+    Returns:
+        Updates of the values that changed, in file order
+    """
+    counts = {state: len(inits) for state, inits in project.by_state.items()}
+    counts[None] = sum(counts.values())
+    spans = module_spans(content)
+    fences = [(m.start(), m.end()) for m in _FENCE.finditer(content)]
+
+    def fenced(offset: int) -> bool:
+        return any(start <= offset < end for start, end in fences)
+
+    def module_at(offset: int) -> Optional[Tuple[str, int, int]]:
+        return next((span for span in spans if span[1] <= offset < span[2]), None)
+
+    updates = []
+    for match in _FIELD.finditer(content):
+        if fenced(match.start()):
+            continue
+        label = match.group('label').strip()
+        key = label.lower()
+        value = match.group('value')
+        if key in _STATE_FIELDS and _COUNT.match(value):
+            new = str(counts[_STATE_FIELDS[key]])
+        elif key == 'initiatives' and _INITIATIVES_ROLLUP.match(value):
+            new = f"{counts['active']} active, {counts['completed']} completed"
+        elif key in _MODULE_FIELDS and _COUNT.match(value):
+            new = str(len(spans))
+        elif key == 'token count' and _TOKEN_COUNT.match(value) and module_at(match.start()):
+            name, start, end = module_at(match.start())
+            text = content[start:end].strip().rstrip('-').strip()
+            tokens = estimate_tokens(text) - estimate_tokens(match.group())
+            new = f"~{tokens}{_TOKEN_COUNT.match(value).group('unit') or ''}"
+            label = f"{name} token count"
+        else:
+            continue
+        if new != value:
+            updates.append(StateUpdate(label, value, new, match.start('value'), match.end('value')))
+
+    for match in _MILESTONES.finditer(content):
+        if not fenced(match.start()):
+            updates.extend(_milestone_updates(content, match.end(), project))
+    return sorted(updates, key=lambda update: update.start)
+
+
+def _milestone_updates(content: str, offset: int, project: Project) -> List[StateUpdate]:
+    """Updates of the milestone list starting after ``offset`` (the list heading)."""
+    initiatives = project.initiatives()
+    listed = set()
+    updates = []
+    last_end = None
+
+    newline = content.find('\n', offset)
+    position = len(content) if newline == -1 else newline + 1
+    while position < len(content):
+        line_end = content.find('\n', position)
+        line_end = len(content) if line_end == -1 else line_end
+        line = content[position:line_end]
+        item = _MILESTONE_ITEM.match(line)
+        if item is None:
+            if line.strip() or last_end is not None:
+                break  # Blank lines may only precede the first item
+            position = line_end + 1
+            continue
+        last_end = line_end
+        init = _match_initiative(item.group('label'), initiatives)
+        if init is not None:
+            listed.add(init.name)
+            new = _milestone_value(init)
+            if new != item.group('value'):
+                updates.append(StateUpdate(f"Milestone: {item.group('label').strip()}", item.group('value'),
+                                           new, position + item.start('value'), position + item.end('value')))
+        position = line_end + 1
+
+    missing = [init for init in initiatives if init.name not in listed and not init.archived]
+    if missing:
+        at = last_end if last_end is not None else offset
+        lines = "".join(f"\n- {_initiative_title(init)}: {_milestone_value(init)}" for init in missing)
+        updates.append(StateUpdate(f"Milestones: {len(missing)} added", "", lines, at, at))
+    return updates
+
+
+def _initiative_title(initiative: Initiative) -> str:
+    """Readable title from the directory name ("0001-user-auth" -> "User Auth")."""
+    words = initiative.name.split('-', 1)[1] if '-' in initiative.name else initiative.name
+    return words.replace('-', ' ').replace('_', ' ').title()
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.findall(r'[a-z0-9]+', text.lower()))
+
+
+def _match_initiative(label: str, initiatives: List[Initiative]) -> Optional[Initiative]:
+    """Initiative a milestone label names, by title, directory name or leading ID."""
+    normalized = _normalize(label)
+    for init in initiatives:
+        if normalized in (_normalize(_initiative_title(init)), _normalize(init.name)):
+            return init
+        if normalized.split(' ', 1)[0] == init.id:
+            return init
+    return None
+
+
+def _milestone_value(initiative: Initiative) -> str:
+    """Milestone text of an initiative, in the style of the example project-state.prd."""
+    state = initiative_state(initiative)
+    if state == 'completed':
+        date = (initiative.ended_at or "").split(' ', 1)[0]
+        return f"Complete ({date})" if date else "Complete"
+    if state == 'cancelled':
+        return "Cancelled"
+    if state == 'active':
+        return f"In Progress (Target: {initiative.target_date})" if initiative.target_date else "In Progress"
+    return f"Planned ({initiative.target_date})" if initiative.target_date else "Planned"
+
+
+def splice(content: str, updates: List[StateUpdate]) -> str:
+    """Apply updates (sorted, non-overlapping) to the content they were computed from."""
+    pieces = []
+    position = 0
+    for update in updates:
+        pieces.append(content[position:update.start])
+        pieces.append(update.new)
+        position = update.end
+    pieces.append(content[position:])
+    return "".join(pieces)
+
+
+def sync_state(base_path: Path = Path("."), check: bool = False) -> List[StateUpdate]:
+    """Regenerate the computed fields of ai-project/project-state.prd.
+
+    Args:
+        base_path: Project base path
+        check: Only report the stale fields, do not write
+
+    Returns:
+        Updates that were (or, with check, would be) applied
+
+    Raises:
+        FileNotFoundError: If project-state.prd does not exist
+    """
+    path = base_path / PROJECT_STATE
+    if not path.exists():
+        raise FileNotFoundError(f"{PROJECT_STATE} not found")
+    project = Project(base_path)
+    with locked(path.parent):
+        content = read_text(path)
+        updates = compute_updates(content, project)
+        if updates and not check:
+            atomic_write(path, splice(content, updates))
+    return updates
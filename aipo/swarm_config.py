@@ -0,0 +1,188 @@
+"""Swarm file loading with a cached parsed form."""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cache import load_cached, stat_key, store_cached
+from .utils import read_text
+
+# "Initiative 0003" / "0004-backend-api"
+_INITIATIVE_WORD = re.compile(r'[Ii]nitiative\s+(\d{4})')
+_INITIATIVE_DIR = re.compile(r'\b(\d{4})-[a-z][a-z0-9-]*')
+
+# Parsed-form cache layout version; bump when SwarmConfig changes
+_CACHE_VERSION = 2
+
+
+@dataclass
+class SwarmConfig:
+    """Parsed swarm file."""
+    path: Path
+    name: str = ""
+    main: Optional[str] = None
+    instances: Dict[str, Dict[str, str]] = field(default_factory=dict)  # name -> description/prompt
+    initiative_ids: List[str] = field(default_factory=list)
+    # Where initiative_ids came from: "list" (swarm.initiatives), "name"
+    # (swarm.name) or "prompt" (deprecated coordinator prose scan)
+    initiatives_source: str = "list"
+
+    @property
+    def agents(self) -> List[str]:
+        """Worker instances (every instance except the main coordinator)."""
+        return [name for name in self.instances if name != self.main]
+
+
+def load_swarm_config(swarm_file: Path, base_path: Path = Path(".")) -> SwarmConfig:
+    """Load a swarm file, using the cached parsed form when it is current.
+
+    Args:
+        swarm_file: Path to swarm YAML file (may be compressed)
+        base_path: Project base path (cache location)
+
+    Returns:
+        SwarmConfig
+    """
+    key = [_CACHE_VERSION, str(swarm_file.resolve()), stat_key(swarm_file)]
+    cache_name = f"swarm-{swarm_file.name}.json"
+
+    cached = load_cached(base_path, cache_name, key)
+    if cached is not None:
+        return SwarmConfig(path=swarm_file, **cached)
+
+    config = parse_swarm_config(swarm_file)
+    store_cached(base_path, cache_name, key, {
+        'name': config.name,
+        'main': config.main,
+        'instances': config.instances,
+        'initiative_ids': config.initiative_ids,
+        'initiatives_source': config.initiatives_source,
+    })
+    return config
+
+
+def _load_yaml(content: str):
+    """Parse YAML with PyYAML, imported on the first cache miss only."""
+    try:
+        import yaml
+    except ImportError:  # pragma: no cover - PyYAML is optional
+        return _parse_minimal(content)
+    return yaml.load(content, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def parse_swarm_config(swarm_file: Path) -> SwarmConfig:
+    """Parse a swarm file without the cache.
+
+    Initiatives come from the explicit ``swarm.initiatives`` list, which
+    /aipo-configure-swarm writes. Older swarm files without it fall back
+    to the IDs named in ``swarm.name``, and only if the name names none,
+    to the main instance's description and prompt (skipping ``Example:``
+    lines). The prompt scan is deprecated: dependency rules such as
+    "0004 can ONLY start AFTER 0001" make it bind initiatives the swarm
+    does not own, so callers warn when initiatives_source is "prompt".
+
+    Args:
+        swarm_file: Path to swarm YAML file (may be compressed)
+
+    Returns:
+        SwarmConfig
+    """
+    content = read_text(swarm_file)
+    data = _load_yaml(content)
+    swarm = (data or {}).get('swarm') or {}
+
+    config = SwarmConfig(path=swarm_file, name=str(swarm.get('name') or ''), main=swarm.get('main'))
+
+    for instance_name, instance in (swarm.get('instances') or {}).items():
+        instance = instance if isinstance(instance, dict) else {}
+        config.instances[str(instance_name)] = {
+            'description': str(instance.get('description') or ''),
+            'prompt': str(instance.get('prompt') or ''),
+        }
+
+    explicit = swarm.get('initiatives')
+    if explicit:
+        ids = set()
+        for entry in explicit:
+            match = re.match(r'(\d{4})', str(entry))
+            if match:
+                ids.add(match.group(1))
+    else:
+        ids = _scan_initiative_ids(config.name)
+        config.initiatives_source = "name"
+        if not ids:
+            main = config.instances.get(config.main or '', {})
+            text = '\n'.join([main.get('description', ''), main.get('prompt', '')])
+            text = '\n'.join(line for line in text.split('\n') if not line.strip().startswith('Example:'))
+            ids = _scan_initiative_ids(text)
+            config.initiatives_source = "prompt"
+
+    config.initiative_ids = sorted(ids)
+    return config
+
+
+def _scan_initiative_ids(text: str) -> set:
+    """Initiative IDs named as "Initiative 0003" or "0004-backend-api" in free text."""
+    return set(_INITIATIVE_WORD.findall(text)) | set(_INITIATIVE_DIR.findall(text))
+
+
+def _parse_minimal(content: str) -> dict:
+    """Parse the subset of YAML used by swarm files when PyYAML is missing.
+
+    Handles ``swarm.name``, ``swarm.main``, ``swarm.initiatives`` (flow or
+    block list) and each instance's ``description`` and ``prompt`` (plain,
+    quoted or ``|`` block scalars).
+    """
+    swarm: dict = {'instances': {}}
+    lines = content.split('\n')
+    i = 0
+    section = None
+    instance = None
+    instance_indent = None
+
+    def scalar(value: str) -> str:
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            return value[1:-1]
+        return value
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+        i += 1
+        if not stripped or stripped.startswith('#'):
+            continue
+
+        key, _, value = stripped.partition(':')
+        key = key.strip()
+
+        if indent == 2 and key in ('name', 'main'):
+            swarm[key] = scalar(value)
+            section = None
+        elif indent == 2 and key == 'initiatives':
+            section = 'initiatives'
+            items = value.strip()
+            swarm['initiatives'] = [scalar(v) for v in items.strip('[]').split(',') if v.strip()] if items else []
+        elif indent == 2 and key == 'instances':
+            section = 'instances'
+        elif section == 'initiatives' and stripped.startswith('- '):
+            swarm['initiatives'].append(scalar(stripped[2:]))
+        elif section == 'instances' and value == '' and (instance_indent is None or indent == instance_indent):
+            instance_indent = indent
+            instance = key
+            swarm['instances'][instance] = {}
+        elif section == 'instances' and instance and key in ('description', 'prompt'):
+            if value.strip() in ('|', '|-', '>', '>-'):
+                block = []
+                while i < len(lines) and (not lines[i].strip() or len(lines[i]) - len(lines[i].lstrip()) > indent):
+                    block.append(lines[i].strip())
+                    i += 1
+                swarm['instances'][instance][key] = '\n'.join(block)
+            else:
+                swarm['instances'][instance][key] = scalar(value)
+        elif indent <= 2:
+            section = None
+
+    return {'swarm': swarm}
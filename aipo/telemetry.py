@@ -0,0 +1,232 @@
+"""Always-on command telemetry in a memory-mapped ring buffer.
+
+Every invocation appends one fixed-size record to
+``ai-project/.aipo/telemetry.ring``: command, a hash of its arguments,
+wall time, number of initiatives scanned and cache hits/lookups. The file
+has a fixed number of slots, so it never grows; the oldest records are
+overwritten.
+
+Writers take a non-blocking lock and drop their record when another
+process holds it, so recording never waits. ``AIPO_TELEMETRY=0``
+disables recording.
+"""
+
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no advisory locks on Windows
+    fcntl = None
+
+
+RING_FILE = Path("ai-project") / ".aipo" / "telemetry.ring"
+
+ENV_VAR = "AIPO_TELEMETRY"
+
+SLOTS = 4096
+
+_MAGIC = b"AIPOTLM1"
+_VERSION = 1
+
+# magic, version, slots, record size, next sequence number (padded to 64 bytes)
+_HEADER = struct.Struct("<8sIIIQ36x")
+# seq, unix time, args hash, wall ms, scanned, cache hits, cache lookups, exit code, command
+_RECORD = struct.Struct("<QdQfIIIi20s")
+
+_FILE_SIZE = _HEADER.size + SLOTS * _RECORD.size
+
+
+class _Counters:
+    """Per-process work counters reported with the run's record."""
+    __slots__ = ('scanned', 'cache_hits', 'cache_lookups')
+
+    def __init__(self):
+        self.scanned = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0
+
+
+counters = _Counters()
+
+
+@dataclass
+class RunRecord:
+    """One recorded aipo invocation."""
+    seq: int
+    timestamp: float
+    command: str
+    args_hash: str
+    wall_ms: float
+    scanned: int
+    cache_hits: int
+    cache_lookups: int
+    exit_code: int
+
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        """Share of cache lookups that hit, or None without lookups."""
+        return self.cache_hits / self.cache_lookups if self.cache_lookups else None
+
+
+def record_run(argv: Sequence[str], wall_ms: float, exit_code: int, base_path: Path = Path(".")) -> bool:
+    """Append this run to the ring buffer, if the directory is a project.
+
+    Never raises and never blocks: on lock contention or any I/O error the
+    record is dropped.
+
+    Args:
+        argv: Command-line arguments; the first one is the command
+        wall_ms: Wall time of the run in milliseconds
+        exit_code: Exit code of the run
+        base_path: Project base path
+
+    Returns:
+        True if the record was written
+    """
+    if not argv or argv[0].startswith('-') or os.environ.get(ENV_VAR, "1").strip() == "0":
+        return False
+    if not (base_path / "ai-project").is_dir():
+        return False
+
+    ring_file = base_path / RING_FILE
+    try:
+        fd = os.open(ring_file, os.O_RDWR | os.O_CREAT, 0o644)
+    except FileNotFoundError:
+        try:
+            ring_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(ring_file, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            return False
+    except OSError:
+        return False
+
+    try:
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return False  # Another aipo is writing; drop rather than wait
+        if os.fstat(fd).st_size != _FILE_SIZE:
+            os.ftruncate(fd, _FILE_SIZE)
+        with mmap.mmap(fd, _FILE_SIZE) as ring:
+            magic, version, slots, record_size, next_seq = _HEADER.unpack_from(ring, 0)
+            if (magic, version, slots, record_size) != (_MAGIC, _VERSION, SLOTS, _RECORD.size):
+                ring[:] = bytes(_FILE_SIZE)
+                next_seq = 1
+            _RECORD.pack_into(
+                ring, _HEADER.size + (next_seq - 1) % SLOTS * _RECORD.size,
+                next_seq, time.time(), _args_hash(argv[1:]), wall_ms,
+                counters.scanned, counters.cache_hits, counters.cache_lookups, exit_code,
+                argv[0].encode('utf-8')[:20]
+            )
+            _HEADER.pack_into(ring, 0, _MAGIC, _VERSION, SLOTS, _RECORD.size, next_seq + 1)
+        return True
+    except (OSError, ValueError):
+        return False
+    finally:
+        os.close(fd)
+
+
+def read_runs(base_path: Path = Path("."), since: Optional[float] = None) -> List[RunRecord]:
+    """Read the recorded runs, oldest first.
+
+    Args:
+        base_path: Project base path
+        since: Only runs at or after this Unix timestamp
+
+    Returns:
+        RunRecord list (empty if nothing was recorded)
+    """
+    ring_file = base_path / RING_FILE
+    try:
+        with open(ring_file, 'rb') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            data = f.read()
+    except OSError:
+        return []
+    if len(data) != _FILE_SIZE:
+        return []
+    magic, version, slots, record_size, _ = _HEADER.unpack_from(data, 0)
+    if (magic, version, slots, record_size) != (_MAGIC, _VERSION, SLOTS, _RECORD.size):
+        return []
+
+    runs = []
+    for seq, ts, args_hash, wall_ms, scanned, hits, lookups, exit_code, command in \
+            _RECORD.iter_unpack(data[_HEADER.size:]):
+        if seq == 0 or (since is not None and ts < since):
+            continue
+        runs.append(RunRecord(seq, ts, command.rstrip(b'\0').decode('utf-8', 'replace'),
+                              f"{args_hash:016x}", wall_ms, scanned, hits, lookups, exit_code))
+    runs.sort(key=lambda run: run.seq)
+    return runs
+
+
+def _args_hash(args: Sequence[str]) -> int:
+    """64-bit hash of the arguments (stable across runs, unlike hash())."""
+    import hashlib
+
+    digest = hashlib.blake2b("\0".join(args).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def latency_summary(runs: Sequence[RunRecord], percentiles: Sequence[int] = (50, 90, 99)) -> List[dict]:
+    """Latency percentiles and work per command.
+
+    Args:
+        runs: Recorded runs
+        percentiles: Percentiles (0-100) of wall time to report
+
+    Returns:
+        One dict per command (most runs first) with runs, p<N> and max
+        wall ms, mean initiatives scanned and cache hit rate (None without
+        cache lookups)
+    """
+    from .activity import percentile
+
+    by_command = {}
+    for run in runs:
+        by_command.setdefault(run.command, []).append(run)
+
+    rows = []
+    for command, command_runs in by_command.items():
+        walls = sorted(run.wall_ms for run in command_runs)
+        lookups = sum(run.cache_lookups for run in command_runs)
+        row = {'command': command, 'runs': len(command_runs)}
+        row.update({f"p{q}": percentile(walls, q) for q in percentiles})
+        row['max'] = walls[-1]
+        row['mean_scanned'] = sum(run.scanned for run in command_runs) / len(command_runs)
+        row['cache_hit_rate'] = sum(run.cache_hits for run in command_runs) / lookups if lookups else None
+        rows.append(row)
+    rows.sort(key=lambda row: (-row['runs'], row['command']))
+    return rows
+
+
+def latency_over_time(runs: Sequence[RunRecord], bucket_seconds: float,
+                      q: int = 90) -> List[tuple]:
+    """Latency percentile per command in fixed time buckets.
+
+    Args:
+        runs: Recorded runs
+        bucket_seconds: Bucket width in seconds
+        q: Percentile (0-100) of wall time per bucket
+
+    Returns:
+        (bucket start, {command: (runs, percentile ms)}) in time order
+    """
+    from .activity import percentile
+
+    buckets = {}
+    for run in runs:
+        start = run.timestamp - run.timestamp % bucket_seconds
+        buckets.setdefault(start, {}).setdefault(run.command, []).append(run.wall_ms)
+    return [
+        (start, {command: (len(walls), percentile(sorted(walls), q)) for command, walls in commands.items()})
+        for start, commands in sorted(buckets.items())
+    ]
@@ -0,0 +1,204 @@
+"""Offline token estimates for PRD text.
+
+No tokenizer is bundled, so counts approximate a BPE tokenizer on English
+markdown: a short word is one token and longer words split into chunks,
+digit runs split every three digits, and each punctuation mark counts
+once (runs of the same mark, such as ``---``, count as one).
+
+``TokenCounter`` applies the estimate to project files (whole file,
+``## `` sections and project-state modules) and memoizes the counts in
+ai-project/.aipo/cache by content hash.
+"""
+
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cache import load_cached, stat_key, store_cached
+from .profiling import timed
+from .utils import read_text, split_modules, split_sections
+
+
+PROJECT_STATE = Path("ai-project") / "project-state.prd"
+
+# Per-module budget of project-state.prd ("<500 tokens/module")
+MODULE_BUDGET = 500
+
+# Default context limit of a swarm: project-state.prd plus the
+# description.prd and tasks.prd of every bound initiative
+SWARM_CONTEXT_LIMIT = 50000
+
+# Word characters per token beyond the first chunk of a long word
+_WORD_CHUNK = 6
+
+# Words, digit chunks, punctuation runs and non-ASCII characters: one token each
+_PIECE = re.compile(r"[A-Za-z]+|\d{1,3}|([^\w\s])\1*|[^\x00-\x7f]")
+
+_LONG_WORD = re.compile(r"[A-Za-z]{%d,}" % (_WORD_CHUNK + 1))
+
+_CACHE_NAME = "tokens.json"
+_CACHE_VERSION = 1
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate number of tokens in a text."""
+    # subn counts matches without building a list of them
+    count = _PIECE.subn('', text)[1]
+    return count + sum((len(word) - 1) // _WORD_CHUNK for word in _LONG_WORD.findall(text))
+
+
+def trim_to_tokens(text: str, budget: int, marker: str = "…") -> str:
+    """Cut a text at a line (or word) boundary to fit a token budget.
+
+    Args:
+        text: Text to trim
+        budget: Maximum tokens of the result, including the marker
+        marker: Appended on its own line when the text was cut
+
+    Returns:
+        The text itself if it fits, else its longest fitting prefix plus
+        the marker ("" if not even the marker fits)
+    """
+    if estimate_tokens(text) <= budget:
+        return text
+    budget -= estimate_tokens(marker)
+    if budget <= 0:
+        return ""
+
+    kept, used = [], 0
+    for line in text.split('\n'):
+        cost = estimate_tokens(line) + 1  # +1 for the newline
+        if used + cost > budget:
+            if not kept:
+                # First line alone is too long: keep its leading words
+                words = []
+                for word in line.split(' '):
+                    used += estimate_tokens(word)
+                    if used > budget:
+                        break
+                    words.append(word)
+                kept.append(' '.join(words))
+            break
+        kept.append(line)
+        used += cost
+    return '\n'.join(kept).rstrip() + '\n' + marker
+
+
+@dataclass
+class FileTokens:
+    """Token estimate of one file."""
+    path: str  # Relative to the project
+    tokens: int
+    sections: List[Tuple[str, int]]  # (heading, tokens) per ``## `` section
+    modules: List[Tuple[str, int]]  # (module, tokens); empty unless the file holds modules
+
+
+class TokenCounter:
+    """Token counts of project files, memoized in one cache entry.
+
+    A file whose (mtime_ns, size) is unchanged is not read; one that was
+    touched but hashes to the same content is not re-counted.
+    """
+
+    def __init__(self, base_path: Path = Path(".")):
+        self.base_path = base_path
+        cached = load_cached(base_path, _CACHE_NAME, _CACHE_VERSION)
+        self._entries: Dict[str, Dict] = cached if isinstance(cached, dict) else {}
+        self._dirty = False
+
+    def count(self, path: Path) -> Optional[FileTokens]:
+        """Token estimate of a file.
+
+        Args:
+            path: File inside the project
+
+        Returns:
+            FileTokens or None if the file is missing or unreadable
+        """
+        label = Path(os.path.relpath(path, self.base_path)).as_posix()
+        key = stat_key(path)
+        if key is None:
+            return None
+        entry = self._entries.get(label)
+        if entry is None or entry['stat'] != key:
+            try:
+                content = read_text(path)
+            except (OSError, UnicodeDecodeError):
+                return None
+            digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+            if entry is None or entry['digest'] != digest:
+                entry = _count(label, content)
+                entry['digest'] = digest
+            self._entries[label] = dict(entry, stat=key)
+            self._dirty = True
+        return FileTokens(label, entry['tokens'],
+                          [tuple(section) for section in entry['sections']],
+                          [tuple(module) for module in entry['modules']])
+
+    def save(self, keep: Optional[Iterable[str]] = None) -> None:
+        """Write the counts back to the cache if any changed.
+
+        Args:
+            keep: Paths to retain (as in FileTokens.path); entries of other
+                files are dropped. All entries are kept if omitted.
+        """
+        if keep is not None:
+            keep = set(keep)
+            stale = [label for label in self._entries if label not in keep]
+            for label in stale:
+                del self._entries[label]
+            self._dirty = self._dirty or bool(stale)
+        if self._dirty:
+            store_cached(self.base_path, _CACHE_NAME, _CACHE_VERSION, self._entries)
+            self._dirty = False
+
+
+def _count(label: str, content: str) -> Dict:
+    """Count a file's sections; their sum is the file total (whitespace costs nothing)."""
+    sections = [(heading, estimate_tokens(text)) for heading, text in split_sections(content)]
+    tokens = sum(count for _, count in sections)
+    if label == PROJECT_STATE.as_posix():
+        modules = [(name, estimate_tokens(text)) for name, text in split_modules(content)]
+    elif label.startswith("ai-project/modules/"):
+        modules = [(Path(label).stem, tokens)]
+    else:
+        modules = []
+    return {'tokens': tokens, 'sections': sections, 'modules': modules}
+
+
+def project_files(base_path: Path = Path(".")) -> List[Path]:
+    """PRD files an agent may load: project state, module files and initiative PRDs."""
+    ai_project = base_path / "ai-project"
+    files = [base_path / PROJECT_STATE]
+    modules_dir = ai_project / "modules"
+    if modules_dir.is_dir():
+        files.extend(sorted(modules_dir.glob("*.prd")))
+    try:
+        names = sorted(entry.name for entry in os.scandir(ai_project / "initiatives")
+                       if entry.name[0].isdigit() and entry.is_dir())
+    except OSError:
+        names = []
+    for name in names:
+        files.append(ai_project / "initiatives" / name / "description.prd")
+        files.append(ai_project / "initiatives" / name / "tasks.prd")
+    return files
+
+
+@timed("token count")
+def count_project(base_path: Path = Path(".")) -> List[FileTokens]:
+    """Token estimates of every project file (see project_files), cached.
+
+    Args:
+        base_path: Project base path
+
+    Returns:
+        FileTokens of the files that exist, in project order
+    """
+    counter = TokenCounter(base_path)
+    results = [counter.count(path) for path in project_files(base_path)]
+    results = [result for result in results if result is not None]
+    counter.save(keep=[result.path for result in results])
+    return results
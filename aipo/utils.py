@@ -2,7 +2,14 @@
 
 import re
 from pathlib import Path
-from typing import List, Dict
+from typing import IO, List, Dict, Tuple
+
+from .profiling import phase, timed
+
+
+# Extensions recognised as compressed archives, tried in this order when
+# looking for an archived variant of a plain file.
+COMPRESSED_SUFFIXES = ('.gz', '.xz', '.zst')
 
 
 class Colors:
@@ -40,84 +47,269 @@ def create_progress_bar(completed: int, total: int, width: int = 20) -> str:
     return f"[{bar}]"
 
 
-def extract_tasks(tasks_file: Path) -> List[Dict]:
-    """Extract task list from tasks.prd file.
+def open_text(path: Path) -> IO[str]:
+    """Open a text file for streaming reads, decompressing by extension.
+    
+    ``.gz`` and ``.xz`` use the standard library. ``.zst`` uses the
+    ``compression.zstd`` module when available and the optional
+    ``zstandard`` package otherwise.
     
     Args:
-        tasks_file: Path to tasks.prd file
+        path: Path to a plain or compressed text file
         
     Returns:
-        List of task dictionaries with id, title, status, and group
+        Text file object (use as a context manager)
+        
+    Raises:
+        RuntimeError: If the file is zstd-compressed and no zstd codec is installed
     """
-    content = tasks_file.read_text()
-    tasks = []
+    suffix = path.suffix.lower()
+    
+    if suffix == '.gz':
+        import gzip
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if suffix == '.xz':
+        import lzma
+        return lzma.open(path, 'rt', encoding='utf-8')
+    if suffix == '.zst':
+        try:
+            from compression import zstd  # Python 3.14+
+            return zstd.open(path, 'rt', encoding='utf-8')
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(f"Reading {path.name} requires the 'zstandard' package (pip install zstandard)")
+        import io
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(reader, buffer_size=1 << 20), encoding='utf-8')
+    
+    return open(path, 'r', encoding='utf-8')
+
+
+def read_text(path: Path) -> str:
+    """Read a whole plain or compressed text file.
+    
+    Args:
+        path: Path to a plain or compressed text file
+        
+    Returns:
+        Decoded file content
+    """
+    with open_text(path) as f:
+        return f.read()
+
+
+def find_compressed_variant(path: Path) -> Path | None:
+    """Find a file or its compressed variant (e.g. ``session.log.json.gz``).
+    
+    Args:
+        path: Path to the plain file
+        
+    Returns:
+        The plain file if it exists, else the first existing compressed
+        variant, else None
+    """
+    if path.exists():
+        return path
+    for suffix in COMPRESSED_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+_TASK_LINE = re.compile(r'^- \[([x ])\] (TASK-\d+):\s*(.+)$')
+_GROUP_LINE = re.compile(r'^## Task Group (\d+):')
+_TASK_ID = re.compile(r'TASK-\d+')
+_CROSS_REF = re.compile(r'(\d{4}-[a-z0-9][a-z0-9-]*)/(TASK-\d+)')
+_INLINE_AGENT = re.compile(r'\*\*Agent\*\*:\s*([\w-]+)')
+_HOURS = re.compile(r'(\d+(?:\.\d+)?)\s*h')
+
+
+def parse_tasks(content: str) -> List[Dict]:
+    """Parse task entries from tasks.prd content.
     
-    # Find all task entries
-    task_pattern = re.compile(r'^- \[([x ])\] (TASK-\d+):\s*(.+)$', re.MULTILINE)
+    Sub-bullets below a task line are read for ``Dependencies:``
+    (``Deps:``), ``Cross-initiative:``, ``Agent:`` and ``Estimated:``.
     
-    # Track current group
+    Args:
+        content: Content of a tasks.prd file
+        
+    Returns:
+        List of task dictionaries with id, title, status, group, offset
+        (character offset of the task line), dependencies,
+        cross_dependencies (``NNNN-name/TASK-XXX`` strings), agent and
+        estimated_hours
+    """
+    tasks = []
     current_group = 0
-    group_pattern = re.compile(r'^## Task Group (\d+):', re.MULTILINE)
+    current = None
+    offset = 0
     
-    # Build a map of line numbers to groups
-    line_to_group = {}
-    lines = content.split('\n')
-    for i, line in enumerate(lines):
-        group_match = group_pattern.match(line)
+    for line in content.split('\n'):
+        line_offset = offset
+        offset += len(line) + 1
+        
+        group_match = _GROUP_LINE.match(line)
         if group_match:
             current_group = int(group_match.group(1))
-        line_to_group[i] = current_group
-    
-    # Find tasks
-    for match in task_pattern.finditer(content):
-        checkbox, task_id, title = match.groups()
-        status = 'completed' if checkbox == 'x' else 'pending'
+            current = None
+            continue
         
-        # Find which line this task is on
-        line_num = content[:match.start()].count('\n')
-        group = line_to_group.get(line_num, 0)
+        task_match = _TASK_LINE.match(line)
+        if task_match:
+            checkbox, task_id, title = task_match.groups()
+            status = 'completed' if checkbox == 'x' else 'pending'
+            
+            agent_match = _INLINE_AGENT.search(title)
+            current = {
+                'id': task_id,
+                'title': title.strip(),
+                'status': status,
+                'group': current_group,
+                'offset': line_offset,
+                'dependencies': [],
+                'cross_dependencies': [],
+                'agent': agent_match.group(1) if agent_match else None,
+                'estimated_hours': None,
+            }
+            tasks.append(current)
+            continue
         
-        # Check if it's marked as in progress (heuristic: look for common markers)
-        task_line_start = match.start()
-        context = content[task_line_start:task_line_start+200]
-        if '(in progress)' in context.lower() or '🔄' in context:
-            status = 'in_progress'
+        if current is None:
+            continue
         
-        tasks.append({
-            'id': task_id,
-            'title': title.strip(),
-            'status': status,
-            'group': group
-        })
+        stripped = line.strip()
+        if stripped.startswith('##') or stripped.startswith('- ['):
+            current = None
+            continue
+        
+        field_line = stripped.lstrip('-').strip().replace('**', '')
+        if ':' not in field_line:
+            continue
+        key, value = field_line.split(':', 1)
+        key = key.strip().lower()
+        
+        if key in ('dependencies', 'deps'):
+            current['dependencies'].extend(_TASK_ID.findall(value))
+        elif key == 'cross-initiative':
+            current['cross_dependencies'].extend(f"{d}/{t}" for d, t in _CROSS_REF.findall(value))
+        elif key == 'agent':
+            current['agent'] = value.strip() or None
+        elif key == 'estimated':
+            hours_match = _HOURS.search(value)
+            if hours_match:
+                current['estimated_hours'] = float(hours_match.group(1))
+    
+    # Check if it's marked as in progress (heuristic: look for common markers
+    # near the task line, without reading into the next task)
+    for i, task in enumerate(tasks):
+        end = tasks[i + 1]['offset'] if i + 1 < len(tasks) else len(content)
+        context = content[task['offset']:min(task['offset'] + 200, end)]
+        if '(in progress)' in context.lower() or '🔄' in context:
+            task['status'] = 'in_progress'
     
     return tasks
 
 
-def extract_initiative_ids(swarm_file: Path) -> List[str]:
-    """Extract initiative IDs from swarm YAML file.
+def task_blocks(content: str, tasks: List[Dict]) -> List[str]:
+    """Text of each parsed task: its task line and sub-bullets.
     
-    Looks for patterns like:
-    - "Initiative 0003"
-    - "0004-backend-api"
+    Args:
+        content: Content the tasks were parsed from
+        tasks: Result of parse_tasks(content)
+        
+    Returns:
+        One block per task, in the same order (ends before the next task
+        or heading)
+    """
+    blocks = []
+    for i, task in enumerate(tasks):
+        end = tasks[i + 1]['offset'] if i + 1 < len(tasks) else len(content)
+        block = content[task['offset']:end]
+        heading = block.find('\n#')
+        if heading != -1:
+            block = block[:heading]
+        blocks.append(block.rstrip())
+    return blocks
+
+
+_SECTION_HEADING = re.compile(r'^## +(.+?)\s*$', re.MULTILINE)
+
+
+def split_sections(content: str) -> List[Tuple[str, str]]:
+    """Split markdown into ``## `` sections.
     
     Args:
-        swarm_file: Path to swarm YAML file
+        content: Markdown content
         
     Returns:
-        Sorted list of initiative IDs
+        (heading, text including the heading line) pairs; text before the
+        first section is titled by the ``# `` heading (or "Overview")
     """
-    content = swarm_file.read_text()
+    matches = list(_SECTION_HEADING.finditer(content))
+    preamble = content[:matches[0].start()] if matches else content
+    sections = []
+    if preamble.strip():
+        title = next((line.lstrip('#').strip() for line in preamble.splitlines() if line.startswith('# ')), "")
+        sections.append((title or "Overview", preamble.strip()))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        sections.append((match.group(1), content[match.start():end].strip()))
+    return sections
 
-    # Find patterns like "Initiative 0003" or "initiative 0003"
-    pattern1 = re.findall(r'[Ii]nitiative\s+(\d{4})', content)
 
-    # Find patterns like "0004-backend-api" in paths or descriptions
-    pattern2 = re.findall(r'\b(\d{4})-[a-z][a-z0-9-]*', content)
+_MODULE_HEADING = re.compile(r'^(#{2,3}) +Module:\s*(.+?)\s*$', re.MULTILINE)
 
-    # Combine and deduplicate
-    all_ids = set(pattern1 + pattern2)
 
-    return sorted(list(all_ids))
+def module_spans(content: str) -> List[Tuple[str, int, int]]:
+    """Offsets of the module sections of project-state.prd.
+    
+    Modules start at ``## Module: Name`` or ``### Module: Name`` and end at
+    the next heading of the same or a higher level.
+    
+    Args:
+        content: project-state.prd content
+        
+    Returns:
+        (module name, start, end) triples; start is the heading's offset
+    """
+    spans = []
+    for match in _MODULE_HEADING.finditer(content):
+        end_heading = re.compile(r'^#{1,%d} ' % len(match.group(1)), re.MULTILINE).search(content, match.end())
+        spans.append((match.group(2), match.start(), end_heading.start() if end_heading else len(content)))
+    return spans
+
+
+def split_modules(content: str) -> List[Tuple[str, str]]:
+    """Module sections of project-state.prd (see module_spans).
+    
+    Args:
+        content: project-state.prd content
+        
+    Returns:
+        (module name, text including the heading) pairs
+    """
+    return [(name, content[start:end].strip().rstrip('-').strip())
+            for name, start, end in module_spans(content)]
+
+
+@timed("extract tasks")
+def extract_tasks(tasks_file: Path) -> List[Dict]:
+    """Extract task list from tasks.prd file.
+    
+    Args:
+        tasks_file: Path to tasks.prd file
+        
+    Returns:
+        List of task dictionaries (see parse_tasks)
+    """
+    phase("read")
+    content = read_text(tasks_file)
+    phase("parse")
+    return parse_tasks(content)
 
 
 def find_initiative_directory(initiative_id: str, base_path: Path) -> Path | None:
@@ -143,6 +335,25 @@ def find_initiative_directory(initiative_id: str, base_path: Path) -> Path | Non
     return None
 
 
+def resolve_initiative_directory(initiative: str, base_path: Path = Path(".")) -> Path | None:
+    """Resolve an initiative argument to its directory.
+
+    Args:
+        initiative: Directory path, directory name ("0003-backend") or ID ("0003")
+        base_path: Base path to search from
+
+    Returns:
+        Initiative directory or None if not found
+    """
+    path = Path(initiative)
+    if path.is_dir():
+        return path
+    by_name = base_path / "ai-project" / "initiatives" / initiative
+    if by_name.is_dir():
+        return by_name
+    return find_initiative_directory(initiative.split('-')[0], base_path)
+
+
 def format_time_estimate(hours: float) -> str:
     """Format time estimate in human-readable format.
     
@@ -163,3 +374,33 @@ def format_time_estimate(hours: float) -> str:
         weeks = hours / 40  # Assuming 40-hour workweek
         return f"{weeks:.1f}w"
 
+
+def git_changed_files(base_path: Path, rev: str) -> List[str]:
+    """List files changed between a git revision and the working tree.
+    
+    Args:
+        base_path: Directory inside the git repository
+        rev: Revision to compare against (e.g. "origin/main", "HEAD~1")
+        
+    Returns:
+        Changed paths, relative to base_path
+        
+    Raises:
+        RuntimeError: If git is missing or the revision cannot be diffed
+    """
+    import subprocess
+    
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", rev, "--"],
+            cwd=base_path,
+            capture_output=True,
+            text=True
+        )
+    except FileNotFoundError:
+        raise RuntimeError("'git' command not found")
+    
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git diff failed for {rev}")
+    
+    return [line for line in result.stdout.splitlines() if line]
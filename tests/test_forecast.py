@@ -0,0 +1,68 @@
+"""Tests for the pure-Python Monte Carlo engine in aipo.forecast."""
+
+import math
+from statistics import mean, median
+
+import pytest
+
+from aipo.forecast import (
+    DEFAULT_RATIO_MU,
+    DEFAULT_RATIO_SIGMA,
+    RATIO_TABLE_SIZE,
+    _ratio_table,
+    _simulate_python,
+)
+
+
+def _correlation(xs, ys):
+    mx, my = mean(xs), mean(ys)
+    cov = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    return cov / math.sqrt(sum((x - mx) ** 2 for x in xs) * sum((y - my) ** 2 for y in ys))
+
+
+def test_ratio_table_matches_default_lognormal():
+    table = _ratio_table(None)
+    assert len(table) == RATIO_TABLE_SIZE
+    assert table == sorted(table)
+    assert median(table) == pytest.approx(math.exp(DEFAULT_RATIO_MU), rel=0.01)
+    # The table cuts off the outer tails, so its mean is slightly low
+    expected = math.exp(DEFAULT_RATIO_MU + DEFAULT_RATIO_SIGMA ** 2 / 2)
+    assert expected * 0.98 < mean(table) <= expected
+
+
+def test_ratio_table_spreads_historical_ratios_evenly():
+    ratios = [0.5, 1.0, 1.5, 3.0, 0.8]
+    table = _ratio_table(ratios)
+    for ratio in ratios:
+        share = table.count(ratio) / RATIO_TABLE_SIZE
+        assert abs(share - 1 / len(ratios)) <= 1 / RATIO_TABLE_SIZE
+
+
+def test_task_durations_are_independent():
+    # Two independent one-hour tasks in separate initiatives
+    by_initiative, _ = _simulate_python(
+        [1.0, 1.0], [[], []], ["a", "b"], 5000, None, 7, None
+    )
+    a, b = by_initiative["a"][0], by_initiative["b"][0]
+    assert a != b
+    assert abs(_correlation(a, b)) < 0.05
+
+
+def test_chain_spreads_less_than_fully_correlated_tasks():
+    # Ten tasks in a chain: independent draws partly cancel out, so the
+    # spread of the total is about sqrt(10) times that of one task, not 10
+    tasks = 10
+    deps = [[]] + [[i - 1] for i in range(1, tasks)]
+    _, overall = _simulate_python([1.0] * tasks, deps, ["a"] * tasks, 5000, None, 3, None)
+    single = _ratio_table(None)
+    single_spread = single[int(0.95 * RATIO_TABLE_SIZE)] - single[RATIO_TABLE_SIZE // 2]
+    assert overall[95] - overall[50] < single_spread * tasks / 2
+
+
+def test_virtual_nodes_add_no_time():
+    # Task 1 is a zero-hour "initiative done" node between tasks 0 and 2
+    with_virtual, _ = _simulate_python(
+        [1.0, 0.0, 1.0], [[], [0], [1]], ["a", "a", "b"], 1000, [1.0], 1, None
+    )
+    assert with_virtual["b"][1][50] == 2.0
+
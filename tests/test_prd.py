@@ -0,0 +1,241 @@
+"""Tests for the in-place tasks.prd edits in aipo.prd."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from aipo.archive import archive_initiatives
+from aipo.core import validate_initiative
+from aipo.prd import (
+    JOURNAL,
+    apply_changes,
+    edit_tasks_content,
+    recover_journal,
+    set_task_state,
+    update_task_state,
+)
+from aipo.utils import parse_tasks
+
+
+NOW = datetime(2025, 3, 1, 9, 30)
+
+TASKS_PRD = """# Tasks: 0001-user-auth
+
+**Initiative ID**: 0001
+**Dependencies**: None
+
+---
+
+[START: ]
+
+## Task Group 1: Backend
+
+- [ ] TASK-001: Create user model
+  - Agent: backend_1
+  - Estimated: 2h
+
+- [ ] TASK-002: Login endpoint
+  - Dependencies: TASK-001
+  - Estimated: 1h
+
+[END: ]
+
+## Summary
+
+**Status**: Not started
+**Progress**: 0/2 tasks (0%)
+"""
+
+
+def _statuses(content):
+    return {task['id']: task['status'] for task in parse_tasks(content)}
+
+
+def test_start_sets_marker_and_start_timestamp():
+    content = set_task_state(TASKS_PRD, "TASK-001", "in_progress", now=NOW)
+    assert "- [ ] TASK-001: Create user model (in progress)" in content
+    assert "[START: 2025-03-01 09:30]" in content
+    assert "[END: ]" in content
+    assert "**Status**: In progress" in content
+    assert _statuses(content) == {"TASK-001": "in_progress", "TASK-002": "pending"}
+
+
+def test_complete_removes_in_progress_marker():
+    started = set_task_state(TASKS_PRD, "TASK-001", "in_progress", now=NOW)
+    content = set_task_state(started, "TASK-001", "completed", now=NOW)
+    assert "- [x] TASK-001: Create user model\n" in content
+    assert "(in progress)" not in content
+    assert "**Progress**: 1/2 tasks (50%)" in content
+    assert "[END: ]" in content
+
+
+def test_completing_last_task_finishes_initiative():
+    content = set_task_state(TASKS_PRD, "TASK-001", "completed", now=NOW)
+    content = set_task_state(content, "TASK-002", "completed", now=datetime(2025, 3, 2, 17, 0))
+    assert "[START: 2025-03-01 09:30]" in content
+    assert "[END: 2025-03-02 17:00]" in content
+    assert "**Status**: Completed" in content
+    assert "**Progress**: 2/2 tasks (100%)" in content
+
+
+def test_reopening_task_clears_end():
+    content = set_task_state(TASKS_PRD, "TASK-001", "completed", now=NOW)
+    content = set_task_state(content, "TASK-002", "completed", now=NOW)
+    content = set_task_state(content, "TASK-002", "pending", now=NOW)
+    assert "[END: ]" in content
+    assert "[START: 2025-03-01 09:30]" in content
+    assert "**Status**: In progress" in content
+    assert "**Progress**: 1/2 tasks (50%)" in content
+    assert _statuses(content) == {"TASK-001": "completed", "TASK-002": "pending"}
+
+
+def test_only_lifecycle_lines_change():
+    content = set_task_state(TASKS_PRD, "TASK-002", "completed", now=NOW)
+    changed = [
+        (old, new) for old, new in zip(TASKS_PRD.split("\n"), content.split("\n")) if old != new
+    ]
+    assert changed == [
+        ("[START: ]", "[START: 2025-03-01 09:30]"),
+        ("- [ ] TASK-002: Login endpoint", "- [x] TASK-002: Login endpoint"),
+        ("**Status**: Not started", "**Status**: In progress"),
+        ("**Progress**: 0/2 tasks (0%)", "**Progress**: 1/2 tasks (50%)"),
+    ]
+
+
+def test_unknown_task_or_state_is_rejected():
+    with pytest.raises(ValueError, match="Task not found"):
+        set_task_state(TASKS_PRD, "TASK-009", "completed")
+    with pytest.raises(ValueError, match="Unknown task state"):
+        set_task_state(TASKS_PRD, "TASK-001", "done")
+
+
+def test_update_task_state_writes_file(tmp_path):
+    tasks_file = tmp_path / "tasks.prd"
+    tasks_file.write_text(TASKS_PRD, encoding="utf-8")
+    assert update_task_state(tasks_file, "TASK-001", "completed", now=NOW)
+    assert "- [x] TASK-001" in tasks_file.read_text(encoding="utf-8")
+    assert not update_task_state(tasks_file, "TASK-001", "completed", now=NOW)
+    assert [path.name for path in tmp_path.iterdir()] == ["tasks.prd"]
+
+
+def _project(tmp_path, *names):
+    files = []
+    for name in names:
+        directory = tmp_path / "ai-project" / "initiatives" / name
+        directory.mkdir(parents=True)
+        tasks_file = directory / "tasks.prd"
+        tasks_file.write_text(TASKS_PRD.replace("0001-user-auth", name), encoding="utf-8")
+        files.append(tasks_file)
+    return files
+
+
+def test_agent_is_replaced_or_inserted():
+    content = edit_tasks_content(TASKS_PRD, {"TASK-001": {"agent": "backend_2"},
+                                             "TASK-002": {"agent": "api_1"}})
+    assert "- [ ] TASK-001: Create user model\n  - Agent: backend_2\n  - Estimated: 2h" in content
+    assert "- [ ] TASK-002: Login endpoint\n  - Agent: api_1\n  - Dependencies: TASK-001" in content
+    assert [task['agent'] for task in parse_tasks(content)] == ["backend_2", "api_1"]
+
+
+def test_agent_is_inserted_below_bare_task_line():
+    content = TASKS_PRD.replace("  - Dependencies: TASK-001\n  - Estimated: 1h\n", "")
+    content = edit_tasks_content(content, {"TASK-002": {"agent": "api_1"}})
+    assert "- [ ] TASK-002: Login endpoint\n  - Agent: api_1\n" in content
+
+
+def test_inline_agent_is_replaced_in_place():
+    content = TASKS_PRD.replace("Login endpoint", "Login endpoint **Agent**: api_1")
+    content = edit_tasks_content(content, {"TASK-002": {"agent": "api_2"}})
+    assert "- [ ] TASK-002: Login endpoint **Agent**: api_2\n  - Dependencies" in content
+
+
+def test_swarm_field_is_added_replaced_and_removed():
+    added = edit_tasks_content(TASKS_PRD, {}, swarm="swarm-a.yaml")
+    assert "**Dependencies**: None\n**Swarm**: swarm-a.yaml\n\n---" in added
+    replaced = edit_tasks_content(added, {}, swarm="swarm-b.yaml")
+    assert replaced == added.replace("swarm-a.yaml", "swarm-b.yaml")
+    assert edit_tasks_content(replaced, {}, swarm=None) == TASKS_PRD
+
+
+def test_batch_edits_several_files(tmp_path):
+    auth, billing = _project(tmp_path, "0001-user-auth", "0002-billing")
+    counts = apply_changes([
+        {"initiative": "0001", "task": "TASK-001", "state": "completed"},
+        {"initiative": "0001", "task": "task-002", "agent": "api_1"},
+        {"initiative": "0002-billing", "swarm": "swarm-a.yaml"},
+    ], tmp_path, now=NOW)
+    assert counts == {auth: 2, billing: 1}
+    assert _statuses(auth.read_text(encoding="utf-8"))["TASK-001"] == "completed"
+    assert "**Swarm**: swarm-a.yaml" in billing.read_text(encoding="utf-8")
+    assert not (tmp_path / JOURNAL).exists()
+
+
+@pytest.mark.parametrize("bad_change, message", [
+    ({"initiative": "0002", "task": "TASK-009", "state": "completed"}, "Task not found"),
+    ({"initiative": "0002", "task": "TASK-001", "state": "done"}, "unknown state"),
+    ({"initiative": "0009", "task": "TASK-001", "state": "completed"}, "initiative not found"),
+    ({"initiative": "0002", "owner": "me"}, "unknown field"),
+])
+def test_invalid_change_leaves_every_file_untouched(tmp_path, bad_change, message):
+    files = _project(tmp_path, "0001-user-auth", "0002-billing")
+    before = [(path.read_text(encoding="utf-8"), path.stat().st_mtime_ns) for path in files]
+    with pytest.raises(ValueError, match=message):
+        apply_changes([
+            {"initiative": "0001", "task": "TASK-001", "state": "completed"},
+            bad_change,
+        ], tmp_path, now=NOW)
+    assert [(path.read_text(encoding="utf-8"), path.stat().st_mtime_ns) for path in files] == before
+    assert not (tmp_path / JOURNAL).exists()
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    (auth,) = _project(tmp_path, "0001-user-auth")
+    counts = apply_changes([{"initiative": "0001", "task": "TASK-001", "state": "completed"}],
+                           tmp_path, dry_run=True)
+    assert counts == {auth: 1}
+    assert auth.read_text(encoding="utf-8") == TASKS_PRD
+
+
+def test_leftover_journal_is_replayed(tmp_path):
+    _, billing = _project(tmp_path, "0001-user-auth", "0002-billing")
+    journal = tmp_path / JOURNAL
+    journal.parent.mkdir(parents=True)
+    # A batch that died after committing its journal but before writing billing
+    billing_done = set_task_state(TASKS_PRD, "TASK-001", "completed", now=NOW)
+    journal.write_text(json.dumps({"files": {str(billing.resolve()): billing_done}}), encoding="utf-8")
+
+    assert recover_journal(tmp_path) == 1
+    assert billing.read_text(encoding="utf-8") == billing_done
+    assert not journal.exists()
+    assert recover_journal(tmp_path) == 0
+
+
+def test_mutation_replays_journal_first(tmp_path):
+    auth, billing = _project(tmp_path, "0001-user-auth", "0002-billing")
+    journal = tmp_path / JOURNAL
+    journal.parent.mkdir(parents=True)
+    billing_done = set_task_state(TASKS_PRD, "TASK-001", "completed", now=NOW)
+    journal.write_text(json.dumps({"files": {str(billing.resolve()): billing_done}}), encoding="utf-8")
+
+    apply_changes([{"initiative": "0001", "task": "TASK-002", "state": "in_progress"}], tmp_path, now=NOW)
+    assert billing.read_text(encoding="utf-8") == billing_done
+    assert "(in progress)" in auth.read_text(encoding="utf-8")
+    assert not journal.exists()
+
+
+def test_corrupt_journal_is_discarded(tmp_path):
+    (auth,) = _project(tmp_path, "0001-user-auth")
+    journal = tmp_path / JOURNAL
+    journal.parent.mkdir(parents=True)
+    journal.write_text('{"files": {', encoding="utf-8")
+    assert recover_journal(tmp_path) == 0
+    assert not journal.exists()
+    assert auth.read_text(encoding="utf-8") == TASKS_PRD
+
+
+def test_archived_initiative_points_at_restore(tmp_path):
+    (auth,) = _project(tmp_path, "0001-user-auth")
+    archive_initiatives([validate_initiative(auth.parent)], tmp_path)
+    with pytest.raises(ValueError, match=r"Initiative is archived: 0001-user-auth \(aipo archive-initiatives --restore 0001\)"):
+        apply_changes([{"initiative": "0001", "task": "TASK-001", "state": "completed"}], tmp_path)
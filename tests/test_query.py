@@ -0,0 +1,163 @@
+"""Tests for the ``aipo query`` filter language in aipo.query."""
+
+import pytest
+
+from aipo.project import Project
+from aipo.query import Term, parse_query, run_query
+
+
+AUTH = """# Tasks: 0001-auth
+
+**Initiative ID**: 0001
+**Dependencies**: None
+**Swarm**: swarm-a.yaml
+
+---
+
+[START: 2025-01-06 09:00]
+
+## Task Group 1: Models
+
+- [x] TASK-001: User model
+  - Agent: backend_1
+
+- [ ] TASK-002: Session model
+  - Dependencies: TASK-001
+  - Agent: backend_2
+
+## Task Group 2: Endpoints
+
+- [ ] TASK-003: Login endpoint
+  - Dependencies: TASK-002
+
+- [ ] TASK-004: Login form (in progress)
+  - Agent: frontend_1
+
+[END: ]
+
+## Summary
+
+**Status**: In progress
+"""
+
+BILLING = """# Tasks: 0002-billing
+
+**Initiative ID**: 0002
+**Dependencies**: 0001
+
+---
+
+[START: ]
+
+## Task Group 1: Plans
+
+- [ ] TASK-001: Plan model
+  - Agent: backend_1
+
+## Task Group 3: Invoices
+
+- [ ] TASK-002: Invoice export
+  - Agent: backend_2
+
+[END: ]
+
+## Summary
+
+**Status**: Not started
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    for name, content in (("0001-auth", AUTH), ("0002-billing", BILLING)):
+        directory = tmp_path / "ai-project" / "initiatives" / name
+        directory.mkdir(parents=True)
+        (directory / "description.prd").write_text(f"# {name}\n", encoding="utf-8")
+        (directory / "tasks.prd").write_text(content, encoding="utf-8")
+    return Project(tmp_path, cache=False)
+
+
+def _keys(project, query):
+    return [task.key for task in run_query(project, parse_query(query))]
+
+
+def test_parse_terms():
+    assert parse_query("status=pending init=0001 group<=2 !ready") == [
+        Term('status', '=', ('pending',)),
+        Term('initiative', '=', ('0001',)),
+        Term('group', '<=', ('2',)),
+        Term('ready', '!=', ()),
+    ]
+    assert parse_query("  ") == []
+    assert parse_query("status=In-Progress state=Not-Started") == [
+        Term('status', '=', ('in_progress',)),
+        Term('state', '=', ('not_started',)),
+    ]
+
+
+def test_empty_query_matches_every_task(project):
+    assert len(_keys(project, "")) == 6
+
+
+def test_equal_and_not_equal_with_lists(project):
+    assert _keys(project, "agent=backend_1") == ["0001-auth/TASK-001", "0002-billing/TASK-001"]
+    assert _keys(project, "agent=backend_1,frontend_1 status=pending") == ["0002-billing/TASK-001"]
+    assert _keys(project, "status!=pending") == ["0001-auth/TASK-001", "0001-auth/TASK-004"]
+    assert _keys(project, "agent!=backend_1,backend_2") == ["0001-auth/TASK-003", "0001-auth/TASK-004"]
+    assert _keys(project, "initiative=0002,0001-auth group=1") == [
+        "0001-auth/TASK-001", "0001-auth/TASK-002", "0002-billing/TASK-001",
+    ]
+
+
+def test_agent_none_matches_unassigned(project):
+    assert _keys(project, "agent=none") == ["0001-auth/TASK-003"]
+    assert len(_keys(project, "agent!=none")) == 5
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("group<2", ["0001-auth/TASK-001", "0001-auth/TASK-002", "0002-billing/TASK-001"]),
+    ("group<=2 initiative=0001", ["0001-auth/TASK-001", "0001-auth/TASK-002",
+                                  "0001-auth/TASK-003", "0001-auth/TASK-004"]),
+    ("group>2", ["0002-billing/TASK-002"]),
+    ("group>=2 agent=none", ["0001-auth/TASK-003"]),
+    ("group!=1", ["0001-auth/TASK-003", "0001-auth/TASK-004", "0002-billing/TASK-002"]),
+    ("group=4", []),
+])
+def test_group_ranges(project, query, expected):
+    assert _keys(project, query) == expected
+
+
+def test_ready(project):
+    # Billing waits for its initiative dependency, TASK-003 for TASK-002
+    assert _keys(project, "ready") == ["0001-auth/TASK-002"]
+    assert _keys(project, "!ready status=pending") == [
+        "0001-auth/TASK-003", "0002-billing/TASK-001", "0002-billing/TASK-002",
+    ]
+
+
+def test_initiative_state_and_swarm(project):
+    assert _keys(project, "state=not_started") == ["0002-billing/TASK-001", "0002-billing/TASK-002"]
+    assert _keys(project, "state!=not_started,completed") == _keys(project, "initiative=0001")
+    assert _keys(project, "swarm=swarm-a.yaml status=pending") == ["0001-auth/TASK-002", "0001-auth/TASK-003"]
+    assert _keys(project, "swarm!=swarm-a.yaml") == ["0002-billing/TASK-001", "0002-billing/TASK-002"]
+
+
+def test_unknown_values_match_nothing(project):
+    assert _keys(project, "initiative=0099") == []
+    assert _keys(project, "agent=nobody") == []
+
+
+@pytest.mark.parametrize("query, message", [
+    ("pending", "Cannot parse query term"),
+    ("status", "Cannot parse query term"),
+    ("owner=me", "Unknown query field: owner"),
+    ("ready=yes", "Unknown query field: ready"),
+    ("group<=two", "group needs a number"),
+    ("group=1,2", "group needs a number"),
+    ("status<pending", "status only supports = and !="),
+    ("agent>=backend_1", "agent only supports = and !="),
+    ("state=archived", "Unknown initiative state: archived"),
+])
+def test_invalid_queries(query, message):
+    with pytest.raises(ValueError, match=message):
+        parse_query(query)
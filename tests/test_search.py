@@ -0,0 +1,50 @@
+"""Tests for the full-text index in aipo.search."""
+
+import pytest
+
+from aipo.archive import archive_candidates, archive_initiatives, restore_initiative
+from aipo.bench import generate_project
+from aipo.core import get_all_initiatives
+from aipo.search import SearchIndex, search
+
+
+@pytest.fixture
+def project(tmp_path):
+    generate_project(tmp_path, 4, 20)
+    return tmp_path
+
+
+def _hits(results):
+    return [(result.initiative, result.ref, result.archived) for result in results]
+
+
+def test_ranks_matching_task_first(project):
+    results = search("auth-1 step 3", project, limit=3)
+    assert _hits(results)[0] == ("0001-auth-1", "TASK-003", False)
+    assert results[0].status == "completed"
+
+
+def test_update_reindexes_only_changed_files(project):
+    index = SearchIndex(project)
+    try:
+        assert index.update() > 0
+        assert index.update() == 0
+        tasks_file = project / "ai-project" / "initiatives" / "0004-api-1" / "tasks.prd"
+        tasks_file.write_text(tasks_file.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        assert index.update() == 1
+    finally:
+        index.close()
+
+
+def test_archived_initiatives_stay_searchable(project):
+    search("auth-1", project)  # Index while 0001 is still hot
+    archivable, _ = archive_candidates(get_all_initiatives(project))
+    assert [init.name for init in archivable] == ["0001-auth-1"]
+    archive_initiatives(archivable, project)
+
+    results = search("auth-1 step 3", project, limit=3)
+    assert _hits(results)[0] == ("0001-auth-1", "TASK-003", True)
+    assert results[0].status == "completed"
+
+    restore_initiative("0001", project)
+    assert _hits(search("auth-1 step 3", project, limit=1)) == [("0001-auth-1", "TASK-003", False)]
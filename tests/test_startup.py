@@ -0,0 +1,16 @@
+"""Import-time budget of the hot CLI path (aipo.cli + aipo.commands.next)."""
+
+import pytest
+
+from aipo import bench
+
+
+def test_cli_import_is_within_budget():
+    # Best of three fresh interpreters, so one slow start does not fail the run
+    import_ms = min(bench.import_time_ms() for _ in range(3))
+    assert 0 < import_ms < bench.IMPORT_BUDGET_MS
+
+
+def test_failed_import_raises():
+    with pytest.raises(RuntimeError, match="aipo.no_such_module"):
+        bench.import_time_ms(('aipo.no_such_module',))
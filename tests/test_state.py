@@ -0,0 +1,171 @@
+"""Tests for the regeneration of project-state.prd in aipo.state."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from aipo.project import Project
+from aipo.state import compute_updates, splice, sync_state
+from aipo.tokens import PROJECT_STATE
+
+
+TASKS_PRD = """# Tasks: {name}
+
+**Initiative ID**: {id}
+**Dependencies**: None
+{target}
+---
+
+[START: {start}]
+
+## Task Group 1: Work
+
+- [{box}] TASK-001: First step
+  - Estimated: 2h
+
+[END: {end}]
+
+## Summary
+
+**Status**: {status}
+**Progress**: {done}/1 tasks
+"""
+
+INITIATIVES = {
+    "0001-auth": dict(box="x", start="2025-01-06 09:00", end="2025-02-01 10:00", status="Completed",
+                      done=1, target=""),
+    "0002-billing": dict(box=" ", start="2025-02-03 09:00", end="", status="In progress",
+                         done=0, target="**Target Date**: 2025-03-01\n"),
+    "0003-search": dict(box=" ", start="", end="", status="Not started", done=0, target=""),
+}
+
+PROJECT_STATE_PRD = """# Project State: Demo
+
+Initiatives: 0 active, 0 completed
+
+## Current Status
+
+**Active Initiatives**: 7  
+**Completed Initiatives**: [N]
+**Total Initiatives**: 1
+**Total Modules**: 0
+
+**Key Milestones**:
+- Auth: Planned
+- Billing: Planned
+
+## Module: Core
+
+**Token Count**: ~1 tokens
+The core module owns users, sessions and permissions.
+
+## Module: Api
+
+Routes and handlers.
+
+## Example
+
+```
+**Active Initiatives**: 99
+Modules: 42
+```
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    for name, fields in INITIATIVES.items():
+        directory = tmp_path / "ai-project" / "initiatives" / name
+        directory.mkdir(parents=True)
+        (directory / "description.prd").write_text(f"# {name}\n", encoding="utf-8")
+        (directory / "tasks.prd").write_text(
+            TASKS_PRD.format(name=name, id=name[:4], **fields), encoding="utf-8")
+    (tmp_path / PROJECT_STATE).write_text(PROJECT_STATE_PRD, encoding="utf-8")
+    return tmp_path
+
+
+def test_counts_rollup_and_module_fields(project):
+    sync_state(project)
+    content = (project / PROJECT_STATE).read_text(encoding="utf-8")
+    assert "Initiatives: 1 active, 1 completed\n" in content
+    # Trailing spaces after a value are kept
+    assert "**Active Initiatives**: 1  \n" in content
+    assert "**Completed Initiatives**: 1\n" in content
+    assert "**Total Initiatives**: 3\n" in content
+    assert "**Total Modules**: 2\n" in content
+
+
+def test_token_count_inside_module(project):
+    sync_state(project)
+    content = (project / PROJECT_STATE).read_text(encoding="utf-8")
+    match = re.search(r"\*\*Token Count\*\*: ~(\d+) tokens\n", content)
+    assert match and int(match.group(1)) > 1
+
+    # More text in the module raises the count
+    longer = content.replace("permissions.", "permissions, audit trails and rate limits.")
+    updates = compute_updates(longer, Project(project))
+    assert [update.field for update in updates] == ["Core token count"]
+    assert int(updates[0].new.strip("~").split()[0]) > int(match.group(1))
+
+
+def test_fenced_code_is_left_alone(project):
+    sync_state(project)
+    content = (project / PROJECT_STATE).read_text(encoding="utf-8")
+    assert "```\n**Active Initiatives**: 99\nModules: 42\n```\n" in content
+
+
+def test_milestones_are_updated_and_appended(project):
+    sync_state(project)
+    content = (project / PROJECT_STATE).read_text(encoding="utf-8")
+    assert ("**Key Milestones**:\n"
+            "- Auth: Complete (2025-02-01)\n"
+            "- Billing: In Progress (Target: 2025-03-01)\n"
+            "- Search: Planned\n"
+            "\n## Module: Core") in content
+
+
+def test_only_generated_values_change(project):
+    updates = sync_state(project)
+    content = (project / PROJECT_STATE).read_text(encoding="utf-8")
+    assert splice(PROJECT_STATE_PRD, updates) == content
+    tokens = re.search(r"~\d+ tokens", content).group()
+    expected = (PROJECT_STATE_PRD
+                .replace("0 active, 0 completed", "1 active, 1 completed")
+                .replace("**Active Initiatives**: 7  ", "**Active Initiatives**: 1  ")
+                .replace("**Completed Initiatives**: [N]", "**Completed Initiatives**: 1")
+                .replace("**Total Initiatives**: 1", "**Total Initiatives**: 3")
+                .replace("**Total Modules**: 0", "**Total Modules**: 2")
+                .replace("- Auth: Planned\n- Billing: Planned\n",
+                         "- Auth: Complete (2025-02-01)\n- Billing: In Progress (Target: 2025-03-01)\n"
+                         "- Search: Planned\n")
+                .replace("~1 tokens", tokens))
+    assert content == expected
+
+
+def test_second_run_changes_nothing(project):
+    assert sync_state(project)
+    content = (project / PROJECT_STATE).read_bytes()
+    assert sync_state(project) == []
+    assert sync_state(project, check=True) == []
+    assert (project / PROJECT_STATE).read_bytes() == content
+
+
+def test_check_does_not_write(project):
+    updates = sync_state(project, check=True)
+    assert updates
+    assert (project / PROJECT_STATE).read_text(encoding="utf-8") == PROJECT_STATE_PRD
+
+
+def test_missing_project_state(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        sync_state(tmp_path)
+
+
+def test_example_project_state_is_stable(project):
+    example = Path(__file__).parent.parent / "examples" / "project-state-example.prd"
+    (project / PROJECT_STATE).write_text(example.read_text(encoding="utf-8"), encoding="utf-8")
+    sync_state(project)
+    content = (project / PROJECT_STATE).read_bytes()
+    assert sync_state(project) == []
+    assert (project / PROJECT_STATE).read_bytes() == content